@@ -1,5 +1,19 @@
 from flask import Blueprint, jsonify, request, current_app
 from backend.db_connection import db
+from backend.cache import all_cache_stats
+from backend.collab_graph import rebuild_collab_graph
+from backend.creator_routes import update_projects
+from backend.credit_stats import rebuild_credit_stats
+from backend.jobs import JobAlreadyRunning, check_params, runner
+from backend.jobs.like_dedup import dedup_likes
+from backend.jobs.message_purge import purge_deleted_messages
+from backend.jobs.post_compaction import compact_deleted_posts
+from backend.media.renditions import render_pending_media
+from backend.media.uploads import purge_stale_uploads
+from backend.ml_models.collab_recommender import refresh_recommendations
+from backend.ml_models.credit_momentum import recompute_momentum
+from backend.tag_usage import recount_tag_usage
+from backend.unread_counts import repair_unread_counts
 
 admin_bp = Blueprint("admin", __name__)
 
@@ -698,4 +712,83 @@ def get_system_metrics():
                 "metrics": {},
                 "message": "Unable to compute metrics",
             }
-        ), 500
\ No newline at end of file
+        ), 500
+
+
+# /jobs (background maintenance)
+# Start a job with POST /jobs/{jobName} (JSON body = optional job params),
+# then poll GET /jobs/{jobName} for progress.
+
+MAINTENANCE_JOBS = {
+    "compact-posts": compact_deleted_posts,
+    "dedup-likes": dedup_likes,
+    "repair-unread-counts": repair_unread_counts,
+    "purge-deleted-messages": purge_deleted_messages,
+    "recompute-momentum": recompute_momentum,
+    "rebuild-collab-graph": rebuild_collab_graph,
+    "refresh-recommendations": refresh_recommendations,
+    "bulk-update-projects": update_projects,
+    "rebuild-credit-stats": rebuild_credit_stats,
+    "render-media": render_pending_media,
+    "purge-stale-uploads": purge_stale_uploads,
+    "recount-tag-usage": recount_tag_usage,
+}
+
+
+@admin_bp.get("/jobs")
+def list_jobs():
+    """
+    List maintenance jobs with the status of their latest run.
+    """
+    jobs = [
+        {"job": name, "latest_run": runner.latest(name)}
+        for name in MAINTENANCE_JOBS
+    ]
+    return jsonify({"jobs": jobs}), 200
+
+
+@admin_bp.get("/jobs/<job_name>")
+def get_job(job_name):
+    """
+    Recent runs (newest last) of a maintenance job, including progress.
+    """
+    if job_name not in MAINTENANCE_JOBS:
+        return jsonify({"error": "Unknown job"}), 404
+
+    return jsonify({"job": job_name, "runs": runner.history(job_name)}), 200
+
+
+@admin_bp.post("/jobs/<job_name>")
+def start_job(job_name):
+    """
+    Start a maintenance job in the background.
+    Request JSON: job parameters, e.g. {"grace_days": 30, "batch_size": 200}.
+    Names and types are checked against the job's signature (400 otherwise).
+    """
+    func = MAINTENANCE_JOBS.get(job_name)
+    if func is None:
+        return jsonify({"error": "Unknown job"}), 404
+
+    params = request.get_json(silent=True) or {}
+    try:
+        check_params(func, params)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    try:
+        run = runner.start(current_app._get_current_object(), job_name, func, params)
+    except JobAlreadyRunning:
+        return jsonify({"error": f"Job {job_name} is already running"}), 409
+
+    return jsonify({"message": "Job started", "run": run}), 202
+
+
+# /caches
+# In-process cache statistics (hit/miss/eviction counts per cache)
+
+@admin_bp.get("/caches")
+def get_cache_stats():
+    """
+    Hit/miss/eviction counters and sizes for the API's in-process caches.
+    """
+    return jsonify({"caches": all_cache_stats()}), 200
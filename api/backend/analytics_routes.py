@@ -1,5 +1,6 @@
 from flask import Blueprint, jsonify, request, current_app
 from backend.db_connection import db
+from backend.tag_usage import USAGE_COUNT_SQL
 
 analytics_bp = Blueprint("analytics", __name__)
 
@@ -9,16 +10,29 @@ def get_dict_cursor():
     return conn, cursor
 
 # TREND TAGS
+# usage_count is the live number of posts + projects tagged with the tag,
+# summed from TagUsage (backend/tag_usage.py), not the TrendTags column
+
+TREND_TAG_SQL = f"""
+    SELECT t.tag_id, t.tag_name, t.description,
+           {USAGE_COUNT_SQL} AS usage_count,
+           t.status, t.created_at
+    FROM TrendTags t
+"""
+
+
+def load_trend_tag(cursor, tag_id):
+    cursor.execute(TREND_TAG_SQL + " WHERE t.tag_id = %s", (tag_id,))
+    return cursor.fetchone()
+
 
 @analytics_bp.get("/trend-tags")
 def list_trend_tags():
     try:
         conn, cursor = get_dict_cursor()
-        cursor.execute("""
-            SELECT tag_id, tag_name, description, usage_count, status, created_at
-            FROM TrendTags
-            WHERE status != 'archived'
-            ORDER BY usage_count DESC
+        cursor.execute(TREND_TAG_SQL + """
+            WHERE t.status != 'archived'
+            ORDER BY usage_count DESC, t.tag_id
         """)
         tags = cursor.fetchall()
         return jsonify({"trend_tags": tags}), 200
@@ -45,8 +59,7 @@ def create_trend_tag():
         tag_id = cursor.lastrowid
         conn.commit()
 
-        cursor.execute("SELECT * FROM TrendTags WHERE tag_id = %s", (tag_id,))
-        tag = cursor.fetchone()
+        tag = load_trend_tag(cursor, tag_id)
         return jsonify(tag), 201
     except Exception:
         current_app.logger.exception("Error creating trend tag")
@@ -76,8 +89,7 @@ def update_trend_tag(tag_id):
 
         conn.commit()
 
-        cursor.execute("SELECT * FROM TrendTags WHERE tag_id = %s", (tag_id,))
-        updated = cursor.fetchone()
+        updated = load_trend_tag(cursor, tag_id)
         return jsonify(updated), 200
     except Exception:
         current_app.logger.exception("Error updating trend tag")
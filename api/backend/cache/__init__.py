@@ -0,0 +1,153 @@
+#------------------------------------------------------------
+# In-process LRU + TTL caches for hot rows
+#------------------------------------------------------------
+# Each cache is bounded (least recently used entries are evicted first)
+# and every entry expires after `ttl` seconds as a safety net. Route
+# handlers that write a cached table invalidate the affected keys right
+# after their commit, so the TTL only matters for writes made outside
+# the API (e.g. by hand in MySQL).
+#
+# TaggedTTLCache additionally records which rows an entry was built from
+# ("tags"), so a write to any of those rows can drop every entry that
+# depends on it without knowing the entry keys.
+#
+# Caches register themselves by name so GET /admin/caches can report
+# hit/miss/eviction counts for all of them.
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+class TTLCache:
+    def __init__(self, name, maxsize, ttl):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+        }
+
+        with _registry_lock:
+            _registry[name] = self
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self._stats["misses"] += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self._forget(key)
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return default
+
+            self._data.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def get_many(self, keys):
+        """{key: value} for the keys that are cached; the rest are misses."""
+        found = {}
+        with self._lock:
+            for key in keys:
+                value = self.get(key, _MISSING)
+                if value is not _MISSING:
+                    found[key] = value
+        return found
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                evicted, _ = self._data.popitem(last=False)
+                self._forget(evicted)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, key):
+        with self._lock:
+            if self._data.pop(key, _MISSING) is not _MISSING:
+                self._forget(key)
+                self._stats["invalidations"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._stats["invalidations"] += len(self._data)
+            self._data.clear()
+            self._forget_all()
+
+    # hooks for subclasses; called with self._lock held
+    def _forget(self, key):
+        pass
+
+    def _forget_all(self):
+        pass
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            size = len(self._data)
+
+        lookups = stats["hits"] + stats["misses"]
+        stats.update(
+            name=self.name,
+            size=size,
+            maxsize=self.maxsize,
+            ttl_seconds=self.ttl,
+            hit_ratio=round(stats["hits"] / lookups, 4) if lookups else None,
+        )
+        return stats
+
+
+class TaggedTTLCache(TTLCache):
+    def __init__(self, name, maxsize, ttl):
+        super().__init__(name, maxsize, ttl)
+        self._tags_by_key = {}  # key -> set of tags
+        self._keys_by_tag = {}  # tag -> set of keys
+
+    def set(self, key, value, tags=()):
+        with self._lock:
+            self._forget(key)
+            self._tags_by_key[key] = set(tags)
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            super().set(key, value)
+
+    def invalidate_tag(self, tag):
+        with self._lock:
+            keys = list(self._keys_by_tag.get(tag, ()))
+        for key in keys:
+            self.invalidate(key)
+
+    def _forget(self, key):
+        for tag in self._tags_by_key.pop(key, ()):
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def _forget_all(self):
+        self._tags_by_key.clear()
+        self._keys_by_tag.clear()
+
+
+def all_cache_stats():
+    with _registry_lock:
+        caches = list(_registry.values())
+    return [cache.stats() for cache in caches]
@@ -0,0 +1,374 @@
+#------------------------------------------------------------
+# In-memory collaboration graph (users <-> projects via ProjectCredits)
+#------------------------------------------------------------
+# The graph is bipartite: a user is linked to every project they hold a
+# credit on, and two users are collaborators when they share a project.
+# Both directions are stored as CSR arrays indexed directly by id:
+#     user_projects[user_indptr[u]:user_indptr[u + 1]]       projects of u
+#     project_users[project_indptr[p]:project_indptr[p + 1]] users on p
+# so neighbourhood and BFS steps are NumPy slices/gathers, not SQL.
+# Several credits for the same (user, project) pair are one edge; the
+# arrays keep the credit count so the edge goes away with the last one.
+#
+# The graph loads from ProjectCredits on first use. The credit routes call
+# add_credit()/remove_credit() after committing; the change goes into a
+# small overlay that queries apply on top of the arrays, and once the
+# overlay holds COMPACT_AFTER pairs a background thread folds it into a
+# fresh set of arrays. The rebuild-collab-graph admin job reloads
+# everything from the table (for writes made outside the API).
+import threading
+import time
+
+import numpy as np
+
+COMPACT_AFTER = 256
+
+_EMPTY = np.empty(0, np.int64)
+
+
+def _indptr(rows, size):
+    """CSR row pointer for sorted `rows` over ids 0..size-1."""
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=size)[:size], out=indptr[1:])
+    return indptr
+
+
+def _gather(indptr, indices, nodes):
+    """
+    Concatenated neighbour lists of `nodes`; returns (sources, neighbours)
+    where sources[i] is the node whose list neighbours[i] came from.
+    """
+    nodes = nodes[nodes < len(indptr) - 1]
+    starts = indptr[nodes]
+    lengths = indptr[nodes + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return _EMPTY, _EMPTY
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return np.repeat(nodes, lengths), indices[offsets + np.arange(total)]
+
+
+class _Arrays:
+    """One immutable CSR build; swapped as a whole, never edited in place."""
+
+    def __init__(self, users, projects, counts):
+        order = np.lexsort((projects, users))
+        users, projects, counts = users[order], projects[order], counts[order]
+
+        self.edges = (users, projects, counts)
+        self.n_users = int(users.max()) + 1 if len(users) else 0
+        self.n_projects = int(projects.max()) + 1 if len(projects) else 0
+
+        self.user_indptr = _indptr(users, self.n_users)
+        self.user_projects = projects
+        self.user_counts = counts
+
+        by_project = np.lexsort((users, projects))
+        self.project_indptr = _indptr(projects[by_project], self.n_projects)
+        self.project_users = users[by_project]
+        self.project_counts = counts[by_project]
+
+    def side(self, name):
+        if name == "user":
+            return self.user_indptr, self.user_projects, self.user_counts
+        return self.project_indptr, self.project_users, self.project_counts
+
+    def count(self, name, node, other):
+        indptr, indices, counts = self.side(name)
+        if node >= len(indptr) - 1:
+            return 0
+        start, end = indptr[node], indptr[node + 1]
+        i = start + np.searchsorted(indices[start:end], other)
+        return int(counts[i]) if i < end and indices[i] == other else 0
+
+
+def _merge(arrays, pending):
+    """New _Arrays with {(user, project): delta} applied."""
+    users, projects, counts = arrays.edges
+    if pending:
+        pairs = np.array(list(pending), dtype=np.int64).reshape(-1, 2)
+        users = np.concatenate([users, pairs[:, 0]])
+        projects = np.concatenate([projects, pairs[:, 1]])
+        counts = np.concatenate([counts, np.fromiter(pending.values(), np.int64, len(pending))])
+
+    width = int(projects.max()) + 1 if len(projects) else 1
+    keys, inverse = np.unique(users * width + projects, return_inverse=True)
+    totals = np.bincount(inverse, weights=counts).astype(np.int64)
+    keep = totals > 0
+    return _Arrays(keys[keep] // width, keys[keep] % width, totals[keep])
+
+
+class CollaborationGraph:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._arrays = _Arrays(_EMPTY, _EMPTY, _EMPTY)
+        self._loaded = False
+        self._generation = 0
+        self._compacting = False
+        self._pending = {}                     # (user, project) -> delta
+        self._overlay = {"user": {}, "project": {}}  # node -> {other: delta}
+
+    # -- loading ----------------------------------------------------------
+
+    def load(self, cursor):
+        cursor.execute(
+            """
+            SELECT user_id, project_id, COUNT(*) AS credits
+            FROM ProjectCredits
+            GROUP BY user_id, project_id
+            """
+        )
+        rows = cursor.fetchall()
+        arrays = _Arrays(
+            np.fromiter((row["user_id"] for row in rows), np.int64, len(rows)),
+            np.fromiter((row["project_id"] for row in rows), np.int64, len(rows)),
+            np.fromiter((row["credits"] for row in rows), np.int64, len(rows)),
+        )
+
+        with self._lock:
+            self._arrays = arrays
+            self._pending.clear()
+            self._overlay = {"user": {}, "project": {}}
+            self._generation += 1
+            self._loaded = True
+        return len(rows)
+
+    def ensure_loaded(self, cursor):
+        if not self._loaded:
+            self.load(cursor)
+
+    def stats(self):
+        with self._lock:
+            arrays = self._arrays
+            return {
+                "loaded": self._loaded,
+                "edges": len(arrays.user_projects),
+                "users": arrays.n_users,
+                "projects": arrays.n_projects,
+                "pending_changes": len(self._pending),
+            }
+
+    # -- writes -----------------------------------------------------------
+
+    def add_credit(self, user_id, project_id):
+        self._change(int(user_id), int(project_id), 1)
+
+    def remove_credit(self, user_id, project_id):
+        self._change(int(user_id), int(project_id), -1)
+
+    def _change(self, user_id, project_id, delta):
+        with self._lock:
+            if not self._loaded:
+                return  # the first load reads it from the table
+            self._add_pending(user_id, project_id, delta)
+
+            if len(self._pending) >= COMPACT_AFTER and not self._compacting:
+                self._compacting = True
+                threading.Thread(
+                    target=self._compact, name="collab-graph-compact", daemon=True
+                ).start()
+
+    def _add_pending(self, user_id, project_id, delta):
+        """Call with self._lock held."""
+        key = (user_id, project_id)
+        total = self._pending.get(key, 0) + delta
+        for side, node, other in (("user", user_id, project_id), ("project", project_id, user_id)):
+            entries = self._overlay[side].setdefault(node, {})
+            if total:
+                entries[other] = total
+            else:
+                entries.pop(other, None)
+                if not entries:
+                    del self._overlay[side][node]
+        if total:
+            self._pending[key] = total
+        else:
+            self._pending.pop(key, None)
+
+    def _compact(self):
+        with self._lock:
+            arrays, pending, generation = self._arrays, dict(self._pending), self._generation
+
+        merged = _merge(arrays, pending)
+
+        with self._lock:
+            self._compacting = False
+            if generation != self._generation:
+                return  # reloaded meanwhile; the merge is stale
+            self._arrays = merged
+            for (user_id, project_id), delta in pending.items():
+                self._add_pending(user_id, project_id, -delta)
+
+    # -- reads (call with self._lock held) --------------------------------
+
+    def _neighbours(self, side, nodes):
+        """_gather on one side of the graph with the overlay applied."""
+        arrays = self._arrays
+        indptr, indices, _ = arrays.side(side)
+        sources, targets = _gather(indptr, indices, nodes)
+
+        overlay = self._overlay[side]
+        if not overlay or not len(nodes):
+            return sources, targets
+        touched = np.intersect1d(nodes, np.fromiter(overlay, np.int64, len(overlay)))
+        if not len(touched):
+            return sources, targets
+
+        drop = np.zeros(len(sources), bool)
+        added_sources, added_targets = [], []
+        for node in touched.tolist():
+            for other, delta in overlay[node].items():
+                before = arrays.count(side, node, other)
+                if before > 0 and before + delta <= 0:
+                    drop |= (sources == node) & (targets == other)
+                elif before <= 0 and before + delta > 0:
+                    added_sources.append(node)
+                    added_targets.append(other)
+
+        return (
+            np.concatenate([sources[~drop], np.array(added_sources, np.int64)]),
+            np.concatenate([targets[~drop], np.array(added_targets, np.int64)]),
+        )
+
+    def _projects_of(self, user_id):
+        return self._neighbours("user", np.array([user_id], np.int64))[1]
+
+    def _collaborators_of(self, users):
+        """(source user, collaborator) pairs for every user in `users`."""
+        sources, projects = self._neighbours("user", users)
+        via_projects, members = self._neighbours("project", np.unique(projects))
+        # join (source, project) with (project, member) on project
+        order = np.argsort(via_projects, kind="stable")
+        via_projects, members = via_projects[order], members[order]
+        lo = np.searchsorted(via_projects, projects, side="left")
+        hi = np.searchsorted(via_projects, projects, side="right")
+        lengths = hi - lo
+        total = int(lengths.sum())
+        if total == 0:
+            return _EMPTY, _EMPTY, _EMPTY
+        offsets = np.repeat(lo - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+        pair_sources = np.repeat(sources, lengths)
+        pair_members = members[offsets]
+        keep = pair_members != pair_sources
+        return pair_sources[keep], np.repeat(projects, lengths)[keep], pair_members[keep]
+
+    # -- queries ----------------------------------------------------------
+
+    def collaborators(self, user_id):
+        """[(collaborator_id, shared_project_count)], most shared first."""
+        with self._lock:
+            _, _, members = self._collaborators_of(np.array([user_id], np.int64))
+        ids, shared = np.unique(members, return_counts=True)
+        order = np.lexsort((ids, -shared))
+        return [(int(i), int(n)) for i, n in zip(ids[order], shared[order])]
+
+    def collaborator_counts(self, user_ids):
+        """Number of distinct collaborators for each id in `user_ids`."""
+        user_ids = np.asarray(user_ids, np.int64)
+        with self._lock:
+            sources, _, members = self._collaborators_of(np.unique(user_ids))
+        if not len(sources):
+            return np.zeros(len(user_ids), np.int64)
+        pairs = np.unique(np.stack([sources, members]), axis=1)
+        ids, counts = np.unique(pairs[0], return_counts=True)
+        found = np.searchsorted(ids, user_ids)
+        found = np.minimum(found, len(ids) - 1)
+        return np.where(ids[found] == user_ids, counts[found], 0)
+
+    def second_degree(self, user_id):
+        """
+        Users two collaboration hops away (not direct collaborators), as
+        [(user_id, mutual_collaborator_count)], most mutuals first.
+        """
+        with self._lock:
+            _, _, first = self._collaborators_of(np.array([user_id], np.int64))
+            first = np.unique(first)
+            via, _, reached = self._collaborators_of(first)
+
+        keep = ~np.isin(reached, first) & (reached != user_id)
+        pairs = np.unique(np.stack([reached[keep], via[keep]]), axis=1)
+        ids, mutuals = np.unique(pairs[0], return_counts=True)
+        order = np.lexsort((ids, -mutuals))
+        return [(int(i), int(n)) for i, n in zip(ids[order], mutuals[order])]
+
+    def shared_projects(self, user_a, user_b):
+        with self._lock:
+            shared = np.intersect1d(self._projects_of(user_a), self._projects_of(user_b))
+        return [int(p) for p in shared]
+
+    def _user_bound(self):
+        """One past the largest user id in the arrays or the overlay."""
+        ids = [self._arrays.n_users - 1]
+        ids.extend(self._overlay["user"])
+        for members in self._overlay["project"].values():
+            ids.extend(members)
+        return max(ids) + 1
+
+    def shortest_path(self, source, target, max_hops=6):
+        """
+        Bidirectional breadth-first search; each step goes user -> shared
+        project -> user. Returns ([user ids], [project for each hop]) or None.
+        """
+        if source == target:
+            return [source], []
+
+        with self._lock:
+            size = self._user_bound()
+            if max(source, target) >= size:
+                return None
+
+            # per side: previous user and the project used to reach each user
+            previous = [np.full(size, -1, np.int64), np.full(size, -1, np.int64)]
+            via = [np.full(size, -1, np.int64), np.full(size, -1, np.int64)]
+            seen = [np.zeros(size, bool), np.zeros(size, bool)]
+            seen[0][source] = seen[1][target] = True
+            frontiers = [np.array([source], np.int64), np.array([target], np.int64)]
+
+            meet = None
+            for _ in range(max_hops):
+                # grow the smaller side by one hop
+                side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+
+                froms, projects, users = self._collaborators_of(frontiers[side])
+                fresh = ~seen[side][users]
+                users, first = np.unique(users[fresh], return_index=True)
+                if not len(users):
+                    return None
+
+                seen[side][users] = True
+                previous[side][users] = froms[fresh][first]
+                via[side][users] = projects[fresh][first]
+
+                hits = users[seen[1 - side][users]]
+                if len(hits):
+                    meet = int(hits[0])
+                    break
+                frontiers[side] = users
+            else:
+                return None
+
+        def walk(side, node, root):
+            nodes, hops = [node], []
+            while node != root:
+                hops.append(int(via[side][node]))
+                node = int(previous[side][node])
+                nodes.append(node)
+            return nodes, hops
+
+        head, head_hops = walk(0, meet, source)
+        tail, tail_hops = walk(1, meet, target)
+        return head[::-1] + tail[1:], head_hops[::-1] + tail_hops
+
+
+# shared graph for the API process
+collab_graph = CollaborationGraph()
+
+
+def rebuild_collab_graph(conn, progress):
+    """Maintenance job: reload the graph from ProjectCredits."""
+    started = time.monotonic()
+    progress["pairs_loaded"] = collab_graph.load(conn.cursor())
+    conn.commit()
+    progress["load_seconds"] = round(time.monotonic() - started, 3)
+    progress.update(collab_graph.stats())
+    return progress
@@ -1,5 +1,23 @@
+import json
+from collections import Counter
+
 from flask import Blueprint, jsonify, request, current_app
 from backend.db_connection import db
+from backend.cache import TaggedTTLCache, TTLCache
+from backend.collab_graph import collab_graph
+from backend.credit_stats import get_credit_stats, refresh_credit_stats
+from backend.jobs import JobAlreadyRunning, runner, throttle
+from backend.media import blob_info, media_url as blob_media_url
+from backend.media.renditions import attach_renditions, rendition_pool
+from backend.ml_models.collab_recommender import collaborator_recommender
+from backend.ml_models.credit_momentum import (
+    momentum_weight,
+    record_momentum_event,
+    record_momentum_events,
+    record_momentum_weights,
+)
+from backend.pagination import decode_cursor, page_of, parse_limit
+from backend.tag_usage import adjust_tag_usage, count_tag_change
 
 creator_bp = Blueprint("creator", __name__)
 
@@ -10,6 +28,22 @@ def get_dict_cursor():
     return conn, cursor
 
 
+# Assembled GET /portfolios/{id}/full documents, keyed by portfolio_id and
+# tagged with every row they were built from: ("portfolio", id),
+# ("project", id), ("credit", id) and ("user", id) for the owner and each
+# credited collaborator, plus ("blob", id) for uploaded media so finished
+# renditions show up. Writers below invalidate the tags they touch.
+portfolio_cache = TaggedTTLCache("portfolio_full", maxsize=2000, ttl=300)
+
+
+def invalidate_portfolio_rows(*tags):
+    for tag in tags:
+        portfolio_cache.invalidate_tag(tag)
+
+
+rendition_pool.on_ready(lambda blob_id: invalidate_portfolio_rows(("blob", blob_id)))
+
+
 # PORTFOLIOS (multiple portfolios)
 @creator_bp.get("/portfolios")
 def list_portfolios():
@@ -122,6 +156,114 @@ def get_portfolio(portfolio_id):
         return jsonify({"error": "Failed to fetch portfolio"}), 500
 
 
+def load_portfolio_full(cursor, portfolio_id):
+    """
+    Portfolio + its active projects, each with credits (and collaborator
+    names) and ordered media. Four queries regardless of project count.
+    Returns (document, tags) or (None, None) if the portfolio is missing.
+    """
+    cursor.execute(
+        """
+        SELECT p.portfolio_id, p.user_id, u.name AS owner_name,
+               p.headline, p.bio, p.featured_projects, p.is_archived, p.created_at
+        FROM Portfolios p
+        LEFT JOIN Users u ON u.user_id = p.user_id
+        WHERE p.portfolio_id = %s
+        """,
+        (portfolio_id,),
+    )
+    portfolio = cursor.fetchone()
+    if not portfolio:
+        return None, None
+
+    tags = {("portfolio", portfolio_id), ("user", portfolio["user_id"])}
+
+    cursor.execute(
+        """
+        SELECT project_id, portfolio_id, title, description,
+               tags, visibility, is_archived, created_at
+        FROM Projects
+        WHERE portfolio_id = %s AND is_archived = FALSE
+        ORDER BY created_at DESC, project_id DESC
+        """,
+        (portfolio_id,),
+    )
+    projects = cursor.fetchall()
+
+    by_project = {}
+    for project in projects:
+        project["credits"] = []
+        project["media"] = []
+        by_project[project["project_id"]] = project
+        tags.add(("project", project["project_id"]))
+
+    if by_project:
+        project_ids = list(by_project)
+        placeholders = ", ".join(["%s"] * len(project_ids))
+
+        cursor.execute(
+            f"""
+            SELECT c.credit_id, c.project_id, c.user_id, u.name,
+                   c.role, c.verified, c.created_at
+            FROM ProjectCredits c
+            LEFT JOIN Users u ON u.user_id = c.user_id
+            WHERE c.project_id IN ({placeholders})
+            ORDER BY c.created_at DESC, c.credit_id DESC
+            """,
+            project_ids,
+        )
+        for credit in cursor.fetchall():
+            by_project[credit["project_id"]]["credits"].append(credit)
+            tags.add(("credit", credit["credit_id"]))
+            tags.add(("user", credit["user_id"]))
+
+        cursor.execute(
+            f"""
+            SELECT media_id, project_id, media_url, blob_id, media_type,
+                   caption, alt_text,
+                   ROW_NUMBER() OVER (PARTITION BY project_id ORDER BY sort_key, media_id) AS sort_order,
+                   sort_key, created_at
+            FROM ProjectMedia
+            WHERE project_id IN ({placeholders})
+            ORDER BY project_id, sort_key ASC, media_id ASC
+            """,
+            project_ids,
+        )
+        for media in attach_renditions(cursor, cursor.fetchall()):
+            by_project[media["project_id"]]["media"].append(media)
+            if media["blob_id"]:
+                tags.add(("blob", media["blob_id"]))
+
+    portfolio["projects"] = projects
+    return portfolio, tags
+
+
+@creator_bp.get("/portfolios/<int:portfolio_id>/full")
+def get_portfolio_full(portfolio_id):
+    """
+    Everything needed to render a portfolio in one call: the portfolio,
+    its projects, their credits (with collaborator names) and media.
+    Served from portfolio_cache until one of its rows changes.
+    """
+    portfolio = portfolio_cache.get(portfolio_id)
+    if portfolio is not None:
+        return jsonify(portfolio), 200
+
+    try:
+        conn, cursor = get_dict_cursor()
+        portfolio, tags = load_portfolio_full(cursor, portfolio_id)
+
+        if not portfolio:
+            return jsonify({"error": "Portfolio not found"}), 404
+
+        portfolio_cache.set(portfolio_id, portfolio, tags=tags)
+        return jsonify(portfolio), 200
+
+    except Exception:
+        current_app.logger.exception("Error fetching full portfolio")
+        return jsonify({"error": "Failed to fetch portfolio"}), 500
+
+
 @creator_bp.put("/portfolios/<int:portfolio_id>")
 def update_portfolio(portfolio_id):
     """
@@ -151,6 +293,7 @@ def update_portfolio(portfolio_id):
             return jsonify({"error": "Portfolio not found"}), 404
 
         conn.commit()
+        invalidate_portfolio_rows(("portfolio", portfolio_id))
 
         cursor.execute(
             """
@@ -185,6 +328,7 @@ def archive_portfolio(portfolio_id):
             return jsonify({"error": "Portfolio not found"}), 404
 
         conn.commit()
+        invalidate_portfolio_rows(("portfolio", portfolio_id))
         return jsonify({"message": "Portfolio archived"}), 200
 
     except Exception:
@@ -241,7 +385,21 @@ def create_project():
             (portfolio_id, title, description, tags),
         )
         project_id = cursor.lastrowid
+
+        deltas = Counter()
+        count_tag_change(deltas, None, tags)
+        adjust_tag_usage(cursor, project_deltas=deltas)
+
+        cursor.execute(
+            "SELECT user_id FROM Portfolios WHERE portfolio_id = %s",
+            (portfolio_id,),
+        )
+        owner = cursor.fetchone()
+        if owner:
+            record_momentum_event(cursor, owner["user_id"], "project")
+
         conn.commit()
+        portfolio_cache.invalidate(int(portfolio_id))
 
         cursor.execute(
             """
@@ -259,28 +417,291 @@ def create_project():
         return jsonify({"error": "Failed to create project"}), 500
 
 
+# Bulk project updates. Explicit ids/items are worked through in sorted
+# chunks (lock, one JSON_TABLE-joined UPDATE, commit); a filter is applied
+# window by window over project_id ranges, one short transaction each, so
+# concurrent writers only ever wait on one window.
+PROJECT_BULK_CHUNK = 500
+PROJECT_BULK_MAX_ITEMS = 10000
+PROJECT_FIELDS = ("title", "description", "tags", "visibility", "is_archived")
+
+
+def clean_project_changes(changes):
+    """Validated {field: value} for a bulk update; raises ValueError."""
+    if not isinstance(changes, dict):
+        raise ValueError("set must be an object")
+    cleaned = {}
+    for field, value in changes.items():
+        if field not in PROJECT_FIELDS:
+            raise ValueError(f"Unknown field: {field}")
+        if value is None:
+            continue
+        if field == "is_archived":
+            value = int(bool(value))
+        elif not isinstance(value, str):
+            raise ValueError(f"{field} must be a string")
+        elif field == "visibility" and value not in ("public", "private"):
+            raise ValueError("visibility must be public or private")
+        elif field == "title" and not value.strip():
+            raise ValueError("title cannot be empty")
+        elif field in ("title", "tags") and len(value) > 255:
+            raise ValueError(f"{field} is longer than 255 characters")
+        cleaned[field] = value
+    return cleaned
+
+
+def count_project_tag_change(deltas, old, changes):
+    """
+    Tag usage effect of applying `changes` to a Projects row whose
+    current tags/is_archived are in `old`.
+    """
+    new_tags = changes.get("tags", old["tags"])
+    new_archived = changes.get("is_archived", old["is_archived"])
+    count_tag_change(
+        deltas,
+        None if old["is_archived"] else old["tags"],
+        None if new_archived else new_tags,
+    )
+
+
+def parse_id(value, name="project_id"):
+    if isinstance(value, bool) or not isinstance(value, (int, str)) or not str(value).isdigit():
+        raise ValueError(f"Invalid {name}: {value!r}")
+    return int(value)
+
+
+def project_bulk_rows(changes=None, items=None, project_ids=None):
+    """{project_id: changes} from explicit ids and/or per-row items."""
+    common = clean_project_changes(changes or {})
+    rows = {}
+    for project_id in project_ids or ():
+        rows[parse_id(project_id)] = dict(common)
+    for item in items or ():
+        if not isinstance(item, dict) or "project_id" not in item:
+            raise ValueError("Each item needs a project_id")
+        own = {field: value for field, value in item.items() if field != "project_id"}
+        rows[parse_id(item["project_id"])] = dict(common, **clean_project_changes(own))
+    if any(not row_changes for row_changes in rows.values()):
+        raise ValueError("Nothing to update")
+    return rows
+
+
+def update_projects(
+    conn,
+    progress,
+    changes=None,
+    items=None,
+    project_ids=None,
+    portfolio_id=None,
+    tag=None,
+    include_archived=False,
+    chunk_size=PROJECT_BULK_CHUNK,
+    pause_seconds=0.05,
+):
+    """
+    Apply `changes` to explicit project_ids, per-row `items`
+    ([{"project_id": 1, "tags": "..."}]), or every project matching the
+    portfolio_id/tag filter (live projects only unless include_archived).
+    Also runs as the bulk-update-projects background job.
+    """
+    cursor = conn.cursor()
+    chunk_size = max(1, int(chunk_size))
+    progress.update(chunks=0, updated=0)
+
+    if items is not None or project_ids is not None:
+        rows = project_bulk_rows(changes, items, project_ids)
+        ids = sorted(rows)
+        progress.update(requested=len(ids), matched=0, skipped_ids=[])
+
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start:start + chunk_size]
+            placeholders = ", ".join(["%s"] * len(chunk))
+            cursor.execute(
+                f"""
+                SELECT project_id, tags, is_archived
+                FROM Projects
+                WHERE project_id IN ({placeholders})
+                FOR UPDATE
+                """,
+                chunk,
+            )
+            found = {row["project_id"]: row for row in cursor.fetchall()}
+            progress["skipped_ids"].extend(i for i in chunk if i not in found)
+
+            deltas = Counter()
+            for i, old in found.items():
+                count_project_tag_change(deltas, old, rows[i])
+
+            payload = [dict(rows[i], project_id=i) for i in chunk if i in found]
+            if payload:
+                cursor.execute(
+                    """
+                    UPDATE Projects p
+                    JOIN JSON_TABLE(%s, '$[*]' COLUMNS (
+                             project_id  INT          PATH '$.project_id',
+                             title       VARCHAR(255) PATH '$.title',
+                             description TEXT         PATH '$.description',
+                             tags        VARCHAR(255) PATH '$.tags',
+                             visibility  VARCHAR(16)  PATH '$.visibility',
+                             is_archived TINYINT      PATH '$.is_archived'
+                         )) j ON j.project_id = p.project_id
+                    SET p.title       = COALESCE(j.title, p.title),
+                        p.description = COALESCE(j.description, p.description),
+                        p.tags        = COALESCE(j.tags, p.tags),
+                        p.visibility  = COALESCE(j.visibility, p.visibility),
+                        p.is_archived = COALESCE(j.is_archived, p.is_archived)
+                    """,
+                    (json.dumps(payload),),
+                )
+                progress["updated"] += cursor.rowcount
+                adjust_tag_usage(cursor, project_deltas=deltas)
+            conn.commit()
+
+            invalidate_portfolio_rows(*(("project", i) for i in found))
+            progress["chunks"] += 1
+            progress["matched"] += len(found)
+            throttle(pause_seconds)
+        return progress
+
+    changes = clean_project_changes(changes or {})
+    if not changes:
+        raise ValueError("Nothing to update")
+    set_clause = ", ".join(f"{field} = %s" for field in changes)
+
+    conditions = ["project_id >= %s", "project_id < %s"]
+    filter_params = []
+    if not include_archived:
+        conditions.append("is_archived = FALSE")
+    if portfolio_id is not None:
+        conditions.append("portfolio_id = %s")
+        filter_params.append(int(portfolio_id))
+    tag = str(tag or "").strip().lower()
+    if tag:
+        # match the way tag_keys() reads the column: case and the spaces
+        # around each comma don't matter ("Drama , Noir" has "drama")
+        conditions.append(
+            "FIND_IN_SET(%s, TRIM(REGEXP_REPLACE(LOWER(tags), '[[:space:]]*,[[:space:]]*', ','))) > 0"
+        )
+        filter_params.append(tag)
+
+    cursor.execute("SELECT MIN(project_id) AS low, MAX(project_id) AS high FROM Projects")
+    bounds = cursor.fetchone()
+    conn.commit()
+    if bounds["low"] is None:
+        return progress
+
+    # tag usage changes only if tags or archival do
+    counts_tags = "tags" in changes or "is_archived" in changes
+
+    low = bounds["low"]
+    while low <= bounds["high"]:
+        high = low + chunk_size
+        window_params = [low, high] + filter_params
+        # lock the matching rows so the UPDATE hits exactly these and only
+        # their portfolios are dropped from the cache
+        cursor.execute(
+            f"""
+            SELECT project_id, tags, is_archived
+            FROM Projects
+            WHERE {' AND '.join(conditions)}
+            FOR UPDATE
+            """,
+            window_params,
+        )
+        matched = cursor.fetchall()
+        deltas = Counter()
+        if counts_tags:
+            for old in matched:
+                count_project_tag_change(deltas, old, changes)
+
+        updated = 0
+        if matched:
+            cursor.execute(
+                f"UPDATE Projects SET {set_clause} WHERE {' AND '.join(conditions)}",
+                list(changes.values()) + window_params,
+            )
+            updated = cursor.rowcount
+            adjust_tag_usage(cursor, project_deltas=deltas)
+        conn.commit()
+        if updated:
+            invalidate_portfolio_rows(*(("project", row["project_id"]) for row in matched))
+
+        progress["chunks"] += 1
+        progress["updated"] += updated
+        progress["through_project_id"] = min(high - 1, bounds["high"])
+        low = high
+        throttle(pause_seconds)
+    return progress
+
+
 @creator_bp.put("/projects")
 def bulk_update_projects():
     """
     Matrix: PUT /projects – bulk update tags/metadata.
-    Minimal school-friendly implementation:
-    Request:
-    { "tags": "updated, tags" }
+    Request (one selector):
+    {
+      "project_ids": [1, 2, 3],                      // same changes for each id
+      "items": [{"project_id": 4, "tags": "..."}],   // or per-row changes
+      "filter": {"portfolio_id": 2, "tag": "drama", "include_archived": false},
+      "set": {"tags": "updated, tags", "visibility": "public"}
+    }
+    Fields: title, description, tags, visibility, is_archived.
+    ids/items are applied in this request and the response reports chunks,
+    matched/updated rows and skipped_ids. A filter can match any number of
+    rows, so it runs as the bulk-update-projects background job: 202, then
+    poll GET /admin/jobs/bulk-update-projects for progress.
     """
     data = request.get_json(silent=True) or {}
-    new_tags = data.get("tags")
+    changes = data.get("set") or {}
+    items = data.get("items")
+    project_ids = data.get("project_ids")
+    project_filter = data.get("filter")
 
-    if not new_tags:
-        return jsonify({"error": "Nothing to update"}), 400
+    try:
+        if items is not None or project_ids is not None:
+            for value, name in ((items, "items"), (project_ids, "project_ids")):
+                if value is not None and not isinstance(value, list):
+                    raise ValueError(f"{name} must be a list")
+            if len(items or ()) + len(project_ids or ()) > PROJECT_BULK_MAX_ITEMS:
+                raise ValueError(f"Too many projects (max {PROJECT_BULK_MAX_ITEMS})")
+            project_bulk_rows(changes, items, project_ids)
+        elif isinstance(project_filter, dict):
+            if not clean_project_changes(changes):
+                raise ValueError("Nothing to update")
+            if project_filter.get("portfolio_id") is not None:
+                project_filter["portfolio_id"] = parse_id(project_filter["portfolio_id"], "portfolio_id")
+        else:
+            raise ValueError("Provide project_ids, items or filter")
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    if items is None and project_ids is None:
+        params = {
+            "changes": changes,
+            "portfolio_id": project_filter.get("portfolio_id"),
+            "tag": project_filter.get("tag"),
+            "include_archived": bool(project_filter.get("include_archived")),
+        }
+        try:
+            run = runner.start(
+                current_app._get_current_object(), "bulk-update-projects",
+                update_projects, params,
+            )
+        except JobAlreadyRunning:
+            return jsonify({"error": "A bulk project update is already running"}), 409
+        return jsonify({
+            "message": "Bulk update started",
+            "run": run,
+            "status_url": "/admin/jobs/bulk-update-projects",
+        }), 202
 
     try:
         conn, cursor = get_dict_cursor()
-        cursor.execute(
-            "UPDATE Projects SET tags = %s WHERE is_archived = FALSE",
-            (new_tags,),
+        progress = update_projects(
+            conn, {}, changes=changes, items=items, project_ids=project_ids,
+            pause_seconds=0,
         )
-        conn.commit()
-        return jsonify({"message": "Projects updated"}), 200
+        return jsonify(progress), 200
 
     except Exception:
         current_app.logger.exception("Error bulk updating projects")
@@ -327,6 +748,15 @@ def update_project(project_id):
     try:
         conn, cursor = get_dict_cursor()
 
+        cursor.execute(
+            "SELECT tags, is_archived FROM Projects WHERE project_id = %s FOR UPDATE",
+            (project_id,),
+        )
+        old = cursor.fetchone()
+        if old is None:
+            conn.rollback()
+            return jsonify({"error": "Project not found"}), 404
+
         cursor.execute(
             """
             UPDATE Projects
@@ -346,9 +776,15 @@ def update_project(project_id):
         )
 
         if cursor.rowcount == 0:
+            conn.rollback()
             return jsonify({"error": "Project not found"}), 404
 
+        if data.get("tags") is not None:
+            deltas = Counter()
+            count_project_tag_change(deltas, old, {"tags": data["tags"]})
+            adjust_tag_usage(cursor, project_deltas=deltas)
         conn.commit()
+        invalidate_portfolio_rows(("project", project_id))
 
         cursor.execute(
             """
@@ -374,13 +810,24 @@ def delete_project(project_id):
     """
     try:
         conn, cursor = get_dict_cursor()
+        cursor.execute(
+            "SELECT tags, is_archived FROM Projects WHERE project_id = %s FOR UPDATE",
+            (project_id,),
+        )
+        old = cursor.fetchone()
         cursor.execute(
             "UPDATE Projects SET is_archived = TRUE WHERE project_id = %s",
             (project_id,),
         )
+        archived = cursor.rowcount
+        if old is not None:
+            deltas = Counter()
+            count_project_tag_change(deltas, old, {"is_archived": 1})
+            adjust_tag_usage(cursor, project_deltas=deltas)
         conn.commit()
+        invalidate_portfolio_rows(("project", project_id))
 
-        if cursor.rowcount == 0:
+        if archived == 0:
             return jsonify({"error": "Project not found"}), 404
 
         return jsonify({"message": "Project archived"}), 200
@@ -391,6 +838,82 @@ def delete_project(project_id):
     
 # USERS & CREATORS
 
+# USER PROFILE CACHE
+# Users rows as returned by GET /users/{id}, read far more often than
+# they are written. update_user/deactivate_user invalidate right after
+# their commit; credit_momentum, which the momentum code rewrites on
+# every engagement, is allowed to lag by up to the TTL.
+user_cache = TTLCache("user_profiles", maxsize=20000, ttl=300)
+USER_BATCH_MAX = 100
+
+# primary_styles / tools are stored as "A, B, C"; Users.style_list and
+# tool_list index each entry as CHAR(64), so no entry may be longer
+LIST_ENTRY_MAX = 64
+LIST_FIELD_MAX = 255
+
+
+def normalize_list_field(value, name):
+    """
+    Canonical "A, B, C" form of a styles/tools value (a comma-separated
+    string or a list of strings): entries trimmed, control characters
+    dropped, empties and repeats removed. None stays None. Raises
+    ValueError for other types or entries/totals over the column limits.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        parts = value.split(",")
+    elif isinstance(value, list) and all(isinstance(part, str) for part in value):
+        parts = [piece for part in value for piece in part.split(",")]
+    else:
+        raise ValueError(f"{name} must be a comma-separated string or a list of strings")
+
+    entries = []
+    for part in parts:
+        entry = " ".join("".join(c if c.isprintable() else " " for c in part).split())
+        if not entry or entry in entries:
+            continue
+        if len(entry) > LIST_ENTRY_MAX:
+            raise ValueError(f"Each entry in {name} must be at most {LIST_ENTRY_MAX} characters")
+        entries.append(entry)
+
+    normalized = ", ".join(entries)
+    if len(normalized) > LIST_FIELD_MAX:
+        raise ValueError(f"{name} must be at most {LIST_FIELD_MAX} characters")
+    return normalized
+
+
+USER_COLUMNS = """
+    user_id, name, email, role, location, primary_styles, tools,
+    headline, bio, socials, is_creator, market, credit_momentum,
+    is_active, created_at
+"""
+
+
+def load_users(cursor, user_ids):
+    """
+    {user_id: Users row} for the ids that exist; cache hits first, then
+    one IN (...) query for all the misses.
+    """
+    user_ids = {int(user_id) for user_id in user_ids}
+    users = user_cache.get_many(user_ids)
+    missing = sorted(user_ids - users.keys())
+    if missing:
+        placeholders = ", ".join(["%s"] * len(missing))
+        cursor.execute(
+            f"SELECT {USER_COLUMNS} FROM Users WHERE user_id IN ({placeholders})",
+            missing,
+        )
+        for row in cursor.fetchall():
+            user_cache.set(row["user_id"], row)
+            users[row["user_id"]] = row
+    return users
+
+
+def load_user(cursor, user_id):
+    return load_users(cursor, [user_id]).get(user_id)
+
+
 @creator_bp.get("/users")
 def list_users():
     """
@@ -437,33 +960,12 @@ def get_user(user_id):
     """
     try:
         conn, cursor = get_dict_cursor()
-        cursor.execute(
-            """
-            SELECT
-                user_id,
-                name,
-                email,
-                role,
-                location,
-                primary_styles,
-                tools,
-                headline,
-                bio,
-                socials,
-                is_creator,
-                market,
-                credit_momentum,
-                is_active,
-                created_at
-            FROM Users
-            WHERE user_id = %s
-            """,
-            (user_id,),
-        )
-        user = cursor.fetchone()
+        user = load_user(cursor, user_id)
         if not user:
             return jsonify({"error": "User not found"}), 404
 
+        user = dict(user, credit_stats=get_credit_stats(cursor, user_id))
+
         return jsonify(user), 200
 
     except Exception:
@@ -471,14 +973,53 @@ def get_user(user_id):
         return jsonify({"error": "Failed to fetch user"}), 500
 
 
+@creator_bp.get("/users/batch")
+def get_users_batch():
+    """
+    Several profiles in one call, e.g. for a page of profile cards.
+    Query: ?ids=1,2,3 (at most 100)
+    Response: users in the order requested, plus ids that do not exist.
+    """
+    try:
+        user_ids = [
+            int(part) for part in request.args.get("ids", "").split(",") if part.strip()
+        ]
+    except ValueError:
+        return jsonify({"error": "ids must be a comma-separated list of user ids"}), 400
+    if not user_ids:
+        return jsonify({"error": "Missing required parameter: ids"}), 400
+    if len(user_ids) > USER_BATCH_MAX:
+        return jsonify({"error": f"Too many ids (max {USER_BATCH_MAX})"}), 400
+
+    try:
+        conn, cursor = get_dict_cursor()
+        users = load_users(cursor, user_ids)
+        ordered = list(dict.fromkeys(user_ids))
+        return jsonify({
+            "users": [users[user_id] for user_id in ordered if user_id in users],
+            "missing": [user_id for user_id in ordered if user_id not in users],
+        }), 200
+
+    except Exception:
+        current_app.logger.exception("Error fetching users")
+        return jsonify({"error": "Failed to fetch users"}), 500
+
+
 @creator_bp.put("/users/<int:user_id>")
 def update_user(user_id):
     """
     Matrix: PUT /creator/users/{userID}
     Simple profile update (headline/bio/location/tools/etc.).
+    primary_styles / tools may be a comma-separated string or a list.
     """
     data = request.get_json(silent=True) or {}
 
+    try:
+        primary_styles = normalize_list_field(data.get("primary_styles"), "primary_styles")
+        tools = normalize_list_field(data.get("tools"), "tools")
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
     try:
         conn, cursor = get_dict_cursor()
 
@@ -501,8 +1042,8 @@ def update_user(user_id):
                 data.get("name"),
                 data.get("role"),
                 data.get("location"),
-                data.get("primary_styles"),
-                data.get("tools"),
+                primary_styles,
+                tools,
                 data.get("headline"),
                 data.get("bio"),
                 data.get("socials"),
@@ -515,31 +1056,11 @@ def update_user(user_id):
             return jsonify({"error": "User not found"}), 404
 
         conn.commit()
+        user_cache.invalidate(user_id)
+        invalidate_portfolio_rows(("user", user_id))
+        collaborator_recommender.update_user(cursor, user_id)
 
-        cursor.execute(
-            """
-            SELECT
-                user_id,
-                name,
-                email,
-                role,
-                location,
-                primary_styles,
-                tools,
-                headline,
-                bio,
-                socials,
-                is_creator,
-                market,
-                credit_momentum,
-                is_active,
-                created_at
-            FROM Users
-            WHERE user_id = %s
-            """,
-            (user_id,),
-        )
-        return jsonify(cursor.fetchone()), 200
+        return jsonify(load_user(cursor, user_id)), 200
 
     except Exception:
         current_app.logger.exception("Error updating user")
@@ -562,6 +1083,9 @@ def deactivate_user(user_id):
             return jsonify({"error": "User not found"}), 404
 
         conn.commit()
+        user_cache.invalidate(user_id)
+        invalidate_portfolio_rows(("user", user_id))
+        collaborator_recommender.update_user(cursor, user_id)
         return jsonify({"message": "User deactivated"}), 200
 
     except Exception:
@@ -569,46 +1093,238 @@ def deactivate_user(user_id):
         return jsonify({"error": "Failed to deactivate user"}), 500
 
 
+# sort key -> (ORDER BY, keyset condition after the cursor row, cursor values)
+CREATOR_SORTS = {
+    "momentum_desc": (
+        "u.credit_momentum DESC, u.user_id DESC",
+        "(u.credit_momentum < %s OR (u.credit_momentum = %s AND u.user_id < %s))",
+        lambda row: (row["credit_momentum"], row["user_id"]),
+    ),
+    "momentum_asc": (
+        "u.credit_momentum ASC, u.user_id ASC",
+        "(u.credit_momentum > %s OR (u.credit_momentum = %s AND u.user_id > %s))",
+        lambda row: (row["credit_momentum"], row["user_id"]),
+    ),
+    "name": (
+        "u.name ASC, u.user_id ASC",
+        "(u.name > %s OR (u.name = %s AND u.user_id > %s))",
+        lambda row: (row["name"], row["user_id"]),
+    ),
+    # CreditStats sorts; creators without a stats row count as 0
+    "credits_desc": (
+        "COALESCE(cs.total_credits, 0) DESC, u.user_id DESC",
+        "(COALESCE(cs.total_credits, 0) < %s"
+        " OR (COALESCE(cs.total_credits, 0) = %s AND u.user_id < %s))",
+        lambda row: (row["total_credits"], row["user_id"]),
+    ),
+    "verified_desc": (
+        "COALESCE(cs.verified_credits, 0) DESC, u.user_id DESC",
+        "(COALESCE(cs.verified_credits, 0) < %s"
+        " OR (COALESCE(cs.verified_credits, 0) = %s AND u.user_id < %s))",
+        lambda row: (row["verified_credits"], row["user_id"]),
+    ),
+    "collaborators_desc": (
+        "COALESCE(cs.collaborators, 0) DESC, u.user_id DESC",
+        "(COALESCE(cs.collaborators, 0) < %s"
+        " OR (COALESCE(cs.collaborators, 0) = %s AND u.user_id < %s))",
+        lambda row: (row["collaborators"], row["user_id"]),
+    ),
+}
+
+# market/style/tool dropdowns and headline numbers for the dashboard
+creator_facets_cache = TTLCache("creator_facets", maxsize=1, ttl=60)
+
+
 @creator_bp.get("/creators")
 def list_creators():
     """
     Matrix: GET /creator/creators
-    Convenience view filtered to creator accounts.
+    Convenience view filtered to creator accounts, one page at a time.
+    Query (all optional):
+      ?market=NYC&style=Comedy&tool=Premiere Pro&min_momentum=50
+      &sort=momentum_desc|momentum_asc|name|credits_desc|verified_desc|collaborators_desc
+      &limit=20&cursor=<next_cursor>
+    Served by the idx_users_creator_* indexes; style/tool use the
+    multi-valued indexes on style_list/tool_list. Each creator carries
+    their CreditStats numbers.
     """
+    sort = request.args.get("sort", "momentum_desc")
+    if sort not in CREATOR_SORTS:
+        return jsonify({"error": f"sort must be one of {', '.join(CREATOR_SORTS)}"}), 400
+    order_by, after_condition, cursor_key = CREATOR_SORTS[sort]
+
+    try:
+        limit = parse_limit(request.args.get("limit"), default=20, maximum=100)
+        cursor_token = request.args.get("cursor")
+        after = decode_cursor(cursor_token, 2) if cursor_token else None
+        min_momentum = request.args.get("min_momentum")
+        min_momentum = int(min_momentum) if min_momentum not in (None, "") else None
+    except ValueError:
+        return jsonify({"error": "Invalid limit, cursor or min_momentum"}), 400
+
+    conditions = ["u.is_creator = TRUE", "u.is_active = TRUE"]
+    params = []
+
+    if request.args.get("market"):
+        conditions.append("u.market = %s")
+        params.append(request.args["market"])
+    # entries are stored whitespace-collapsed (normalize_list_field)
+    style = " ".join(request.args.get("style", "").split())
+    tool = " ".join(request.args.get("tool", "").split())
+    if style:
+        conditions.append("%s MEMBER OF (u.style_list)")
+        params.append(style)
+    if tool:
+        conditions.append("%s MEMBER OF (u.tool_list)")
+        params.append(tool)
+    if min_momentum is not None:
+        conditions.append("u.credit_momentum >= %s")
+        params.append(min_momentum)
+    if after:
+        conditions.append(after_condition)
+        params.extend([after[0], after[0], after[1]])
+
+    params.append(limit + 1)
+
     try:
         conn, cursor = get_dict_cursor()
         cursor.execute(
-            """
+            f"""
             SELECT
-                user_id,
-                name,
-                email,
-                role,
-                location,
-                primary_styles,
-                tools,
-                headline,
-                bio,
-                socials,
-                is_creator,
-                market,
-                credit_momentum,
-                is_active,
-                created_at
-            FROM Users
-            WHERE is_creator = TRUE
-              AND is_active = TRUE
-            """
+                u.user_id,
+                u.name,
+                u.email,
+                u.role,
+                u.location,
+                u.primary_styles,
+                u.tools,
+                u.headline,
+                u.bio,
+                u.socials,
+                u.is_creator,
+                u.market,
+                u.credit_momentum,
+                u.is_active,
+                u.created_at,
+                COALESCE(cs.total_credits, 0) AS total_credits,
+                COALESCE(cs.verified_credits, 0) AS verified_credits,
+                COALESCE(cs.projects, 0) AS credited_projects,
+                COALESCE(cs.collaborators, 0) AS collaborators
+            FROM Users u
+            LEFT JOIN CreditStats cs ON cs.user_id = u.user_id
+            WHERE {" AND ".join(conditions)}
+            ORDER BY {order_by}
+            LIMIT %s
+            """,
+            params,
         )
-        creators = cursor.fetchall()
-        return jsonify({"creators": creators}), 200
+        creators, next_cursor = page_of(cursor.fetchall(), limit, key=cursor_key)
+        return jsonify({"creators": creators, "next_cursor": next_cursor}), 200
 
     except Exception:
         current_app.logger.exception("Error listing creators")
         return jsonify({"error": "Failed to list creators"}), 500
-    
+
+
+@creator_bp.get("/creators/facets")
+def get_creator_facets():
+    """
+    Totals and filter options for the creator directory: creator count,
+    average momentum, and per-market / per-style / per-tool counts.
+    Cached for a minute.
+    """
+    facets = creator_facets_cache.get("all")
+    if facets is not None:
+        return jsonify(facets), 200
+
+    try:
+        conn, cursor = get_dict_cursor()
+
+        cursor.execute(
+            """
+            SELECT market, COUNT(*) AS creators,
+                   COALESCE(SUM(credit_momentum), 0) AS momentum_sum
+            FROM Users
+            WHERE is_creator = TRUE AND is_active = TRUE
+            GROUP BY market
+            ORDER BY creators DESC
+            """
+        )
+        markets = cursor.fetchall()
+
+        total = sum(row["creators"] for row in markets)
+        facets = {
+            "total_creators": total,
+            "avg_momentum": (
+                float(sum(row["momentum_sum"] for row in markets)) / total if total else None
+            ),
+            "markets": [
+                {"market": row["market"], "creators": row["creators"]}
+                for row in markets if row["market"]
+            ],
+        }
+
+        for facet, column in (("styles", "style_list"), ("tools", "tool_list")):
+            cursor.execute(
+                f"""
+                SELECT v.value, COUNT(*) AS creators
+                FROM Users,
+                     JSON_TABLE({column}, '$[*]' COLUMNS (value VARCHAR(64) PATH '$')) v
+                WHERE is_creator = TRUE AND is_active = TRUE
+                GROUP BY v.value
+                ORDER BY v.value
+                """
+            )
+            facets[facet] = [
+                {"value": row["value"], "creators": row["creators"]}
+                for row in cursor.fetchall()
+            ]
+
+        creator_facets_cache.set("all", facets)
+        return jsonify(facets), 200
+
+    except Exception:
+        current_app.logger.exception("Error fetching creator facets")
+        return jsonify({"error": "Failed to fetch creator facets"}), 500
+
+
 # COLLABORATIONS (ProjectCredits)
 
+def lock_credit(cursor, credit_id, project_id=None):
+    """
+    The credit's user_id, project_id, verified and age_days, locked for
+    the rest of the transaction; None if it does not exist (in project_id).
+    """
+    condition = "credit_id = %s" + (" AND project_id = %s" if project_id is not None else "")
+    cursor.execute(
+        f"""
+        SELECT user_id, project_id, verified,
+               TIMESTAMPDIFF(SECOND, created_at, NOW()) / 86400 AS age_days
+        FROM ProjectCredits
+        WHERE {condition}
+        FOR UPDATE
+        """,
+        (credit_id,) if project_id is None else (credit_id, project_id),
+    )
+    return cursor.fetchone()
+
+
+def credit_weight(verified, age_days):
+    return momentum_weight("credit_verified" if verified else "credit", float(age_days))
+
+
+def adjust_credit_momentum(cursor, credit, verified=None, deleted=False):
+    """
+    Bring the credited user's momentum in line with a credit (as locked by
+    lock_credit) that was deleted or changed to `verified`.
+    """
+    old = credit_weight(credit["verified"], credit["age_days"])
+    new = 0.0 if deleted else credit_weight(verified, credit["age_days"])
+    if new != old:
+        record_momentum_weights(cursor, {credit["user_id"]: new - old})
+
+
+
 @creator_bp.get("/collaborations")
 def list_collaborations():
     """
@@ -684,7 +1400,11 @@ def create_collaboration():
             (project_id, user_id, role, verified),
         )
         credit_id = cursor.lastrowid
+        record_momentum_event(cursor, user_id, "credit_verified" if verified else "credit")
+        refresh_credit_stats(cursor, project_ids=[project_id])
         conn.commit()
+        invalidate_portfolio_rows(("project", int(project_id)))
+        collab_graph.add_credit(user_id, project_id)
 
         cursor.execute(
             """
@@ -723,6 +1443,11 @@ def update_collaboration(credit_id):
     try:
         conn, cursor = get_dict_cursor()
 
+        credit = lock_credit(cursor, credit_id)
+        if credit is None:
+            conn.rollback()
+            return jsonify({"error": "Collaboration not found"}), 404
+
         cursor.execute(
             """
             UPDATE ProjectCredits
@@ -734,10 +1459,15 @@ def update_collaboration(credit_id):
             (role, verified, credit_id),
         )
 
-        if cursor.rowcount == 0:
-            return jsonify({"error": "Collaboration not found"}), 404
-
+        if verified is not None:
+            cursor.execute(
+                "SELECT verified FROM ProjectCredits WHERE credit_id = %s",
+                (credit_id,),
+            )
+            adjust_credit_momentum(cursor, credit, verified=cursor.fetchone()["verified"])
+            refresh_credit_stats(cursor, user_ids=[credit["user_id"]])
         conn.commit()
+        invalidate_portfolio_rows(("credit", credit_id))
 
         cursor.execute(
             """
@@ -768,21 +1498,197 @@ def delete_collaboration(credit_id):
     """
     try:
         conn, cursor = get_dict_cursor()
+        credit = lock_credit(cursor, credit_id)
+        if credit is None:
+            conn.rollback()
+            return jsonify({"error": "Collaboration not found"}), 404
+
         cursor.execute(
             "DELETE FROM ProjectCredits WHERE credit_id = %s",
             (credit_id,),
         )
+        adjust_credit_momentum(cursor, credit, deleted=True)
 
-        if cursor.rowcount == 0:
-            return jsonify({"error": "Collaboration not found"}), 404
-
+        refresh_credit_stats(
+            cursor, user_ids=[credit["user_id"]], project_ids=[credit["project_id"]]
+        )
         conn.commit()
+        invalidate_portfolio_rows(("credit", credit_id))
+        collab_graph.remove_credit(credit["user_id"], credit["project_id"])
         return jsonify({"message": "Collaboration deleted"}), 200
 
     except Exception:
         current_app.logger.exception("Error deleting collaboration")
         return jsonify({"error": "Failed to delete collaboration"}), 500
     
+# COLLABORATION GRAPH
+# Network queries over ProjectCredits answered from backend.collab_graph.
+
+def user_names(cursor, user_ids):
+    """{user_id: name} for the given ids, from the profile cache."""
+    return {user_id: user["name"] for user_id, user in load_users(cursor, user_ids).items()}
+
+
+@creator_bp.get("/users/<int:user_id>/collaborators")
+def list_collaborators(user_id):
+    """
+    Users who share at least one project with this user.
+    Query: ?limit=50
+    """
+    try:
+        limit = parse_limit(request.args.get("limit"), default=50, maximum=500)
+    except ValueError:
+        return jsonify({"error": "Invalid limit"}), 400
+
+    try:
+        conn, cursor = get_dict_cursor()
+        collab_graph.ensure_loaded(cursor)
+
+        collaborators = collab_graph.collaborators(user_id)[:limit]
+        names = user_names(cursor, [other for other, _ in collaborators])
+
+        return jsonify({
+            "user_id": user_id,
+            "collaborators": [
+                {"user_id": other, "name": names.get(other), "shared_projects": shared}
+                for other, shared in collaborators
+            ],
+        }), 200
+
+    except Exception:
+        current_app.logger.exception("Error listing collaborators")
+        return jsonify({"error": "Failed to list collaborators"}), 500
+
+
+@creator_bp.get("/users/<int:user_id>/collaborators/second-degree")
+def list_second_degree_collaborators(user_id):
+    """
+    Collaborators of collaborators who have not worked with this user yet,
+    ranked by how many collaborators they have in common.
+    Query: ?limit=50
+    """
+    try:
+        limit = parse_limit(request.args.get("limit"), default=50, maximum=500)
+    except ValueError:
+        return jsonify({"error": "Invalid limit"}), 400
+
+    try:
+        conn, cursor = get_dict_cursor()
+        collab_graph.ensure_loaded(cursor)
+
+        candidates = collab_graph.second_degree(user_id)[:limit]
+        names = user_names(cursor, [other for other, _ in candidates])
+
+        return jsonify({
+            "user_id": user_id,
+            "collaborators": [
+                {"user_id": other, "name": names.get(other), "mutual_collaborators": mutual}
+                for other, mutual in candidates
+            ],
+        }), 200
+
+    except Exception:
+        current_app.logger.exception("Error listing second-degree collaborators")
+        return jsonify({"error": "Failed to list collaborators"}), 500
+
+
+@creator_bp.get("/users/<int:user_id>/recommended-collaborators")
+def list_recommended_collaborators(user_id):
+    """
+    Creators this user has not worked with yet, ranked by overlap in
+    styles, tools and market plus shared collaborators
+    (backend.ml_models.collab_recommender).
+    Query: ?limit=10
+    """
+    try:
+        limit = parse_limit(request.args.get("limit"), default=10, maximum=50)
+    except ValueError:
+        return jsonify({"error": "Invalid limit"}), 400
+
+    try:
+        conn, cursor = get_dict_cursor()
+        collab_graph.ensure_loaded(cursor)
+        collaborator_recommender.ensure_fitted(cursor)
+
+        recommendations = collaborator_recommender.recommend(user_id, limit)
+        if recommendations is None:
+            return jsonify({"error": "Creator not found"}), 404
+
+        return jsonify({"user_id": user_id, "recommendations": recommendations}), 200
+
+    except Exception:
+        current_app.logger.exception("Error recommending collaborators")
+        return jsonify({"error": "Failed to recommend collaborators"}), 500
+
+
+@creator_bp.get("/users/<int:user_id>/shared-projects/<int:other_id>")
+def list_shared_projects(user_id, other_id):
+    """
+    Projects both users hold a credit on.
+    """
+    try:
+        conn, cursor = get_dict_cursor()
+        collab_graph.ensure_loaded(cursor)
+
+        project_ids = collab_graph.shared_projects(user_id, other_id)
+        projects = []
+        if project_ids:
+            placeholders = ", ".join(["%s"] * len(project_ids))
+            cursor.execute(
+                f"""
+                SELECT project_id, portfolio_id, title, description,
+                       tags, visibility, is_archived, created_at
+                FROM Projects
+                WHERE project_id IN ({placeholders})
+                ORDER BY created_at DESC
+                """,
+                project_ids,
+            )
+            projects = cursor.fetchall()
+
+        return jsonify({"user_ids": [user_id, other_id], "projects": projects}), 200
+
+    except Exception:
+        current_app.logger.exception("Error listing shared projects")
+        return jsonify({"error": "Failed to list shared projects"}), 500
+
+
+@creator_bp.get("/collaboration-path")
+def get_collaboration_path():
+    """
+    Shortest chain of collaborations linking two users.
+    Query: ?from=#&to=#&max_hops=6
+    Response: the users along the path and the project behind each hop.
+    """
+    try:
+        source = int(request.args["from"])
+        target = int(request.args["to"])
+        max_hops = min(int(request.args.get("max_hops", 6)), 10)
+    except (KeyError, ValueError):
+        return jsonify({"error": "Query parameters from and to must be user ids"}), 400
+
+    try:
+        conn, cursor = get_dict_cursor()
+        collab_graph.ensure_loaded(cursor)
+
+        found = collab_graph.shortest_path(source, target, max_hops=max_hops)
+        if not found:
+            return jsonify({"error": "No collaboration path found"}), 404
+
+        path, projects = found
+        names = user_names(cursor, path)
+
+        return jsonify({
+            "hops": len(projects),
+            "path": [{"user_id": user, "name": names.get(user)} for user in path],
+            "projects": projects,
+        }), 200
+
+    except Exception:
+        current_app.logger.exception("Error finding collaboration path")
+        return jsonify({"error": "Failed to find collaboration path"}), 500
+
+
 # PROJECT CREDITS NESTED
 
 @creator_bp.get("/projects/<int:project_id>/credits")
@@ -837,7 +1743,11 @@ def add_project_credit(project_id):
             (project_id, user_id, role, verified),
         )
         credit_id = cursor.lastrowid
+        record_momentum_event(cursor, user_id, "credit_verified" if verified else "credit")
+        refresh_credit_stats(cursor, project_ids=[project_id])
         conn.commit()
+        invalidate_portfolio_rows(("project", project_id))
+        collab_graph.add_credit(user_id, project_id)
 
         cursor.execute(
             """
@@ -860,6 +1770,154 @@ def add_project_credit(project_id):
         return jsonify({"error": "Failed to add project credit"}), 500
 
 
+CREDIT_BATCH_MAX = 500
+
+
+@creator_bp.post("/projects/<int:project_id>/credits/batch")
+def add_project_credits_batch(project_id):
+    """
+    Add a whole crew list to a project in one transaction.
+    Request: {"credits": [{"user_id": 1, "role": "Editor", "verified": false}, ...]}
+    Response: created rows, plus the input rows that were skipped as
+    duplicates of an existing (or earlier) (user_id, role) on this project
+    and those rejected as invalid or unknown users.
+    """
+    data = request.get_json(silent=True) or {}
+    credits = data.get("credits")
+
+    if not isinstance(credits, list) or not credits:
+        return jsonify({"error": "credits must be a non-empty list"}), 400
+    if len(credits) > CREDIT_BATCH_MAX:
+        return jsonify({"error": f"Too many credits (max {CREDIT_BATCH_MAX})"}), 400
+
+    rows = []
+    invalid = []
+    for index, credit in enumerate(credits):
+        user_id = credit.get("user_id") if isinstance(credit, dict) else None
+        if isinstance(user_id, bool) or not isinstance(user_id, int) or user_id <= 0:
+            invalid.append({"index": index, "error": "user_id must be a positive integer"})
+            continue
+        role = credit.get("role")
+        if role is not None and not isinstance(role, str):
+            invalid.append({"index": index, "error": "role must be a string"})
+            continue
+        role = (role or "").strip() or None
+        if role and len(role) > 255:
+            invalid.append({"index": index, "error": "role is longer than 255 characters"})
+            continue
+        rows.append({
+            "index": index,
+            "user_id": user_id,
+            "role": role,
+            "verified": bool(credit.get("verified", False)),
+        })
+
+    try:
+        conn, cursor = get_dict_cursor()
+
+        # lock the project so concurrent batches cannot both insert a credit
+        cursor.execute(
+            "SELECT project_id FROM Projects WHERE project_id = %s FOR UPDATE",
+            (project_id,),
+        )
+        if cursor.fetchone() is None:
+            conn.rollback()
+            return jsonify({"error": "Project not found"}), 404
+
+        user_ids = sorted({row["user_id"] for row in rows})
+        known = set()
+        seen = set()
+        if user_ids:
+            placeholders = ", ".join(["%s"] * len(user_ids))
+            cursor.execute(
+                f"SELECT user_id FROM Users WHERE user_id IN ({placeholders}) AND is_active = TRUE",
+                user_ids,
+            )
+            known = {row["user_id"] for row in cursor.fetchall()}
+
+            cursor.execute(
+                f"""
+                SELECT user_id, role
+                FROM ProjectCredits
+                WHERE project_id = %s AND user_id IN ({placeholders})
+                """,
+                [project_id] + user_ids,
+            )
+            seen = {(row["user_id"], (row["role"] or "").lower()) for row in cursor.fetchall()}
+
+        to_insert = []
+        skipped = []
+        for row in rows:
+            key = (row["user_id"], (row["role"] or "").lower())
+            if row["user_id"] not in known:
+                invalid.append({"index": row["index"], "error": "Unknown or inactive user"})
+            elif key in seen:
+                skipped.append({"index": row["index"], "user_id": row["user_id"], "role": row["role"]})
+            else:
+                seen.add(key)
+                to_insert.append(row)
+
+        created = []
+        if to_insert:
+            placeholders = ", ".join(["(%s, %s, %s, %s)"] * len(to_insert))
+            cursor.execute(
+                f"""
+                INSERT INTO ProjectCredits (project_id, user_id, role, verified)
+                VALUES {placeholders}
+                """,
+                [
+                    value
+                    for row in to_insert
+                    for value in (project_id, row["user_id"], row["role"], row["verified"])
+                ],
+            )
+            record_momentum_events(
+                cursor,
+                [
+                    (row["user_id"], "credit_verified" if row["verified"] else "credit")
+                    for row in to_insert
+                ],
+            )
+            # read the new rows back by (user_id, role): the project is
+            # locked and those pairs were not on it before, while the ids
+            # of a multi-row INSERT need not be consecutive
+            # (a NULL role is left out of the JSON so JSON_TABLE yields NULL)
+            cursor.execute(
+                """
+                SELECT c.credit_id, c.project_id, c.user_id, c.role, c.verified, c.created_at
+                FROM ProjectCredits c
+                JOIN JSON_TABLE(%s, '$[*]' COLUMNS (
+                         user_id INT          PATH '$.user_id',
+                         role    VARCHAR(255) PATH '$.role'
+                     )) j ON j.user_id = c.user_id AND j.role <=> c.role
+                WHERE c.project_id = %s
+                ORDER BY c.credit_id
+                """,
+                (
+                    json.dumps([
+                        {"user_id": row["user_id"], **({"role": row["role"]} if row["role"] else {})}
+                        for row in to_insert
+                    ]),
+                    project_id,
+                ),
+            )
+            created = cursor.fetchall()
+            refresh_credit_stats(cursor, project_ids=[project_id])
+
+        conn.commit()
+        if created:
+            invalidate_portfolio_rows(("project", project_id))
+            for row in to_insert:
+                collab_graph.add_credit(row["user_id"], project_id)
+
+        invalid.sort(key=lambda row: row["index"])
+        return jsonify({"created": created, "skipped": skipped, "invalid": invalid}), 201 if created else 200
+
+    except Exception:
+        current_app.logger.exception("Error adding project credits")
+        return jsonify({"error": "Failed to add project credits"}), 500
+
+
 @creator_bp.put("/projects/<int:project_id>/credits/<int:credit_id>")
 def update_project_credit(project_id, credit_id):
     """
@@ -874,6 +1932,11 @@ def update_project_credit(project_id, credit_id):
 
     try:
         conn, cursor = get_dict_cursor()
+        credit = lock_credit(cursor, credit_id, project_id)
+        if credit is None:
+            conn.rollback()
+            return jsonify({"error": "Credit not found for this project"}), 404
+
         cursor.execute(
             """
             UPDATE ProjectCredits
@@ -886,10 +1949,15 @@ def update_project_credit(project_id, credit_id):
             (role, verified, credit_id, project_id),
         )
 
-        if cursor.rowcount == 0:
-            return jsonify({"error": "Credit not found for this project"}), 404
-
+        if verified is not None:
+            cursor.execute(
+                "SELECT verified FROM ProjectCredits WHERE credit_id = %s",
+                (credit_id,),
+            )
+            adjust_credit_momentum(cursor, credit, verified=cursor.fetchone()["verified"])
+            refresh_credit_stats(cursor, user_ids=[credit["user_id"]])
         conn.commit()
+        invalidate_portfolio_rows(("project", project_id))
 
         cursor.execute(
             """
@@ -919,6 +1987,11 @@ def delete_project_credit(project_id, credit_id):
     """
     try:
         conn, cursor = get_dict_cursor()
+        credit = lock_credit(cursor, credit_id, project_id)
+        if credit is None:
+            conn.rollback()
+            return jsonify({"error": "Credit not found for this project"}), 404
+
         cursor.execute(
             """
             DELETE FROM ProjectCredits
@@ -927,11 +2000,12 @@ def delete_project_credit(project_id, credit_id):
             """,
             (credit_id, project_id),
         )
+        adjust_credit_momentum(cursor, credit, deleted=True)
 
-        if cursor.rowcount == 0:
-            return jsonify({"error": "Credit not found for this project"}), 404
-
+        refresh_credit_stats(cursor, user_ids=[credit["user_id"]], project_ids=[project_id])
         conn.commit()
+        invalidate_portfolio_rows(("project", project_id))
+        collab_graph.remove_credit(credit["user_id"], project_id)
         return jsonify({"message": "Project credit deleted"}), 200
 
     except Exception:
@@ -940,6 +2014,53 @@ def delete_project_credit(project_id, credit_id):
 
 
 # PROJECT MEDIA
+# Galleries are ordered by ProjectMedia.sort_key, spaced MEDIA_KEY_GAP
+# apart. Moving an item gives it the midpoint of its new neighbours' keys,
+# a single-row write; only when two neighbours' keys are adjacent is the
+# whole gallery renumbered. sort_key is the only stored order: sort_order
+# is the item's 1-based position, numbered from sort_key at read time.
+# Writers that take a sort_order (add, bulk update) work out the new
+# gallery order and renumber it MEDIA_KEY_GAP apart in one UPDATE.
+MEDIA_KEY_GAP = 1 << 16
+
+
+def parse_position(value):
+    """A 1-based gallery position, or ValueError."""
+    if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+        raise ValueError("sort_order must be a positive integer")
+    return value
+
+
+def order_with_positions(order, positions):
+    """
+    The media ids in `order` (current gallery order) with each id in
+    `positions` ({media_id: 1-based position}) moved to that position;
+    the others keep their relative order and positions past the end go
+    last.
+    """
+    placed = sorted(positions, key=positions.get)
+    rest = [media_id for media_id in order if media_id not in positions]
+    result = []
+    while placed or rest:
+        if placed and (not rest or positions[placed[0]] <= len(result) + 1):
+            result.append(placed.pop(0))
+        else:
+            result.append(rest.pop(0))
+    return result
+
+
+def media_keys_for(order, keys):
+    """
+    {media_id: new sort_key} spacing `order` MEDIA_KEY_GAP apart, or {}
+    when `order` is already the order of `keys` ({media_id: sort_key}).
+    """
+    if order == sorted(keys, key=lambda media_id: (keys[media_id], media_id)):
+        return {}
+    return {
+        media_id: (position + 1) * MEDIA_KEY_GAP
+        for position, media_id in enumerate(order)
+        if keys.get(media_id) != (position + 1) * MEDIA_KEY_GAP
+    }
 
 @creator_bp.get("/projects/<int:project_id>/media")
 def list_project_media(project_id):
@@ -954,18 +2075,20 @@ def list_project_media(project_id):
                 media_id,
                 project_id,
                 media_url,
+                blob_id,
                 media_type,
                 caption,
                 alt_text,
-                sort_order,
+                ROW_NUMBER() OVER (ORDER BY sort_key, media_id) AS sort_order,
+                sort_key,
                 created_at
             FROM ProjectMedia
             WHERE project_id = %s
-            ORDER BY sort_order ASC, created_at ASC
+            ORDER BY sort_key ASC, media_id ASC
             """,
             (project_id,),
         )
-        return jsonify({"media": cursor.fetchall()}), 200
+        return jsonify({"media": attach_renditions(cursor, cursor.fetchall())}), 200
 
     except Exception:
         current_app.logger.exception("Error listing project media")
@@ -976,120 +2099,400 @@ def list_project_media(project_id):
 def add_project_media(project_id):
     """
     Matrix: POST /creator/projects/{projectID}/media
+    Media is either an external media_url or the blob_id of a file
+    uploaded with POST /media. New media goes to the end of the gallery
+    unless sort_order (1-based position) says otherwise.
     """
     data = request.get_json(silent=True) or {}
     media_url = data.get("media_url")
+    blob_id = data.get("blob_id")
     media_type = data.get("media_type")
     caption = data.get("caption")
     alt_text = data.get("alt_text")
-    sort_order = data.get("sort_order", 0)
 
-    if not media_url:
-        return jsonify({"error": "Missing required field: media_url"}), 400
+    if not (media_url or blob_id):
+        return jsonify({"error": "Missing required field: media_url or blob_id"}), 400
+    sort_order = data.get("sort_order")
+    if sort_order is not None:
+        try:
+            sort_order = parse_position(sort_order)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
     try:
         conn, cursor = get_dict_cursor()
+
+        keys = None
+        if sort_order is not None:
+            # serialise with moves and bulk reorders of this gallery
+            cursor.execute(
+                "SELECT project_id FROM Projects WHERE project_id = %s FOR UPDATE",
+                (project_id,),
+            )
+            if cursor.fetchone() is None:
+                conn.rollback()
+                return jsonify({"error": "Project not found"}), 404
+            cursor.execute(
+                "SELECT media_id, sort_key FROM ProjectMedia WHERE project_id = %s",
+                (project_id,),
+            )
+            keys = {row["media_id"]: row["sort_key"] for row in cursor.fetchall()}
+
+        blob = None
+        if blob_id is not None:
+            blob = blob_info(cursor, blob_id)
+            if blob is None:
+                return jsonify({"error": "Unknown blob_id"}), 400
+            media_url = blob_media_url(blob_id)
         cursor.execute(
             """
             INSERT INTO ProjectMedia (
-                project_id, media_url, media_type,
-                caption, alt_text, sort_order
+                project_id, media_url, blob_id, media_type,
+                caption, alt_text, sort_key
             )
-            VALUES (%s, %s, %s, %s, %s, %s)
+            SELECT %s, %s, %s, %s, %s, %s, COALESCE(MAX(sort_key), 0) + %s
+            FROM ProjectMedia
+            WHERE project_id = %s
             """,
-            (project_id, media_url, media_type, caption, alt_text, sort_order),
+            (
+                project_id, media_url, blob_id, media_type, caption, alt_text,
+                MEDIA_KEY_GAP, project_id,
+            ),
         )
         media_id = cursor.lastrowid
+        if keys is not None:
+            order = sorted(keys, key=lambda other: (keys[other], other)) + [media_id]
+            keys[media_id] = max(keys.values(), default=0) + MEDIA_KEY_GAP
+            set_media_keys(
+                cursor, project_id,
+                media_keys_for(order_with_positions(order, {media_id: sort_order}), keys),
+            )
         conn.commit()
+        invalidate_portfolio_rows(("project", project_id))
+        # thumbnails are made in the background; listings use the original
+        # until they are ready
+        if blob is not None and blob["rendition_status"] == "pending":
+            rendition_pool.submit(current_app._get_current_object(), blob_id)
 
         cursor.execute(
             """
-            SELECT
-                media_id,
-                project_id,
-                media_url,
-                media_type,
-                caption,
-                alt_text,
-                sort_order,
-                created_at
-            FROM ProjectMedia
+            SELECT *
+            FROM (
+                SELECT
+                    media_id,
+                    project_id,
+                    media_url,
+                    blob_id,
+                    media_type,
+                    caption,
+                    alt_text,
+                    ROW_NUMBER() OVER (ORDER BY sort_key, media_id) AS sort_order,
+                    sort_key,
+                    created_at
+                FROM ProjectMedia
+                WHERE project_id = %s
+            ) m
             WHERE media_id = %s
             """,
-            (media_id,),
+            (project_id, media_id),
         )
-        return jsonify(cursor.fetchone()), 201
+        return jsonify(attach_renditions(cursor, [cursor.fetchone()])[0]), 201
 
     except Exception:
         current_app.logger.exception("Error adding project media")
         return jsonify({"error": "Failed to add media"}), 500
 
 
+MEDIA_BULK_MAX_ITEMS = 1000
+MEDIA_FIELDS = ("sort_order", "caption", "alt_text")
+
+
+def parse_media_item(item):
+    """
+    (media_id, {field: value}) for one bulk item, or (media_id, error).
+    Fields left out or null are not changed.
+    """
+    if not isinstance(item, dict):
+        return None, "item must be an object"
+    media_id = item.get("media_id")
+    if not isinstance(media_id, int) or isinstance(media_id, bool) or media_id <= 0:
+        return media_id, "media_id must be a positive integer"
+
+    changes = {field: item[field] for field in MEDIA_FIELDS if item.get(field) is not None}
+    if not changes:
+        return media_id, "no fields to update"
+    if "sort_order" in changes:
+        try:
+            parse_position(changes["sort_order"])
+        except ValueError as e:
+            return media_id, str(e)
+    for field in ("caption", "alt_text"):
+        if field in changes and not isinstance(changes[field], str):
+            return media_id, f"{field} must be a string"
+    if len(changes.get("alt_text", "")) > 255:
+        return media_id, "alt_text is longer than 255 characters"
+    return media_id, changes
+
+
 @creator_bp.put("/projects/<int:project_id>/media")
 def bulk_update_project_media(project_id):
     """
     Matrix: PUT /creator/projects/{projectID}/media
-    Simple bulk update for sort order or captions.
+    Bulk update for sort order (1-based position), captions and alt text.
     Request body example:
     {
       "items": [
         {"media_id": 1, "sort_order": 1},
-        {"media_id": 2, "sort_order": 2}
+        {"media_id": 2, "sort_order": 2, "caption": "Opening shot"}
       ]
     }
+    Items given a sort_order move to that position; the rest of the
+    gallery keeps its relative order around them.
+    Response: one result per item, in request order, with status
+    updated | unchanged | not_found | invalid (plus an error for invalid).
+
+    Two statements however many items: one locking read of the gallery,
+    then one UPDATE joined to the new captions/alt text and sort_keys
+    unpacked with JSON_TABLE.
     """
     data = request.get_json(silent=True) or {}
     items = data.get("items")
 
-    if not items:
+    if not items or not isinstance(items, list):
         return jsonify({"error": "Nothing to update"}), 400
+    if len(items) > MEDIA_BULK_MAX_ITEMS:
+        return jsonify({"error": f"Too many items (max {MEDIA_BULK_MAX_ITEMS})"}), 400
+
+    results = []
+    changes_by_id = {}
+    for item in items:
+        media_id, changes = parse_media_item(item)
+        if isinstance(changes, str):
+            results.append({"media_id": media_id, "status": "invalid", "error": changes})
+        elif media_id in changes_by_id:
+            results.append({"media_id": media_id, "status": "invalid", "error": "duplicate media_id"})
+        else:
+            changes_by_id[media_id] = changes
+            results.append({"media_id": media_id, "status": None})
 
     try:
         conn, cursor = get_dict_cursor()
 
-        for item in items:
-            media_id = item.get("media_id")
-            sort_order = item.get("sort_order")
-            caption = item.get("caption")
-            alt_text = item.get("alt_text")
-
-            if not media_id:
+        current = {}
+        if changes_by_id:
+            # the whole gallery: new positions shift the items around them
+            cursor.execute(
+                """
+                SELECT p.project_id, m.media_id, m.sort_key, m.caption, m.alt_text
+                FROM Projects p
+                LEFT JOIN ProjectMedia m ON m.project_id = p.project_id
+                WHERE p.project_id = %s
+                FOR UPDATE
+                """,
+                (project_id,),
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                conn.rollback()
+                return jsonify({"error": "Project not found"}), 404
+            current = {row["media_id"]: row for row in rows if row["media_id"] is not None}
+
+        keys = {media_id: row["sort_key"] for media_id, row in current.items()}
+        order = sorted(keys, key=lambda media_id: (keys[media_id], media_id))
+        new_order = order_with_positions(order, {
+            media_id: changes["sort_order"]
+            for media_id, changes in changes_by_id.items()
+            if media_id in current and "sort_order" in changes
+        })
+        new_keys = media_keys_for(new_order, keys)
+        old_positions = {media_id: position for position, media_id in enumerate(order, 1)}
+        new_positions = {media_id: position for position, media_id in enumerate(new_order, 1)}
+
+        to_apply = {}
+        for result in results:
+            if result["status"] is not None:
+                continue
+            media_id = result["media_id"]
+            row = current.get(media_id)
+            if row is None:
+                result["status"] = "not_found"
                 continue
+            fields = {
+                field: value for field, value in changes_by_id[media_id].items()
+                if field != "sort_order" and row[field] != value
+            }
+            moved = new_positions[media_id] != old_positions[media_id]
+            result["status"] = "updated" if fields or moved else "unchanged"
+            if fields:
+                to_apply[media_id] = dict(fields, media_id=media_id)
+        for media_id, sort_key in new_keys.items():
+            to_apply.setdefault(media_id, {"media_id": media_id})["sort_key"] = sort_key
+
+        if to_apply:
+            cursor.execute(
+                """
+                UPDATE ProjectMedia m
+                JOIN JSON_TABLE(%s, '$[*]' COLUMNS (
+                         media_id INT          PATH '$.media_id',
+                         sort_key BIGINT       PATH '$.sort_key',
+                         caption  TEXT         PATH '$.caption',
+                         alt_text VARCHAR(255) PATH '$.alt_text'
+                     )) j ON j.media_id = m.media_id
+                SET m.sort_key = COALESCE(j.sort_key, m.sort_key),
+                    m.caption  = COALESCE(j.caption, m.caption),
+                    m.alt_text = COALESCE(j.alt_text, m.alt_text)
+                WHERE m.project_id = %s
+                """,
+                (json.dumps(list(to_apply.values())), project_id),
+            )
 
-            updates = []
-            params = []
+        conn.commit()
+        if to_apply:
+            invalidate_portfolio_rows(("project", project_id))
 
-            if sort_order is not None:
-                updates.append("sort_order = %s")
-                params.append(sort_order)
-            if caption is not None:
-                updates.append("caption = %s")
-                params.append(caption)
-            if alt_text is not None:
-                updates.append("alt_text = %s")
-                params.append(alt_text)
+        counts = {}
+        for result in results:
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+        return jsonify({"message": "Media updated", "counts": counts, "results": results}), 200
+
+    except Exception:
+        current_app.logger.exception("Error bulk updating media")
+        return jsonify({"error": "Failed to update media"}), 500
 
-            if not updates:
-                continue
 
-            params.extend([media_id, project_id])
+def rebalance_media_keys(cursor, project_id, media_ids):
+    """Renumber a gallery's sort_keys MEDIA_KEY_GAP apart, in the given order."""
+    set_media_keys(cursor, project_id, {
+        media_id: (position + 1) * MEDIA_KEY_GAP
+        for position, media_id in enumerate(media_ids)
+    })
+
+
+def set_media_keys(cursor, project_id, keys):
+    """Write {media_id: sort_key} for one gallery in a single UPDATE."""
+    if not keys:
+        return
+    keys = [{"media_id": media_id, "sort_key": sort_key} for media_id, sort_key in keys.items()]
+    cursor.execute(
+        """
+        UPDATE ProjectMedia m
+        JOIN JSON_TABLE(%s, '$[*]' COLUMNS (
+                 media_id INT    PATH '$.media_id',
+                 sort_key BIGINT PATH '$.sort_key'
+             )) j ON j.media_id = m.media_id
+        SET m.sort_key = j.sort_key
+        WHERE m.project_id = %s
+        """,
+        (json.dumps(keys), project_id),
+    )
+
+
+@creator_bp.post("/projects/<int:project_id>/media/<int:media_id>/move")
+def move_project_media(project_id, media_id):
+    """
+    Move one gallery item next to a sibling.
+    Body: {"before": siblingMediaID} or {"after": siblingMediaID}
+    Response: the item's new sort_key and whether the gallery had to be
+    renumbered to make room.
+    """
+    data = request.get_json(silent=True) or {}
+    placements = [key for key in ("before", "after") if data.get(key) is not None]
+    if len(placements) != 1:
+        return jsonify({"error": "Provide exactly one of before or after"}), 400
+    placement = placements[0]
+    try:
+        anchor_id = int(data[placement])
+    except (TypeError, ValueError):
+        return jsonify({"error": f"{placement} must be a media id"}), 400
+    if anchor_id == media_id:
+        return jsonify({"error": "Cannot move an item relative to itself"}), 400
+
+    try:
+        conn, cursor = get_dict_cursor()
 
+        # serialise moves within one gallery
+        cursor.execute(
+            "SELECT project_id FROM Projects WHERE project_id = %s FOR UPDATE",
+            (project_id,),
+        )
+        if cursor.fetchone() is None:
+            conn.rollback()
+            return jsonify({"error": "Project not found"}), 404
+
+        cursor.execute(
+            """
+            SELECT media_id, sort_key
+            FROM ProjectMedia
+            WHERE project_id = %s AND media_id IN (%s, %s)
+            """,
+            (project_id, media_id, anchor_id),
+        )
+        keys = {row["media_id"]: row["sort_key"] for row in cursor.fetchall()}
+        if media_id not in keys or anchor_id not in keys:
+            conn.rollback()
+            return jsonify({"error": "Media not found for this project"}), 404
+        anchor_key = keys[anchor_id]
+
+        # the item currently on the other side of the anchor
+        if placement == "before":
+            condition = "(sort_key < %s OR (sort_key = %s AND media_id < %s))"
+            order = "sort_key DESC, media_id DESC"
+        else:
+            condition = "(sort_key > %s OR (sort_key = %s AND media_id > %s))"
+            order = "sort_key ASC, media_id ASC"
+        cursor.execute(
+            f"""
+            SELECT media_id, sort_key
+            FROM ProjectMedia
+            WHERE project_id = %s AND media_id <> %s AND {condition}
+            ORDER BY {order}
+            LIMIT 1
+            """,
+            (project_id, media_id, anchor_key, anchor_key, anchor_id),
+        )
+        neighbour = cursor.fetchone()
+
+        if placement == "before":
+            low = neighbour["sort_key"] if neighbour else anchor_key - 2 * MEDIA_KEY_GAP
+            high = anchor_key
+        else:
+            low = anchor_key
+            high = neighbour["sort_key"] if neighbour else anchor_key + 2 * MEDIA_KEY_GAP
+
+        rebalanced = high - low < 2
+        if not rebalanced:
+            new_key = (low + high) // 2
             cursor.execute(
-                f"""
-                UPDATE ProjectMedia
-                SET {", ".join(updates)}
-                WHERE media_id = %s
-                  AND project_id = %s
+                "UPDATE ProjectMedia SET sort_key = %s WHERE media_id = %s",
+                (new_key, media_id),
+            )
+        else:
+            cursor.execute(
+                """
+                SELECT media_id
+                FROM ProjectMedia
+                WHERE project_id = %s AND media_id <> %s
+                ORDER BY sort_key ASC, media_id ASC
                 """,
-                params,
+                (project_id, media_id),
             )
+            order_ids = [row["media_id"] for row in cursor.fetchall()]
+            position = order_ids.index(anchor_id) + (placement == "after")
+            order_ids.insert(position, media_id)
+            rebalance_media_keys(cursor, project_id, order_ids)
+            new_key = (position + 1) * MEDIA_KEY_GAP
 
         conn.commit()
-        return jsonify({"message": "Media updated"}), 200
+        invalidate_portfolio_rows(("project", project_id))
+        return jsonify({
+            "media_id": media_id,
+            "sort_key": new_key,
+            "rebalanced": rebalanced,
+        }), 200
 
     except Exception:
-        current_app.logger.exception("Error bulk updating media")
-        return jsonify({"error": "Failed to update media"}), 500
+        current_app.logger.exception("Error moving media")
+        return jsonify({"error": "Failed to move media"}), 500
 
 
 @creator_bp.delete("/projects/<int:project_id>/media/<int:media_id>")
@@ -1112,6 +2515,7 @@ def delete_project_media(project_id, media_id):
             return jsonify({"error": "Media not found for this project"}), 404
 
         conn.commit()
+        invalidate_portfolio_rows(("project", project_id))
         return jsonify({"message": "Media deleted"}), 200
 
     except Exception:
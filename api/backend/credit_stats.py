@@ -0,0 +1,115 @@
+#------------------------------------------------------------
+# Per-user credit statistics
+#------------------------------------------------------------
+# CreditStats holds, per user: total credits, verified credits, distinct
+# projects credited on and distinct collaborators (other users credited
+# on any of those projects). The credit handlers in creator_routes call
+# refresh_credit_stats() inside the same transaction as the credit write
+# with the users whose numbers can have changed: the credited user and,
+# because collaborator counts are symmetric, everyone else on the
+# project. Each refresh recomputes just those rows from ProjectCredits
+# (idx_projectcredits_user_project / idx_projectcredits_project_user),
+# so the counts stay exact without rescanning the table.
+# rebuild_credit_stats() recomputes every row window by window.
+import json
+
+from backend.jobs import throttle
+
+STATS_FIELDS = ("total_credits", "verified_credits", "projects", "collaborators")
+
+# INSERT ... SELECT cannot take a row alias, so the fresh numbers come
+# from a derived table whose column names differ from CreditStats'
+_REFRESH_SQL = """
+    INSERT INTO CreditStats (user_id, total_credits, verified_credits, projects, collaborators)
+    SELECT * FROM (
+        SELECT ids.user_id AS stats_user_id,
+               COUNT(c.credit_id) AS new_total,
+               COALESCE(SUM(c.verified), 0) AS new_verified,
+               COUNT(DISTINCT c.project_id) AS new_projects,
+               (SELECT COUNT(DISTINCT other.user_id)
+                FROM ProjectCredits mine
+                JOIN ProjectCredits other
+                  ON other.project_id = mine.project_id
+                 AND other.user_id <> mine.user_id
+                WHERE mine.user_id = ids.user_id) AS new_collaborators
+        FROM JSON_TABLE(%s, '$[*]' COLUMNS (user_id INT PATH '$')) ids
+        LEFT JOIN ProjectCredits c ON c.user_id = ids.user_id
+        GROUP BY ids.user_id
+    ) AS fresh
+    ON DUPLICATE KEY UPDATE
+        total_credits    = new_total,
+        verified_credits = new_verified,
+        projects         = new_projects,
+        collaborators    = new_collaborators
+"""
+
+
+def refresh_credit_stats(cursor, user_ids=(), project_ids=()):
+    """
+    Recompute CreditStats for `user_ids` plus everyone credited on
+    `project_ids`. Must run inside the caller's transaction, after the
+    credit write (the caller commits).
+    """
+    users = {int(user_id) for user_id in user_ids}
+    project_ids = sorted({int(project_id) for project_id in project_ids})
+    if project_ids:
+        placeholders = ", ".join(["%s"] * len(project_ids))
+        cursor.execute(
+            f"SELECT DISTINCT user_id FROM ProjectCredits WHERE project_id IN ({placeholders})",
+            project_ids,
+        )
+        users.update(row["user_id"] for row in cursor.fetchall())
+    if users:
+        cursor.execute(_REFRESH_SQL, (json.dumps(sorted(users)),))
+    return len(users)
+
+
+def get_credit_stats(cursor, user_id):
+    cursor.execute(
+        f"SELECT {', '.join(STATS_FIELDS)} FROM CreditStats WHERE user_id = %s",
+        (user_id,),
+    )
+    return cursor.fetchone() or dict.fromkeys(STATS_FIELDS, 0)
+
+
+def rebuild_credit_stats(conn, progress, window_size=1000, pause_seconds=0.05):
+    """
+    Recompute every row, one window of user ids per transaction. Users
+    with a stats row but no credits left are reset to zero.
+    """
+    cursor = conn.cursor()
+
+    progress.update(windows=0, users_refreshed=0)
+
+    cursor.execute(
+        """
+        SELECT GREATEST(
+            COALESCE((SELECT MAX(user_id) FROM ProjectCredits), 0),
+            COALESCE((SELECT MAX(user_id) FROM CreditStats), 0)
+        ) AS max_id
+        """
+    )
+    max_id = cursor.fetchone()["max_id"]
+    conn.commit()
+
+    low = 0
+    while low <= max_id:
+        high = low + int(window_size)
+
+        cursor.execute(
+            """
+            SELECT user_id FROM ProjectCredits WHERE user_id >= %s AND user_id < %s
+            UNION
+            SELECT user_id FROM CreditStats WHERE user_id >= %s AND user_id < %s
+            """,
+            (low, high, low, high),
+        )
+        users = [row["user_id"] for row in cursor.fetchall()]
+        progress["users_refreshed"] += refresh_credit_stats(cursor, users)
+        conn.commit()
+
+        progress["windows"] += 1
+        low = high
+        throttle(pause_seconds)
+
+    return progress
@@ -0,0 +1,140 @@
+#------------------------------------------------------------
+# In-process fan-out hub for live social events
+#------------------------------------------------------------
+# Route handlers publish an event after their commit succeeds and every
+# connected subscriber (SSE stream or long-poll request) that is allowed
+# to see it gets a copy in its own bounded queue. A short backlog of
+# recent events lets clients resume from a Last-Event-ID.
+#
+# This lives inside the API process, so it only fans out to clients of
+# the same process -- which is how the API runs in docker-compose.
+import itertools
+import queue
+import threading
+from collections import deque
+
+
+class Subscription:
+    """
+    One connected client. Events are queued until the client reads them;
+    if the client falls too far behind, the queue is dropped and the
+    subscription is flagged so the client can do a one-off full reload.
+    """
+
+    def __init__(self, user_id, max_pending):
+        self.user_id = str(user_id) if user_id is not None else None
+        self.lagged = False
+        self._queue = queue.Queue(maxsize=max_pending)
+
+    def can_see(self, event):
+        audience = event["audience"]
+        return audience is None or self.user_id in audience
+
+    def offer(self, event):
+        if not self.can_see(event):
+            return
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.lagged = True
+            self._drain()
+
+    def get(self, timeout):
+        """Return the next event, or None if nothing arrived in time."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def get_nowait_all(self):
+        events = []
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _drain(self):
+        self.get_nowait_all()
+
+
+class EventHub:
+    def __init__(self, backlog_size=1000, max_pending=256):
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._backlog = deque(maxlen=backlog_size)
+        self._subscribers = set()
+        self._max_pending = max_pending
+
+    def publish(self, event_type, data, audience=None):
+        """
+        Fan an event out to all subscribers.
+        audience: None for a public event, otherwise the user ids that
+        may receive it (e.g. sender and receiver of a message).
+        """
+        if audience is not None:
+            audience = frozenset(str(user_id) for user_id in audience)
+
+        with self._lock:
+            event = {
+                "id": next(self._ids),
+                "type": event_type,
+                "data": data,
+                "audience": audience,
+            }
+            self._backlog.append(event)
+            subscribers = list(self._subscribers)
+
+        for subscriber in subscribers:
+            subscriber.offer(event)
+
+        return event["id"]
+
+    def subscribe(self, user_id, last_event_id=None):
+        """
+        Register a subscriber. If last_event_id is given, events after it
+        that are still in the backlog are queued first so nothing is missed.
+        """
+        subscription = Subscription(user_id, self._max_pending)
+
+        with self._lock:
+            if last_event_id is not None:
+                for event in self._backlog:
+                    if event["id"] > last_event_id:
+                        subscription.offer(event)
+            self._subscribers.add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def events_since(self, user_id, last_event_id):
+        """
+        Backlog events after last_event_id visible to user_id.
+        Returns (events, complete); complete is False when the backlog no
+        longer reaches back to last_event_id and the client must reload.
+        """
+        probe = Subscription(user_id, max_pending=1)
+        with self._lock:
+            backlog = list(self._backlog)
+
+        complete = not backlog or backlog[0]["id"] <= last_event_id + 1
+        events = [
+            event for event in backlog
+            if event["id"] > last_event_id and probe.can_see(event)
+        ]
+        return events, complete
+
+    def latest_id(self):
+        with self._lock:
+            return self._backlog[-1]["id"] if self._backlog else 0
+
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+
+# shared hub for the API process
+hub = EventHub()
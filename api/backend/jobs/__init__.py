@@ -0,0 +1,136 @@
+#------------------------------------------------------------
+# Background maintenance jobs
+#------------------------------------------------------------
+# Jobs are plain functions with the signature
+#     job(conn, progress, **params)
+# They get their own DB connection (not the request's), run in a daemon
+# thread inside an app context, and report what they did by updating the
+# `progress` dict. Admin routes start them and expose their status.
+import inspect
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from backend.db_connection import db
+
+
+class JobAlreadyRunning(Exception):
+    pass
+
+
+class JobRunner:
+    def __init__(self, history_size=10):
+        self._lock = threading.Lock()
+        self._history_size = history_size
+        self._runs = {}
+
+    def start(self, app, name, func, params=None):
+        """
+        Start `func` in the background under `name`.
+        Only one run per job name at a time; raises JobAlreadyRunning.
+        Unknown params are ignored so callers can pass request JSON through.
+        """
+        accepted = inspect.signature(func).parameters
+        params = {
+            key: value for key, value in (params or {}).items()
+            if key in accepted and key not in ("conn", "progress")
+        }
+
+        with self._lock:
+            history = self._runs.setdefault(name, deque(maxlen=self._history_size))
+            if history and history[-1]["status"] == "running":
+                raise JobAlreadyRunning(name)
+
+            run = {
+                "job": name,
+                "status": "running",
+                "params": params,
+                "progress": {},
+                "error": None,
+                "started_at": datetime.now(),
+                "finished_at": None,
+                "duration_seconds": None,
+            }
+            history.append(run)
+
+        thread = threading.Thread(
+            target=self._run, args=(app, run, func, params),
+            name=f"job-{name}", daemon=True,
+        )
+        thread.start()
+        return run
+
+    def _run(self, app, run, func, params):
+        started = time.monotonic()
+        with app.app_context():
+            conn = None
+            try:
+                conn = db.connect()
+                func(conn, run["progress"], **params)
+                run["status"] = "succeeded"
+            except Exception as exc:
+                app.logger.exception("Background job %s failed", run["job"])
+                run["status"] = "failed"
+                run["error"] = str(exc)
+            finally:
+                if conn is not None:
+                    conn.close()
+                run["finished_at"] = datetime.now()
+                run["duration_seconds"] = round(time.monotonic() - started, 3)
+                app.logger.info(
+                    "Background job %s %s: %s",
+                    run["job"], run["status"], run["progress"],
+                )
+
+    def latest(self, name):
+        with self._lock:
+            history = self._runs.get(name)
+            return dict(history[-1]) if history else None
+
+    def history(self, name):
+        with self._lock:
+            return [dict(run) for run in self._runs.get(name, ())]
+
+
+def check_params(func, params):
+    """
+    Raise ValueError unless `params` fit func's keyword parameters: no
+    unknown names, and a value of the default's type (an int is fine where
+    a float is expected, a bool never counts as a number) that is not
+    negative. Parameters defaulting to None are left to the job itself.
+    """
+    if not isinstance(params, dict):
+        raise ValueError("Job parameters must be a JSON object")
+
+    accepted = {
+        name: parameter.default
+        for name, parameter in inspect.signature(func).parameters.items()
+        if name not in ("conn", "progress")
+    }
+    unknown = sorted(set(params) - set(accepted))
+    if unknown:
+        raise ValueError(f"Unknown parameters: {', '.join(unknown)}")
+
+    for name, value in params.items():
+        default = accepted[name]
+        if isinstance(default, bool):
+            if not isinstance(value, bool):
+                raise ValueError(f"{name} must be true or false")
+        elif isinstance(default, (int, float)):
+            allowed = (int, float) if isinstance(default, float) else int
+            if isinstance(value, bool) or not isinstance(value, allowed):
+                kind = "a number" if isinstance(default, float) else "an integer"
+                raise ValueError(f"{name} must be {kind}")
+            if value < 0:
+                raise ValueError(f"{name} must not be negative")
+
+
+def throttle(seconds):
+    """Pause between batches so maintenance work yields to live traffic."""
+    if seconds and seconds > 0:
+        time.sleep(seconds)
+
+
+# shared runner for the API process
+runner = JobRunner()
@@ -0,0 +1,161 @@
+#------------------------------------------------------------
+# One-time migration: collapse duplicate likes, then enforce uniqueness
+#------------------------------------------------------------
+# Databases created before likes became idempotent can hold several
+# 'like' rows for the same (post_id, user_id) and lack the
+# uq_postinteractions_like key. This job:
+#   1. adds the like_user_id generated column and a plain helper index
+#      (both online DDL, no table copy),
+#   2. walks PostInteractions by primary-key window and deletes every
+#      like that has an older like for the same post and user,
+#   3. swaps the helper index for the unique key.
+# Each deleted like is treated like an unlike: the post's cached counts are
+# dropped and the like's momentum is taken back off the post's owner.
+# On a database built from the current schema it finds the unique key
+# already in place and does nothing.
+from pymysql.err import IntegrityError
+
+from backend.jobs import throttle
+from backend.social_routes import engagement_cache, retract_like
+
+UNIQUE_KEY = "uq_postinteractions_like"
+HELPER_INDEX = "idx_postinteractions_like_dedup"
+
+
+def _has_column(cursor, table, column):
+    cursor.execute(
+        """
+        SELECT 1 FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+          AND TABLE_NAME = %s AND COLUMN_NAME = %s
+        """,
+        (table, column),
+    )
+    return cursor.fetchone() is not None
+
+
+def _has_index(cursor, table, index):
+    cursor.execute(
+        """
+        SELECT 1 FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE()
+          AND TABLE_NAME = %s AND INDEX_NAME = %s
+        LIMIT 1
+        """,
+        (table, index),
+    )
+    return cursor.fetchone() is not None
+
+
+def _dedup_range(conn, cursor, progress, from_id, window_size, pause_seconds):
+    """Delete duplicate likes with interaction_id >= from_id; returns the max id seen."""
+    cursor.execute("SELECT COALESCE(MAX(interaction_id), 0) AS max_id FROM PostInteractions")
+    max_id = cursor.fetchone()["max_id"]
+
+    low = from_id
+    while low <= max_id:
+        high = low + window_size
+
+        # keep the oldest like per (post, user); everything newer goes.
+        # Locked so an unlike cannot remove (and retract) the same row.
+        cursor.execute(
+            """
+            SELECT d.interaction_id, d.post_id,
+                   TIMESTAMPDIFF(SECOND, d.created_at, NOW()) / 86400 AS age_days
+            FROM PostInteractions d
+            JOIN PostInteractions k
+              ON k.post_id = d.post_id
+             AND k.like_user_id = d.like_user_id
+             AND k.interaction_id < d.interaction_id
+            WHERE d.interaction_id >= %s
+              AND d.interaction_id < %s
+              AND d.like_user_id IS NOT NULL
+            FOR UPDATE OF d
+            """,
+            (low, high),
+        )
+        # one row per older like, so the same duplicate can repeat
+        duplicates = {row["interaction_id"]: row for row in cursor.fetchall()}
+
+        if duplicates:
+            placeholders = ", ".join(["%s"] * len(duplicates))
+            cursor.execute(
+                f"DELETE FROM PostInteractions WHERE interaction_id IN ({placeholders})",
+                list(duplicates),
+            )
+            progress["duplicates_deleted"] += cursor.rowcount
+
+        conn.commit()
+
+        for post_id in {row["post_id"] for row in duplicates.values()}:
+            engagement_cache.invalidate(post_id)
+        for row in duplicates.values():
+            retract_like(cursor, row["post_id"], float(row["age_days"]))
+        progress["windows"] += 1
+        progress["scanned_up_to_id"] = min(high - 1, max_id)
+
+        low = high
+        throttle(pause_seconds)
+
+    return max_id
+
+
+def dedup_likes(conn, progress, window_size=10000, pause_seconds=0.1, max_attempts=3):
+    cursor = conn.cursor()
+
+    progress.update(
+        duplicates_deleted=0,
+        windows=0,
+        scanned_up_to_id=0,
+        unique_key_added=False,
+    )
+
+    if _has_index(cursor, "PostInteractions", UNIQUE_KEY):
+        progress["already_unique"] = True
+        return progress
+
+    if not _has_column(cursor, "PostInteractions", "like_user_id"):
+        cursor.execute(
+            """
+            ALTER TABLE PostInteractions
+            ADD COLUMN like_user_id INT
+                AS (IF(interaction_type = 'like', user_id, NULL)) VIRTUAL
+            """
+        )
+
+    if not _has_index(cursor, "PostInteractions", HELPER_INDEX):
+        cursor.execute(
+            f"""
+            ALTER TABLE PostInteractions
+            ADD INDEX {HELPER_INDEX} (post_id, like_user_id),
+            ALGORITHM = INPLACE, LOCK = NONE
+            """
+        )
+
+    from_id = 0
+    for attempt in range(1, max_attempts + 1):
+        # after the first pass only rows written since then need checking
+        last_seen = _dedup_range(
+            conn, cursor, progress, from_id, int(window_size), pause_seconds
+        )
+
+        try:
+            cursor.execute(
+                f"""
+                ALTER TABLE PostInteractions
+                ADD UNIQUE KEY {UNIQUE_KEY} (post_id, like_user_id),
+                DROP INDEX {HELPER_INDEX},
+                ALGORITHM = INPLACE, LOCK = NONE
+                """
+            )
+            progress["unique_key_added"] = True
+            break
+        except IntegrityError:
+            # likes written by live traffic during the pass all have ids
+            # above the pass's upper bound; sweep just those
+            progress["attempts"] = attempt
+            from_id = last_seen + 1
+    else:
+        raise RuntimeError("Duplicate likes kept appearing; unique key not added")
+
+    return progress
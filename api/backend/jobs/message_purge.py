@@ -0,0 +1,81 @@
+#------------------------------------------------------------
+# Hard purge of messages deleted by both parties
+#------------------------------------------------------------
+# delete_message only flags the caller's side of a message. Once both
+# is_deleted_by_sender and is_deleted_by_receiver are set nobody can see
+# the row again, so this job removes it for good. It walks
+# idx_messages_purge (both flags, then the primary key) in id order and
+# deletes a bounded chunk per statement, committing and pausing between
+# chunks. Unread counters are unaffected: a message deleted by its
+# receiver is no longer counted.
+from backend.jobs import throttle
+
+
+def _table_stats(cursor):
+    # InnoDB estimates; good enough to see the table shrink between runs
+    cursor.execute(
+        """
+        SELECT TABLE_ROWS AS table_rows, DATA_LENGTH AS data_bytes,
+               INDEX_LENGTH AS index_bytes, DATA_FREE AS free_bytes
+        FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'Messages'
+        """
+    )
+    return cursor.fetchone()
+
+
+def purge_deleted_messages(conn, progress, batch_size=1000, pause_seconds=0.1):
+    cursor = conn.cursor()
+
+    progress.update(
+        messages_purged=0,
+        batches=0,
+        purged_up_to_id=0,
+        table_before=_table_stats(cursor),
+    )
+    conn.commit()
+
+    last_id = 0
+    while True:
+        cursor.execute(
+            """
+            SELECT message_id
+            FROM Messages
+            WHERE is_deleted_by_sender = TRUE
+              AND is_deleted_by_receiver = TRUE
+              AND message_id > %s
+            ORDER BY message_id
+            LIMIT %s
+            """,
+            (last_id, int(batch_size)),
+        )
+        message_ids = [row["message_id"] for row in cursor.fetchall()]
+
+        if not message_ids:
+            conn.commit()
+            break
+
+        # re-check the flags in the DELETE itself; nothing can un-delete a
+        # side today, but the purge should never depend on that
+        placeholders = ", ".join(["%s"] * len(message_ids))
+        cursor.execute(
+            f"""
+            DELETE FROM Messages
+            WHERE message_id IN ({placeholders})
+              AND is_deleted_by_sender = TRUE
+              AND is_deleted_by_receiver = TRUE
+            """,
+            message_ids,
+        )
+        progress["messages_purged"] += cursor.rowcount
+        conn.commit()
+
+        last_id = message_ids[-1]
+        progress["batches"] += 1
+        progress["purged_up_to_id"] = last_id
+        throttle(pause_seconds)
+
+    progress["table_after"] = _table_stats(cursor)
+    conn.commit()
+
+    return progress
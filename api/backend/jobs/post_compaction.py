@@ -0,0 +1,115 @@
+#------------------------------------------------------------
+# Compaction of soft-deleted posts
+#------------------------------------------------------------
+# delete_post only flags a row (is_deleted = TRUE). Once the grace period
+# has passed, this job copies the post to PostsArchive (with its final
+# engagement counts), removes its PostInteractions rows in small batches
+# and finally deletes the post from the hot table. Every step commits on
+# its own so no transaction holds locks for long, and each step is safe
+# to repeat if the job is interrupted.
+from backend.jobs import throttle
+
+
+def compact_deleted_posts(
+    conn,
+    progress,
+    grace_days=30,
+    batch_size=200,
+    interaction_batch_size=2000,
+    pause_seconds=0.2,
+):
+    cursor = conn.cursor()
+
+    progress.update(
+        posts_archived=0,
+        interactions_deleted=0,
+        batches=0,
+    )
+
+    cursor.execute("SELECT NOW() - INTERVAL %s DAY AS cutoff", (int(grace_days),))
+    cutoff = cursor.fetchone()["cutoff"]
+    progress["cutoff"] = cutoff
+
+    last_post_id = 0
+
+    while True:
+        # rows deleted before deleted_at existed have it NULL; treat them as expired
+        cursor.execute(
+            """
+            SELECT post_id
+            FROM Posts
+            WHERE is_deleted = TRUE
+              AND (deleted_at IS NULL OR deleted_at < %s)
+              AND post_id > %s
+            ORDER BY post_id
+            LIMIT %s
+            """,
+            (cutoff, last_post_id, int(batch_size)),
+        )
+        post_ids = [row["post_id"] for row in cursor.fetchall()]
+        conn.commit()
+
+        if not post_ids:
+            break
+
+        last_post_id = post_ids[-1]
+        placeholders = ", ".join(["%s"] * len(post_ids))
+
+        # 1) archive copy (idempotent, so a rerun after a crash is harmless)
+        cursor.execute(
+            f"""
+            INSERT IGNORE INTO PostsArchive (
+                post_id, user_id, media_url, blob_id, caption, tags, visibility,
+                view_count, like_count, comment_count,
+                created_at, deleted_at
+            )
+            SELECT
+                p.post_id, p.user_id, p.media_url, p.blob_id, p.caption, p.tags, p.visibility,
+                COALESCE(SUM(i.interaction_type = 'view'), 0),
+                COALESCE(SUM(i.interaction_type = 'like'), 0),
+                COALESCE(SUM(i.interaction_type = 'comment'), 0),
+                p.created_at, p.deleted_at
+            FROM Posts p
+            LEFT JOIN PostInteractions i ON i.post_id = p.post_id
+            WHERE p.post_id IN ({placeholders})
+              AND p.is_deleted = TRUE
+            GROUP BY p.post_id
+            """,
+            post_ids,
+        )
+        conn.commit()
+
+        # 2) interactions, a bounded number of rows per statement
+        while True:
+            cursor.execute(
+                f"""
+                DELETE FROM PostInteractions
+                WHERE post_id IN ({placeholders})
+                LIMIT %s
+                """,
+                post_ids + [int(interaction_batch_size)],
+            )
+            deleted = cursor.rowcount
+            conn.commit()
+
+            progress["interactions_deleted"] += deleted
+            if deleted < interaction_batch_size:
+                break
+            throttle(pause_seconds)
+
+        # 3) the posts themselves
+        cursor.execute(
+            f"""
+            DELETE FROM Posts
+            WHERE post_id IN ({placeholders})
+              AND is_deleted = TRUE
+            """,
+            post_ids,
+        )
+        progress["posts_archived"] += cursor.rowcount
+        conn.commit()
+
+        progress["batches"] += 1
+        throttle(pause_seconds)
+
+    return progress
@@ -0,0 +1,156 @@
+#------------------------------------------------------------
+# Content-addressed media store on local disk
+#------------------------------------------------------------
+# Every uploaded file is stored once, under the SHA-256 of its bytes:
+#     MEDIA_ROOT/ab/cd/abcd...  (64 hex chars)
+# so uploading the same still or clip twice costs no extra disk, and a
+# blob never changes once written -- which is what lets GET /media/{id}
+# be cached by browsers for a year. Uploads stream to a temp file while
+# they are hashed and are then renamed into place atomically, so readers
+# never see a partial blob. MediaBlobs holds each blob's content type and
+# size; Posts.blob_id and ProjectMedia.blob_id point at it.
+import hashlib
+import mimetypes
+import os
+import re
+import tempfile
+
+from flask import current_app
+
+BLOB_ID_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+CHUNK_SIZE = 1 << 20
+
+# what the feed and galleries can display
+ALLOWED_CONTENT_TYPES = {
+    "image/jpeg",
+    "image/png",
+    "image/webp",
+    "image/gif",
+    "video/mp4",
+    "video/quicktime",
+    "video/webm",
+}
+
+
+class ChecksumMismatch(Exception):
+    pass
+
+
+class EmptyBlob(Exception):
+    pass
+
+
+def is_blob_id(value):
+    return isinstance(value, str) and BLOB_ID_PATTERN.match(value) is not None
+
+
+def media_url(blob_id):
+    return f"/media/{blob_id}"
+
+
+def resolve_content_type(content_type, filename):
+    """The declared type if allowed, else one guessed from the filename, else None."""
+    if content_type not in ALLOWED_CONTENT_TYPES:
+        content_type = mimetypes.guess_type(filename or "")[0]
+    return content_type if content_type in ALLOWED_CONTENT_TYPES else None
+
+
+class MediaStore:
+    def __init__(self, root=None):
+        self._root = root
+
+    @property
+    def root(self):
+        return self._root or current_app.config["MEDIA_ROOT"]
+
+    def path(self, blob_id):
+        if not is_blob_id(blob_id):
+            raise ValueError(f"Invalid blob id: {blob_id!r}")
+        return os.path.join(self.root, blob_id[:2], blob_id[2:4], blob_id)
+
+    def exists(self, blob_id):
+        return os.path.isfile(self.path(blob_id))
+
+    def put(self, stream, expected_sha256=None):
+        """
+        Store the bytes read from `stream`.
+        Returns (blob_id, size_bytes, created); created is False when an
+        identical blob was already stored. With expected_sha256, raises
+        ChecksumMismatch (and stores nothing) if the bytes hash differently;
+        raises EmptyBlob (and stores nothing) if the stream is empty.
+        """
+        tmp_dir = os.path.join(self.root, "tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while True:
+                    chunk = stream.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+
+            if size == 0:
+                raise EmptyBlob("Empty file")
+            blob_id = digest.hexdigest()
+            if expected_sha256 is not None and blob_id != expected_sha256:
+                raise ChecksumMismatch("File checksum does not match sha256")
+            final_path = self.path(blob_id)
+            if os.path.isfile(final_path):
+                os.unlink(tmp_path)
+                return blob_id, size, False
+
+            os.makedirs(os.path.dirname(final_path), exist_ok=True)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, final_path)
+            return blob_id, size, True
+
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+def blob_info(cursor, blob_id):
+    """MediaBlobs row for blob_id, or None."""
+    if not is_blob_id(blob_id):
+        return None
+    cursor.execute(
+        """
+        SELECT blob_id, content_type, size_bytes, width, height, rendition_status, created_at
+        FROM MediaBlobs
+        WHERE blob_id = %s
+        """,
+        (blob_id,),
+    )
+    return cursor.fetchone()
+
+
+def record_blob(cursor, blob_id, content_type, size_bytes):
+    """
+    Insert the MediaBlobs row for a stored blob (caller commits).
+    Returns (content_type, known): a blob stored before keeps the content
+    type it was first uploaded with.
+    """
+    cursor.execute(
+        """
+        INSERT INTO MediaBlobs (blob_id, content_type, size_bytes)
+        VALUES (%s, %s, %s) AS new
+        ON DUPLICATE KEY UPDATE blob_id = MediaBlobs.blob_id
+        """,
+        (blob_id, content_type, size_bytes),
+    )
+    if cursor.rowcount:
+        return content_type, False
+
+    cursor.execute("SELECT content_type FROM MediaBlobs WHERE blob_id = %s", (blob_id,))
+    return cursor.fetchone()["content_type"], True
+
+
+# shared store for the API process (root comes from app config)
+media_store = MediaStore()
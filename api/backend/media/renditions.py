@@ -0,0 +1,253 @@
+#------------------------------------------------------------
+# Thumbnails and web renditions for uploaded stills
+#------------------------------------------------------------
+# Galleries should not ship the original upload for every item, so each
+# still blob gets fixed-size JPEG renditions written next to it:
+#     MEDIA_ROOT/ab/cd/<blob_id>.thumb.jpg   (fits 320 x 320)
+#     MEDIA_ROOT/ab/cd/<blob_id>.web.jpg     (fits 1600 x 1600)
+# and one MediaRenditions row per rendition with its pixel size.
+#
+# Rendering happens off the request path: add_project_media() submits the
+# blob to rendition_pool, a small thread pool (Pillow releases the GIL
+# while decoding and resampling) whose workers use their own DB
+# connection. MediaBlobs.rendition_status says where a blob stands
+# (pending, ready, skipped for clips/unsupported files, failed); blobs a
+# restart left pending are picked up by the `render-media` job.
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageOps
+
+from backend.db_connection import db
+from backend.jobs import throttle
+from backend.media import is_blob_id, media_store
+
+# name -> bounding box; largest first, each one is resized from the last
+RENDITIONS = {
+    "web": (1600, 1600),
+    "thumb": (320, 320),
+}
+RENDITION_CONTENT_TYPE = "image/jpeg"
+JPEG_QUALITY = {"web": 85, "thumb": 80}
+
+STILL_CONTENT_TYPES = {"image/jpeg", "image/png", "image/webp", "image/gif"}
+EXIF_ORIENTATION = 0x0112
+
+
+def rendition_url(blob_id, rendition):
+    return f"/media/{blob_id}/{rendition}"
+
+
+def rendition_path(blob_id, rendition):
+    return f"{media_store.path(blob_id)}.{rendition}.jpg"
+
+
+def _save_atomic(image, path, quality):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            image.save(out, "JPEG", quality=quality, optimize=True, progressive=True)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return os.path.getsize(path)
+
+
+def render_blob(blob_id):
+    """
+    Write every rendition of a still blob to disk.
+    Returns ((width, height) of the original as displayed,
+    [(rendition, width, height, size_bytes)]).
+    """
+    with Image.open(media_store.path(blob_id)) as original:
+        width, height = original.size
+        if original.getexif().get(EXIF_ORIENTATION) in (5, 6, 7, 8):
+            width, height = height, width
+        # let the JPEG decoder downscale while decoding (1/2 .. 1/8)
+        original.draft("RGB", RENDITIONS["web"])
+        image = ImageOps.exif_transpose(original)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+
+        rows = []
+        for name, box in RENDITIONS.items():
+            image.thumbnail(box, Image.Resampling.LANCZOS)
+            size_bytes = _save_atomic(image, rendition_path(blob_id, name), JPEG_QUALITY[name])
+            rows.append((name, image.width, image.height, size_bytes))
+
+    return (width, height), rows
+
+
+def process_blob(conn, blob_id):
+    """
+    Render one blob and record the result. Returns its rendition_status.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT content_type, rendition_status FROM MediaBlobs WHERE blob_id = %s",
+        (blob_id,),
+    )
+    blob = cursor.fetchone()
+    conn.commit()
+    if blob is None:
+        return None
+    if blob["rendition_status"] != "pending":
+        return blob["rendition_status"]
+
+    if blob["content_type"] not in STILL_CONTENT_TYPES:
+        status, size, rows = "skipped", (None, None), []
+    else:
+        try:
+            size, rows = render_blob(blob_id)
+            status = "ready"
+        except Exception:
+            # corrupt or truncated upload; the original is still served
+            status, size, rows = "failed", (None, None), []
+
+    if rows:
+        placeholders = ", ".join(["(%s, %s, %s, %s, %s)"] * len(rows))
+        cursor.execute(
+            f"""
+            INSERT INTO MediaRenditions (blob_id, rendition, width, height, size_bytes)
+            VALUES {placeholders} AS new
+            ON DUPLICATE KEY UPDATE
+                width = new.width,
+                height = new.height,
+                size_bytes = new.size_bytes
+            """,
+            [value for row in rows for value in (blob_id, *row)],
+        )
+    cursor.execute(
+        """
+        UPDATE MediaBlobs
+        SET rendition_status = %s, width = %s, height = %s
+        WHERE blob_id = %s
+        """,
+        (status, size[0], size[1], blob_id),
+    )
+    conn.commit()
+    return status
+
+
+class RenditionPool:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._queued = set()
+        self._listeners = []
+
+    def on_ready(self, callback):
+        """Call callback(blob_id) whenever a blob's renditions are written."""
+        self._listeners.append(callback)
+
+    def submit(self, app, blob_id):
+        """Queue a blob for rendering; a blob already queued is not queued twice."""
+        with self._lock:
+            if blob_id in self._queued:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=app.config.get("MEDIA_RENDITION_WORKERS", 2),
+                    thread_name_prefix="media-rendition",
+                )
+            self._queued.add(blob_id)
+            self._executor.submit(self._run, app, blob_id)
+
+    def notify_ready(self, blob_id):
+        for callback in self._listeners:
+            callback(blob_id)
+
+    def _run(self, app, blob_id):
+        with app.app_context():
+            conn = None
+            try:
+                conn = db.connect()
+                if process_blob(conn, blob_id) == "ready":
+                    self.notify_ready(blob_id)
+            except Exception:
+                app.logger.exception("Rendering media %s failed", blob_id)
+            finally:
+                if conn is not None:
+                    conn.close()
+                with self._lock:
+                    self._queued.discard(blob_id)
+
+
+# shared pool for the API process
+rendition_pool = RenditionPool()
+
+
+def attach_renditions(cursor, media_rows):
+    """
+    Add `renditions` ({name: {url, width, height}}) and `thumbnail_url` /
+    `display_url` to ProjectMedia rows, in one query. Rows without
+    renditions (external URLs, clips, still pending) fall back to
+    media_url.
+    """
+    blob_ids = sorted({row["blob_id"] for row in media_rows if is_blob_id(row.get("blob_id"))})
+    found = {}
+    if blob_ids:
+        placeholders = ", ".join(["%s"] * len(blob_ids))
+        cursor.execute(
+            f"""
+            SELECT blob_id, rendition, width, height
+            FROM MediaRenditions
+            WHERE blob_id IN ({placeholders})
+            """,
+            blob_ids,
+        )
+        for row in cursor.fetchall():
+            found.setdefault(row["blob_id"], {})[row["rendition"]] = {
+                "url": rendition_url(row["blob_id"], row["rendition"]),
+                "width": row["width"],
+                "height": row["height"],
+            }
+
+    for row in media_rows:
+        renditions = found.get(row.get("blob_id"), {})
+        row["renditions"] = renditions
+        row["thumbnail_url"] = renditions.get("thumb", {}).get("url", row["media_url"])
+        row["display_url"] = renditions.get("web", {}).get("url", row["media_url"])
+    return media_rows
+
+
+def render_pending_media(conn, progress, batch_size=100, pause_seconds=0.05):
+    """
+    Maintenance job: render every blob still pending, e.g. ones that were
+    queued when the API restarted or uploaded before renditions existed.
+    """
+    cursor = conn.cursor()
+    progress.update(rendered=0, skipped=0, failed=0)
+    last_id = ""
+    while True:
+        cursor.execute(
+            """
+            SELECT blob_id
+            FROM MediaBlobs
+            WHERE rendition_status = 'pending' AND blob_id > %s
+            ORDER BY blob_id
+            LIMIT %s
+            """,
+            (last_id, int(batch_size)),
+        )
+        blob_ids = [row["blob_id"] for row in cursor.fetchall()]
+        conn.commit()
+        if not blob_ids:
+            break
+
+        for blob_id in blob_ids:
+            status = process_blob(conn, blob_id)
+            if status == "ready":
+                progress["rendered"] += 1
+                rendition_pool.notify_ready(blob_id)
+            elif status in ("skipped", "failed"):
+                progress[status] += 1
+        last_id = blob_ids[-1]
+        throttle(pause_seconds)
+
+    return progress
@@ -0,0 +1,192 @@
+#------------------------------------------------------------
+# Resumable chunked uploads
+#------------------------------------------------------------
+# A reel can be several GB, more than one request should carry and more
+# than a flaky connection should have to resend. The protocol:
+#   1. POST /media/uploads                 -> upload_id, chunk_size
+#   2. PUT  /media/uploads/{id}/chunks/{n}  raw bytes of chunk n (0-based),
+#      optional X-Chunk-SHA256 header; repeat / retry in any order
+#   3. GET  /media/uploads/{id}             which chunks have arrived
+#   4. POST /media/uploads/{id}/complete    assemble into a blob
+# Each chunk is streamed from the request to MEDIA_ROOT/uploads/{id}/ in
+# CHUNK_SIZE pieces while it is hashed, then renamed into place, so a
+# dropped connection never leaves half a chunk recorded. UploadChunks
+# keeps each chunk's size and SHA-256. Completion streams the chunk files
+# in order through MediaStore.put(), re-checking every chunk's hash and
+# the whole file's on the way; memory use is one CHUNK_SIZE buffer
+# whatever the file size.
+import hashlib
+import os
+import secrets
+import shutil
+import tempfile
+
+from flask import current_app
+
+from backend.jobs import throttle
+from backend.media import CHUNK_SIZE, ChecksumMismatch
+
+# what clients are told to send; any size up to the max is accepted
+UPLOAD_CHUNK_SIZE = 16 << 20
+UPLOAD_CHUNK_MAX = 64 << 20
+UPLOAD_MAX_CHUNKS = 10000
+
+
+class ChunkMismatch(ChecksumMismatch):
+    def __init__(self, chunk_index):
+        super().__init__(f"Chunk {chunk_index} is corrupt; upload it again")
+        self.chunk_index = chunk_index
+
+
+class ChunkTruncated(Exception):
+    pass
+
+
+def new_upload_id():
+    return secrets.token_hex(16)
+
+
+def is_upload_id(value):
+    return len(value) == 32 and all(c in "0123456789abcdef" for c in value)
+
+
+def upload_dir(upload_id):
+    return os.path.join(current_app.config["MEDIA_ROOT"], "uploads", upload_id)
+
+
+def chunk_path(upload_id, index):
+    return os.path.join(upload_dir(upload_id), f"{index}.part")
+
+
+def write_chunk(upload_id, index, stream, expected_sha256=None, expected_size=None):
+    """
+    Stream one chunk to disk. Returns (size_bytes, sha256); the chunk is
+    only visible under its final name once fully written, and never if it
+    is not expected_size bytes long (ChunkTruncated) or does not hash to
+    expected_sha256 (ChecksumMismatch), so a bad resend cannot replace a
+    good copy.
+    """
+    directory = upload_dir(upload_id)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                piece = stream.read(CHUNK_SIZE)
+                if not piece:
+                    break
+                digest.update(piece)
+                out.write(piece)
+                size += len(piece)
+        if expected_size is not None and size != expected_size:
+            raise ChunkTruncated(f"Chunk {index} is {size} bytes, expected {expected_size}")
+        if expected_sha256 is not None and digest.hexdigest() != expected_sha256:
+            raise ChecksumMismatch(f"Chunk {index} does not match X-Chunk-SHA256")
+        os.replace(tmp_path, chunk_path(upload_id, index))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return size, digest.hexdigest()
+
+
+def discard_chunks(upload_id):
+    shutil.rmtree(upload_dir(upload_id), ignore_errors=True)
+
+
+class ChunkStream:
+    """
+    File-like reader over an upload's chunks, in order, for
+    MediaStore.put(). Raises ChunkMismatch as soon as a chunk's bytes no
+    longer match the size and SHA-256 recorded when it arrived.
+    """
+
+    def __init__(self, upload_id, chunks):
+        self._upload_id = upload_id
+        self._pending = list(chunks)  # UploadChunks rows, by chunk_index
+        self._file = None
+        self._chunk = None
+
+    def _next_chunk(self):
+        self._chunk = self._pending.pop(0)
+        self._file = open(chunk_path(self._upload_id, self._chunk["chunk_index"]), "rb")
+        self._digest = hashlib.sha256()
+        self._size = 0
+
+    def _finish_chunk(self):
+        self._file.close()
+        self._file = None
+        chunk = self._chunk
+        if self._size != chunk["size_bytes"] or self._digest.hexdigest() != chunk["sha256"]:
+            raise ChunkMismatch(chunk["chunk_index"])
+
+    def read(self, size=CHUNK_SIZE):
+        while True:
+            if self._file is None:
+                if not self._pending:
+                    return b""
+                self._next_chunk()
+            piece = self._file.read(size)
+            if piece:
+                self._digest.update(piece)
+                self._size += len(piece)
+                return piece
+            self._finish_chunk()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def purge_stale_uploads(conn, progress, max_idle_hours=24, batch_size=100, pause_seconds=0.05):
+    """
+    Maintenance job: abort upload sessions nobody has touched for
+    max_idle_hours (including ones whose assembly died with the process)
+    and delete their chunk files.
+    """
+    cursor = conn.cursor()
+    progress.update(sessions_aborted=0, bytes_freed=0)
+
+    while True:
+        cursor.execute(
+            """
+            SELECT s.upload_id, COALESCE(SUM(c.size_bytes), 0) AS received_bytes
+            FROM UploadSessions s
+            LEFT JOIN UploadChunks c ON c.upload_id = s.upload_id
+            WHERE s.status IN ('open', 'assembling')
+              AND s.updated_at < NOW() - INTERVAL %s HOUR
+            GROUP BY s.upload_id
+            ORDER BY s.upload_id
+            LIMIT %s
+            """,
+            (int(max_idle_hours), int(batch_size)),
+        )
+        stale = cursor.fetchall()
+        if not stale:
+            conn.commit()
+            break
+
+        upload_ids = [row["upload_id"] for row in stale]
+        placeholders = ", ".join(["%s"] * len(upload_ids))
+        cursor.execute(
+            f"""
+            UPDATE UploadSessions
+            SET status = 'aborted'
+            WHERE upload_id IN ({placeholders}) AND status IN ('open', 'assembling')
+            """,
+            upload_ids,
+        )
+        cursor.execute(f"DELETE FROM UploadChunks WHERE upload_id IN ({placeholders})", upload_ids)
+        conn.commit()
+
+        for row in stale:
+            discard_chunks(row["upload_id"])
+            progress["bytes_freed"] += int(row["received_bytes"])
+        progress["sessions_aborted"] += len(stale)
+        throttle(pause_seconds)
+
+    return progress
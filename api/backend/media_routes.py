@@ -0,0 +1,520 @@
+from flask import Blueprint, jsonify, request, current_app, send_file
+from backend.db_connection import db
+from backend.cache import TTLCache
+from backend.media import (
+    ALLOWED_CONTENT_TYPES,
+    ChecksumMismatch,
+    EmptyBlob,
+    is_blob_id,
+    media_store,
+    media_url,
+    record_blob,
+    resolve_content_type,
+)
+from backend.media.renditions import RENDITION_CONTENT_TYPE, RENDITIONS, rendition_path
+from backend.media.uploads import (
+    UPLOAD_CHUNK_MAX,
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_MAX_CHUNKS,
+    ChunkMismatch,
+    ChunkStream,
+    ChunkTruncated,
+    discard_chunks,
+    is_upload_id,
+    new_upload_id,
+    write_chunk,
+)
+
+media_bp = Blueprint("media", __name__)
+
+# blobs never change, so their metadata can stay cached for a long time
+blob_cache = TTLCache("media_blobs", maxsize=10000, ttl=3600)
+ONE_YEAR = 365 * 24 * 3600
+
+
+# DB helper
+def get_dict_cursor():
+    conn = db.get_db()
+    cursor = conn.cursor()
+    return conn, cursor
+
+
+@media_bp.post("")
+def upload_media():
+    """
+    Upload a still or clip (multipart/form-data, field "file").
+    Identical bytes are stored once: re-uploading returns the existing blob.
+    Response: {blob_id, url, content_type, size_bytes, deduplicated}
+    Pass blob_id to POST /social/posts or POST /creator/projects/{id}/media.
+    """
+    upload = request.files.get("file")
+    if upload is None or not upload.filename:
+        return jsonify({"error": "Missing file"}), 400
+
+    content_type = resolve_content_type(upload.mimetype, upload.filename)
+    if content_type is None:
+        return jsonify({
+            "error": f"Unsupported media type; allowed: {', '.join(sorted(ALLOWED_CONTENT_TYPES))}"
+        }), 415
+
+    try:
+        try:
+            blob_id, size_bytes, created = media_store.put(upload.stream)
+        except EmptyBlob as exc:
+            return jsonify({"error": str(exc)}), 400
+
+        conn, cursor = get_dict_cursor()
+        content_type, known = record_blob(cursor, blob_id, content_type, size_bytes)
+        conn.commit()
+
+        return jsonify({
+            "blob_id": blob_id,
+            "url": media_url(blob_id),
+            "content_type": content_type,
+            "size_bytes": size_bytes,
+            "deduplicated": known or not created,
+        }), 200 if known else 201
+
+    except Exception:
+        current_app.logger.exception("Error uploading media")
+        return jsonify({"error": "Failed to upload media"}), 500
+
+
+@media_bp.get("/<blob_id>")
+def get_media(blob_id):
+    """
+    Serve a stored blob. Supports HTTP Range (seeking in clips) and
+    conditional requests; the response is cacheable for a year because a
+    blob id is the hash of its bytes. Whole-file responses go through the
+    WSGI server's file wrapper, i.e. sendfile() where the server has it.
+    """
+    if not is_blob_id(blob_id):
+        return jsonify({"error": "Media not found"}), 404
+
+    try:
+        info = blob_cache.get(blob_id)
+        if info is None:
+            conn, cursor = get_dict_cursor()
+            cursor.execute(
+                "SELECT content_type, size_bytes FROM MediaBlobs WHERE blob_id = %s",
+                (blob_id,),
+            )
+            info = cursor.fetchone()
+            if info is None or not media_store.exists(blob_id):
+                return jsonify({"error": "Media not found"}), 404
+            blob_cache.set(blob_id, info)
+
+        response = send_file(
+            media_store.path(blob_id),
+            mimetype=info["content_type"],
+            conditional=True,
+            etag=blob_id,
+            max_age=ONE_YEAR,
+        )
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        response.headers["Accept-Ranges"] = "bytes"
+        return response
+
+    except FileNotFoundError:
+        blob_cache.invalidate(blob_id)
+        return jsonify({"error": "Media not found"}), 404
+    except Exception:
+        current_app.logger.exception("Error serving media")
+        return jsonify({"error": "Failed to serve media"}), 500
+
+
+@media_bp.get("/<blob_id>/<rendition>")
+def get_media_rendition(blob_id, rendition):
+    """
+    Serve a downsized copy of a still ("thumb" or "web"). 404 until the
+    rendition worker has written it; callers get its URL from the media
+    listings only once it exists.
+    """
+    if not is_blob_id(blob_id) or rendition not in RENDITIONS:
+        return jsonify({"error": "Media not found"}), 404
+
+    try:
+        response = send_file(
+            rendition_path(blob_id, rendition),
+            mimetype=RENDITION_CONTENT_TYPE,
+            conditional=True,
+            etag=f"{blob_id}-{rendition}",
+            max_age=ONE_YEAR,
+        )
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        response.headers["Accept-Ranges"] = "bytes"
+        return response
+
+    except FileNotFoundError:
+        return jsonify({"error": "Media not found"}), 404
+    except Exception:
+        current_app.logger.exception("Error serving media rendition")
+        return jsonify({"error": "Failed to serve media"}), 500
+
+
+# RESUMABLE UPLOADS (see backend/media/uploads.py for the protocol)
+UPLOAD_SESSION_COLUMNS = """
+    upload_id, filename, content_type, size_bytes, sha256,
+    status, blob_id, created_at, updated_at
+"""
+
+
+def parse_sha256(value, name="sha256"):
+    if value is None:
+        return None
+    value = str(value).strip().lower()
+    if not is_blob_id(value):
+        raise ValueError(f"{name} must be 64 hex characters")
+    return value
+
+
+def load_upload(cursor, upload_id, lock=False):
+    cursor.execute(
+        f"""
+        SELECT {UPLOAD_SESSION_COLUMNS}
+        FROM UploadSessions
+        WHERE upload_id = %s
+        {"FOR UPDATE" if lock else ""}
+        """,
+        (upload_id,),
+    )
+    return cursor.fetchone()
+
+
+def load_upload_chunks(cursor, upload_id):
+    cursor.execute(
+        """
+        SELECT chunk_index, size_bytes, sha256
+        FROM UploadChunks
+        WHERE upload_id = %s
+        ORDER BY chunk_index
+        """,
+        (upload_id,),
+    )
+    return cursor.fetchall()
+
+
+def completed_upload(session):
+    return {
+        "upload_id": session["upload_id"],
+        "status": session["status"],
+        "blob_id": session["blob_id"],
+        "url": media_url(session["blob_id"]),
+        "content_type": session["content_type"],
+        "size_bytes": session["size_bytes"],
+    }
+
+
+@media_bp.post("/uploads")
+def create_upload():
+    """
+    Start a resumable upload.
+    Body: {filename, content_type?, size_bytes?, sha256?}; size_bytes and
+    sha256 (of the whole file) are checked on completion when given.
+    Response: {upload_id, chunk_size, max_chunk_size, ...}
+    """
+    data = request.get_json(silent=True) or {}
+    filename = (data.get("filename") or "").strip()
+    if not filename:
+        return jsonify({"error": "Missing required field: filename"}), 400
+
+    content_type = resolve_content_type(data.get("content_type"), filename)
+    if content_type is None:
+        return jsonify({
+            "error": f"Unsupported media type; allowed: {', '.join(sorted(ALLOWED_CONTENT_TYPES))}"
+        }), 415
+
+    size_bytes = data.get("size_bytes")
+    max_bytes = current_app.config["MEDIA_MAX_RESUMABLE_BYTES"]
+    try:
+        sha256 = parse_sha256(data.get("sha256"))
+        if size_bytes is not None:
+            size_bytes = int(size_bytes)
+            if size_bytes <= 0:
+                raise ValueError("size_bytes must be positive")
+            if size_bytes > max_bytes:
+                return jsonify({"error": f"File too large (max {max_bytes} bytes)"}), 413
+    except (TypeError, ValueError) as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    try:
+        conn, cursor = get_dict_cursor()
+        upload_id = new_upload_id()
+        cursor.execute(
+            """
+            INSERT INTO UploadSessions (upload_id, filename, content_type, size_bytes, sha256)
+            VALUES (%s, %s, %s, %s, %s)
+            """,
+            (upload_id, filename[:255], content_type, size_bytes, sha256),
+        )
+        conn.commit()
+
+        session = load_upload(cursor, upload_id)
+        session.update(
+            chunk_size=UPLOAD_CHUNK_SIZE,
+            max_chunk_size=UPLOAD_CHUNK_MAX,
+            chunks=[],
+            received_bytes=0,
+        )
+        return jsonify(session), 201
+
+    except Exception:
+        current_app.logger.exception("Error creating upload session")
+        return jsonify({"error": "Failed to create upload"}), 500
+
+
+@media_bp.get("/uploads/<upload_id>")
+def get_upload(upload_id):
+    """
+    Upload session with the chunks received so far, so a client can
+    resume by sending only the missing ones.
+    """
+    if not is_upload_id(upload_id):
+        return jsonify({"error": "Upload not found"}), 404
+
+    try:
+        conn, cursor = get_dict_cursor()
+        session = load_upload(cursor, upload_id)
+        if session is None:
+            return jsonify({"error": "Upload not found"}), 404
+
+        chunks = load_upload_chunks(cursor, upload_id)
+        session.update(
+            chunk_size=UPLOAD_CHUNK_SIZE,
+            max_chunk_size=UPLOAD_CHUNK_MAX,
+            chunks=chunks,
+            received_bytes=sum(chunk["size_bytes"] for chunk in chunks),
+        )
+        return jsonify(session), 200
+
+    except Exception:
+        current_app.logger.exception("Error fetching upload session")
+        return jsonify({"error": "Failed to fetch upload"}), 500
+
+
+@media_bp.put("/uploads/<upload_id>/chunks/<int:chunk_index>")
+def put_upload_chunk(upload_id, chunk_index):
+    """
+    Store chunk `chunk_index` (0-based) of an upload from the raw request
+    body. Re-sending a chunk replaces it. Send X-Chunk-SHA256 to have the
+    chunk rejected (422) if it arrived damaged.
+    """
+    if not is_upload_id(upload_id):
+        return jsonify({"error": "Upload not found"}), 404
+    if chunk_index >= UPLOAD_MAX_CHUNKS:
+        return jsonify({"error": f"chunk_index must be below {UPLOAD_MAX_CHUNKS}"}), 400
+    if request.content_length is None:
+        return jsonify({"error": "Content-Length required"}), 411
+    if request.content_length == 0:
+        return jsonify({"error": "Empty chunk"}), 400
+    if request.content_length > UPLOAD_CHUNK_MAX:
+        return jsonify({"error": f"Chunk too large (max {UPLOAD_CHUNK_MAX} bytes)"}), 413
+    try:
+        expected = parse_sha256(request.headers.get("X-Chunk-SHA256"), "X-Chunk-SHA256")
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    try:
+        conn, cursor = get_dict_cursor()
+        session = load_upload(cursor, upload_id)
+        conn.commit()
+        if session is None:
+            return jsonify({"error": "Upload not found"}), 404
+        if session["status"] != "open":
+            return jsonify({"error": f"Upload is {session['status']}"}), 409
+
+        # the bytes go to disk before any row lock is taken
+        try:
+            size_bytes, sha256 = write_chunk(
+                upload_id, chunk_index, request.stream, expected, request.content_length
+            )
+        except ChunkTruncated:
+            return jsonify({"error": "Chunk body shorter than Content-Length"}), 400
+        except ChecksumMismatch as exc:
+            return jsonify({"error": str(exc)}), 422
+
+        session = load_upload(cursor, upload_id, lock=True)
+        if session is None or session["status"] != "open":
+            conn.rollback()
+            if session is not None and session["status"] != "assembling":
+                discard_chunks(upload_id)
+            return jsonify({"error": "Upload is no longer open"}), 409
+
+        cursor.execute(
+            """
+            INSERT INTO UploadChunks (upload_id, chunk_index, size_bytes, sha256)
+            VALUES (%s, %s, %s, %s) AS new
+            ON DUPLICATE KEY UPDATE
+                size_bytes = new.size_bytes,
+                sha256 = new.sha256,
+                received_at = CURRENT_TIMESTAMP
+            """,
+            (upload_id, chunk_index, size_bytes, sha256),
+        )
+        cursor.execute(
+            "UPDATE UploadSessions SET updated_at = CURRENT_TIMESTAMP WHERE upload_id = %s",
+            (upload_id,),
+        )
+        conn.commit()
+
+        return jsonify({
+            "upload_id": upload_id,
+            "chunk_index": chunk_index,
+            "size_bytes": size_bytes,
+            "sha256": sha256,
+        }), 200
+
+    except Exception:
+        current_app.logger.exception("Error storing upload chunk")
+        return jsonify({"error": "Failed to store chunk"}), 500
+
+
+@media_bp.post("/uploads/<upload_id>/complete")
+def complete_upload(upload_id):
+    """
+    Assemble chunks 0..chunk_count-1 into a media blob.
+    Body (optional): {chunk_count, sha256}; chunk_count defaults to the
+    chunks received, sha256 to the one given when the upload started.
+    Every chunk is re-hashed while it is copied; a damaged one is dropped
+    and reported (422) so the client can re-send it and complete again.
+    Completing an already completed upload returns the same blob.
+    """
+    if not is_upload_id(upload_id):
+        return jsonify({"error": "Upload not found"}), 404
+
+    data = request.get_json(silent=True) or {}
+    try:
+        chunk_count = data.get("chunk_count")
+        chunk_count = int(chunk_count) if chunk_count is not None else None
+        sha256 = parse_sha256(data.get("sha256"))
+    except (TypeError, ValueError) as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    try:
+        conn, cursor = get_dict_cursor()
+        session = load_upload(cursor, upload_id, lock=True)
+        if session is None:
+            conn.rollback()
+            return jsonify({"error": "Upload not found"}), 404
+        if session["status"] == "complete":
+            conn.rollback()
+            return jsonify(completed_upload(session)), 200
+        if session["status"] != "open":
+            conn.rollback()
+            return jsonify({"error": f"Upload is {session['status']}"}), 409
+
+        chunks = load_upload_chunks(cursor, upload_id)
+        if chunk_count is None:
+            chunk_count = len(chunks)
+        received = {chunk["chunk_index"] for chunk in chunks}
+        missing = [index for index in range(chunk_count) if index not in received]
+        if chunk_count <= 0 or missing:
+            conn.rollback()
+            return jsonify({"error": "Missing chunks", "missing": missing[:100]}), 400
+        chunks = chunks[:chunk_count]
+        if len(chunks) < len(received):
+            conn.rollback()
+            return jsonify({"error": f"Received chunks beyond chunk_count {chunk_count}"}), 400
+
+        total = sum(chunk["size_bytes"] for chunk in chunks)
+        if session["size_bytes"] is not None and total != session["size_bytes"]:
+            conn.rollback()
+            return jsonify({
+                "error": f"Received {total} bytes, expected {session['size_bytes']}"
+            }), 400
+        if total > current_app.config["MEDIA_MAX_RESUMABLE_BYTES"]:
+            conn.rollback()
+            return jsonify({"error": "File too large"}), 413
+
+        # assembling can take minutes for a long reel; mark the session so
+        # no chunk or second completion sneaks in, and release the row lock
+        cursor.execute(
+            "UPDATE UploadSessions SET status = 'assembling' WHERE upload_id = %s",
+            (upload_id,),
+        )
+        conn.commit()
+
+        stream = ChunkStream(upload_id, chunks)
+        try:
+            blob_id, size_bytes, created = media_store.put(stream, sha256 or session["sha256"])
+        except ChecksumMismatch as exc:
+            if isinstance(exc, ChunkMismatch):
+                cursor.execute(
+                    "DELETE FROM UploadChunks WHERE upload_id = %s AND chunk_index = %s",
+                    (upload_id, exc.chunk_index),
+                )
+            cursor.execute(
+                "UPDATE UploadSessions SET status = 'open' WHERE upload_id = %s",
+                (upload_id,),
+            )
+            conn.commit()
+            return jsonify({
+                "error": str(exc),
+                "missing": [exc.chunk_index] if isinstance(exc, ChunkMismatch) else [],
+            }), 422
+        except BaseException:
+            cursor.execute(
+                "UPDATE UploadSessions SET status = 'open' WHERE upload_id = %s",
+                (upload_id,),
+            )
+            conn.commit()
+            raise
+        finally:
+            stream.close()
+
+        content_type, known = record_blob(cursor, blob_id, session["content_type"], size_bytes)
+        cursor.execute(
+            """
+            UPDATE UploadSessions
+            SET status = 'complete', blob_id = %s, size_bytes = %s
+            WHERE upload_id = %s
+            """,
+            (blob_id, size_bytes, upload_id),
+        )
+        cursor.execute("DELETE FROM UploadChunks WHERE upload_id = %s", (upload_id,))
+        conn.commit()
+        discard_chunks(upload_id)
+
+        session.update(status="complete", blob_id=blob_id, size_bytes=size_bytes)
+        result = completed_upload(session)
+        result.update(content_type=content_type, deduplicated=known or not created)
+        return jsonify(result), 200 if known else 201
+
+    except Exception:
+        current_app.logger.exception("Error completing upload")
+        return jsonify({"error": "Failed to complete upload"}), 500
+
+
+@media_bp.delete("/uploads/<upload_id>")
+def abort_upload(upload_id):
+    """
+    Abandon an upload and delete the chunks received so far.
+    """
+    if not is_upload_id(upload_id):
+        return jsonify({"error": "Upload not found"}), 404
+
+    try:
+        conn, cursor = get_dict_cursor()
+        session = load_upload(cursor, upload_id, lock=True)
+        if session is None:
+            conn.rollback()
+            return jsonify({"error": "Upload not found"}), 404
+        if session["status"] != "open":
+            conn.rollback()
+            return jsonify({"error": f"Upload is {session['status']}"}), 409
+
+        cursor.execute(
+            "UPDATE UploadSessions SET status = 'aborted' WHERE upload_id = %s",
+            (upload_id,),
+        )
+        cursor.execute("DELETE FROM UploadChunks WHERE upload_id = %s", (upload_id,))
+        conn.commit()
+        discard_chunks(upload_id)
+
+        return jsonify({"upload_id": upload_id, "status": "aborted"}), 200
+
+    except Exception:
+        current_app.logger.exception("Error aborting upload")
+        return jsonify({"error": "Failed to abort upload"}), 500
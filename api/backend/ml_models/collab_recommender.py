@@ -0,0 +1,262 @@
+#------------------------------------------------------------
+# Collaborator recommendations
+#------------------------------------------------------------
+# Two signals, combined at request time:
+#   * attributes: each active creator's primary_styles, tools and market
+#     one-hot encoded into a row of A; every block is L2-normalised and
+#     scaled by sqrt(its weight), so A[i] @ A[j] is the weighted sum of
+#     the per-block cosine similarities. fit() precomputes the top-K rows
+#     for everyone with one (batch x n) matrix product per batch.
+#   * co-credit history: a user's row of the collaborator adjacency
+#     (backend.collab_graph). Cosine between two such rows is
+#     mutual_collaborators / sqrt(deg_u * deg_v), computed only for the
+#     second-degree candidates the graph returns.
+# Direct collaborators are never recommended.
+#
+# Profile edits call update_user(): the user's row is re-encoded, their
+# own top-K recomputed, and any other row whose list they could enter or
+# already sit in is marked dirty and recomputed on its next request.
+import threading
+
+import numpy as np
+
+from backend.collab_graph import collab_graph
+
+TOP_K = 50
+# similarity cells per batch in fit() (~64 MB of float32)
+BATCH_CELLS = 1 << 24
+
+BLOCK_WEIGHTS = {"style": 0.5, "tool": 0.3, "market": 0.2}
+ATTRIBUTE_WEIGHT = 0.7
+CO_CREDIT_WEIGHT = 0.3
+CO_CREDIT_CANDIDATES = 200
+
+CREATOR_SQL = """
+    SELECT user_id, name, primary_styles, tools, market
+    FROM Users
+    WHERE is_creator = TRUE AND is_active = TRUE
+"""
+
+
+def _split(value):
+    return {part.strip().lower() for part in (value or "").split(",") if part.strip()}
+
+
+def _features(row):
+    """{block: set of tokens} for one Users row."""
+    return {
+        "style": _split(row.get("primary_styles")),
+        "tool": _split(row.get("tools")),
+        "market": _split(row.get("market")),
+    }
+
+
+class CollaboratorRecommender:
+    def __init__(self, top_k=TOP_K):
+        self.top_k = top_k
+        self._lock = threading.Lock()
+        self._fitted = False
+
+    # -- encoding ---------------------------------------------------------
+
+    def _column(self, block, token):
+        key = (block, token)
+        if key not in self._vocab:
+            self._vocab[key] = len(self._vocab)
+            self._A = np.pad(self._A, ((0, 0), (0, 1)))
+        return self._vocab[key]
+
+    def _encode(self, i):
+        """Write row i of A from self._tokens[i]."""
+        self._A[i] = 0
+        for block, tokens in self._tokens[i].items():
+            if tokens:
+                cols = [self._column(block, token) for token in tokens]
+                self._A[i, cols] = np.sqrt(BLOCK_WEIGHTS[block] / len(tokens))
+
+    def _top_rows(self, rows):
+        """Top-K (indices, scores) for each row index in `rows`."""
+        scores = self._A[rows] @ self._A.T
+        scores[np.arange(len(rows)), rows] = -np.inf
+        scores[:, ~self._active] = -np.inf
+
+        k = min(self.top_k, scores.shape[1] - 1)
+        if k <= 0:
+            empty = np.empty((len(rows), 0))
+            return empty.astype(np.int64), empty.astype(np.float32)
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        return np.take_along_axis(top, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
+
+    def _store_top(self, rows, top, top_scores):
+        width = self._top_idx.shape[1]
+        k = top.shape[1]
+        self._top_idx[rows] = -1
+        self._top_scores[rows] = -np.inf
+        self._top_idx[rows, :min(k, width)] = top[:, :width]
+        self._top_scores[rows, :min(k, width)] = top_scores[:, :width]
+        self._dirty[rows] = False
+
+    # -- building ---------------------------------------------------------
+
+    def fit(self, cursor):
+        cursor.execute(CREATOR_SQL + " ORDER BY user_id")
+        rows = cursor.fetchall()
+
+        with self._lock:
+            n = len(rows)
+            self._ids = np.array([row["user_id"] for row in rows], np.int64)
+            self._index = {row["user_id"]: i for i, row in enumerate(rows)}
+            self._names = [row["name"] for row in rows]
+            self._tokens = [_features(row) for row in rows]
+            self._active = np.ones(n, bool)
+            self._vocab = {}
+            for tokens in self._tokens:
+                for block, values in tokens.items():
+                    for token in values:
+                        self._vocab.setdefault((block, token), len(self._vocab))
+            self._A = np.zeros((n, len(self._vocab)), np.float32)
+            for i in range(n):
+                self._encode(i)
+
+            self._top_idx = np.full((n, self.top_k), -1, np.int64)
+            self._top_scores = np.full((n, self.top_k), -np.inf, np.float32)
+            self._dirty = np.zeros(n, bool)
+            batch_size = max(1, BATCH_CELLS // max(n, 1))
+            for start in range(0, n, batch_size):
+                batch = np.arange(start, min(start + batch_size, n))
+                self._store_top(batch, *self._top_rows(batch))
+
+            self._fitted = True
+        return n
+
+    def ensure_fitted(self, cursor):
+        if not self._fitted:
+            self.fit(cursor)
+
+    def update_user(self, cursor, user_id):
+        """Re-encode one user after a profile change (or deactivation)."""
+        if not self._fitted:
+            return
+        cursor.execute(CREATOR_SQL + " AND user_id = %s", (user_id,))
+        row = cursor.fetchone()
+
+        with self._lock:
+            i = self._index.get(user_id)
+            if i is None:
+                if row is None:
+                    return
+                i = len(self._ids)
+                self._index[user_id] = i
+                self._ids = np.append(self._ids, user_id)
+                self._names.append(None)
+                self._tokens.append({})
+                self._active = np.append(self._active, False)
+                self._A = np.vstack([self._A, np.zeros((1, self._A.shape[1]), np.float32)])
+                self._top_idx = np.vstack([self._top_idx, np.full((1, self.top_k), -1, np.int64)])
+                self._top_scores = np.vstack(
+                    [self._top_scores, np.full((1, self.top_k), -np.inf, np.float32)]
+                )
+                self._dirty = np.append(self._dirty, True)
+
+            if row is None:
+                self._active[i] = False
+                self._tokens[i] = {}
+            else:
+                self._active[i] = True
+                self._names[i] = row["name"]
+                self._tokens[i] = _features(row)
+            self._encode(i)
+
+            # rows that list i, or that i now outranks, need a fresh top-K
+            scores = self._A @ self._A[i]
+            listed = (self._top_idx == i).any(axis=1)
+            enters = self._active[i] & (scores > self._top_scores[:, -1])
+            self._dirty |= listed | enters
+            self._dirty[i] = False
+            if self._active[i]:
+                self._store_top(np.array([i]), *self._top_rows(np.array([i])))
+
+    # -- serving ----------------------------------------------------------
+
+    def _attribute_candidates(self, i):
+        """Call with self._lock held."""
+        if self._dirty[i]:
+            self._store_top(np.array([i]), *self._top_rows(np.array([i])))
+        keep = (self._top_idx[i] >= 0) & (self._top_scores[i] > 0)
+        return self._top_idx[i][keep], self._top_scores[i][keep]
+
+    def recommend(self, user_id, limit=10):
+        """
+        [{user_id, name, score, shared_styles, shared_tools, same_market,
+        mutual_collaborators}], best first; None if user_id is not an
+        active creator.
+        """
+        # graph lookups take the graph's own lock; do them first
+        direct = {other for other, _ in collab_graph.collaborators(user_id)}
+        second = collab_graph.second_degree(user_id)[:CO_CREDIT_CANDIDATES]
+
+        with self._lock:
+            i = self._index.get(user_id)
+            if i is None or not self._active[i]:
+                return None
+
+            rows, attribute = self._attribute_candidates(i)
+            candidates = {int(self._ids[j]): float(score) for j, score in zip(rows, attribute)}
+
+            mutual = {}
+            for other, count in second:
+                j = self._index.get(other)
+                if j is None or not self._active[j]:
+                    continue
+                mutual[other] = count
+                if other not in candidates:
+                    candidates[other] = float(self._A[j] @ self._A[i])
+
+            for other in direct:
+                candidates.pop(other, None)
+            if not candidates:
+                return []
+
+            ids = np.fromiter(candidates, np.int64, len(candidates))
+            attribute = np.fromiter(candidates.values(), np.float64, len(candidates))
+            tokens, names = self._tokens, self._names
+            index = self._index
+
+        mutual_counts = np.array([mutual.get(int(other), 0) for other in ids], np.float64)
+        co_credit = np.zeros(len(ids))
+        if direct and mutual_counts.any():
+            degrees = collab_graph.collaborator_counts(ids).astype(np.float64)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                co_credit = np.nan_to_num(mutual_counts / np.sqrt(len(direct) * degrees))
+
+        scores = ATTRIBUTE_WEIGHT * attribute + CO_CREDIT_WEIGHT * co_credit
+        order = np.lexsort((ids, -scores))[:limit]
+
+        own = tokens[index[user_id]]
+        results = []
+        for k in order:
+            other = int(ids[k])
+            theirs = tokens[index[other]]
+            results.append({
+                "user_id": other,
+                "name": names[index[other]],
+                "score": round(float(scores[k]), 4),
+                "shared_styles": sorted(own.get("style", set()) & theirs.get("style", set())),
+                "shared_tools": sorted(own.get("tool", set()) & theirs.get("tool", set())),
+                "same_market": bool(own.get("market") and own.get("market") == theirs.get("market")),
+                "mutual_collaborators": int(mutual_counts[k]),
+            })
+        return results
+
+
+# shared recommender for the API process
+collaborator_recommender = CollaboratorRecommender()
+
+
+def refresh_recommendations(conn, progress):
+    """Maintenance job: re-encode all creators and recompute every top-K."""
+    progress["creators"] = collaborator_recommender.fit(conn.cursor())
+    conn.commit()
+    return progress
@@ -0,0 +1,390 @@
+#------------------------------------------------------------
+# Credit momentum: time-decayed activity score per creator
+#------------------------------------------------------------
+# momentum(user) = sum over the user's events of
+#     EVENT_WEIGHTS[event] * 2 ** (-age_days / HALF_LIFE_DAYS)
+# where the events are credits on ProjectCredits (verified ones weigh
+# more), projects added to the user's portfolios, and likes/comments/
+# views on the user's posts.
+#
+# Because the decay is exponential, a stored score can be brought up to
+# date from its as_of time alone: score * 2 ** (-elapsed / half_life).
+# record_momentum_event() uses that to fold a single new event into
+# CreatorMomentum in one upsert, inside the writer's transaction
+# (record_momentum_events() does the same for a batch of events). Post
+# engagement (likes, comments, views) is far too frequent for that: it
+# goes to momentum_buffer instead, which sums weights per user in memory
+# and folds them in with one upsert every MOMENTUM_FLUSH_SECONDS, off the
+# request path. Deltas still buffered when the process dies are lost
+# until the next recompute.
+# recompute_momentum() rebuilds every score from the source tables with
+# NumPy (per-(user, day) sums from SQL, decay + bincount in NumPy) and
+# also picks up what the incremental path does not see, such as deleted
+# posts and archived projects. Deleted or re-verified credits and unlikes
+# are adjusted incrementally with the event's decayed weight. Rows that
+# incremental writers touch while a recompute runs keep what was added
+# after its snapshot (rebased_score()), so active creators are corrected
+# too.
+# Users.credit_momentum mirrors ROUND(score) so existing readers and the
+# directory indexes keep working.
+import atexit
+import math
+import threading
+import time
+
+import numpy as np
+import pymysql.cursors
+
+from backend.db_connection import db
+from backend.jobs import throttle
+
+HALF_LIFE_DAYS = 30.0
+
+EVENT_WEIGHTS = {
+    "credit_verified": 10.0,
+    "credit": 4.0,
+    "project": 3.0,
+    "comment": 2.0,
+    "like": 1.0,
+    "view": 0.1,
+}
+
+
+def decay_per_day(half_life_days=HALF_LIFE_DAYS):
+    """Exponent k such that a weight decays as exp(-k * age_days)."""
+    return math.log(2) / float(half_life_days)
+
+
+def momentum_weight(event, age_days, half_life_days=HALF_LIFE_DAYS):
+    """One event's weight decayed over age_days."""
+    return EVENT_WEIGHTS[event] * math.exp(-decay_per_day(half_life_days) * age_days)
+
+
+def record_momentum_event(cursor, user_id, event, half_life_days=HALF_LIFE_DAYS):
+    """
+    Decay the user's stored score to now and add one event's weight.
+    Must run inside the caller's transaction (the caller commits).
+    """
+    record_momentum_events(cursor, [(user_id, event)], half_life_days)
+
+
+def record_momentum_events(cursor, events, half_life_days=HALF_LIFE_DAYS):
+    """
+    record_momentum_event() for many (user_id, event) pairs: one upsert
+    and one Users update however many users are involved.
+    """
+    weights = {}
+    for user_id, event in events:
+        weights[user_id] = weights.get(user_id, 0.0) + EVENT_WEIGHTS[event]
+    record_momentum_weights(cursor, weights, half_life_days)
+
+
+def record_momentum_weights(cursor, weights, half_life_days=HALF_LIFE_DAYS):
+    """Decay each user's stored score to now and add {user_id: weight}."""
+    if not weights:
+        return
+
+    placeholders = ", ".join(["(%s, %s, NOW())"] * len(weights))
+    cursor.execute(
+        f"""
+        INSERT INTO CreatorMomentum (user_id, score, as_of)
+        VALUES {placeholders} AS new
+        ON DUPLICATE KEY UPDATE
+            score = CreatorMomentum.score
+                    * EXP(-%s * TIMESTAMPDIFF(SECOND, CreatorMomentum.as_of, new.as_of) / 86400)
+                    + new.score,
+            as_of = new.as_of
+        """,
+        [value for pair in weights.items() for value in pair] + [decay_per_day(half_life_days)],
+    )
+
+    placeholders = ", ".join(["%s"] * len(weights))
+    cursor.execute(
+        f"""
+        UPDATE Users u
+        JOIN CreatorMomentum m ON m.user_id = u.user_id
+        SET u.credit_momentum = ROUND(m.score)
+        WHERE u.user_id IN ({placeholders})
+        """,
+        list(weights),
+    )
+
+
+MOMENTUM_FLUSH_SECONDS = 5
+
+
+class MomentumBuffer:
+    """
+    Per-process sum of pending engagement weights, written to
+    CreatorMomentum by a background thread every flush interval.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._weights = {}
+        self._app = None
+        self._thread = None
+
+    def add(self, app, user_id, event):
+        self._add(app, user_id, EVENT_WEIGHTS[event])
+
+    def retract(self, app, user_id, event, age_days):
+        """Take back an event that has been undone (e.g. an unlike), as decayed to now."""
+        self._add(app, user_id, -momentum_weight(event, age_days))
+
+    def _add(self, app, user_id, weight):
+        with self._lock:
+            self._weights[user_id] = self._weights.get(user_id, 0.0) + weight
+            if self._thread is None:
+                self._app = app
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(app.config.get("MOMENTUM_FLUSH_SECONDS", MOMENTUM_FLUSH_SECONDS),),
+                    name="momentum-flush",
+                    daemon=True,
+                )
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def flush(self):
+        """Write everything buffered so far; returns the number of users."""
+        with self._lock:
+            weights, self._weights = self._weights, {}
+        if not weights:
+            return 0
+
+        with self._app.app_context():
+            conn = None
+            try:
+                conn = db.connect()
+                record_momentum_weights(conn.cursor(), weights)
+                conn.commit()
+            except Exception:
+                # keep the deltas for the next flush
+                with self._lock:
+                    for user_id, weight in weights.items():
+                        self._weights[user_id] = self._weights.get(user_id, 0.0) + weight
+                raise
+            finally:
+                if conn is not None:
+                    conn.close()
+        return len(weights)
+
+    def _run(self, interval):
+        while True:
+            time.sleep(interval)
+            try:
+                self.flush()
+            except Exception:
+                self._app.logger.exception("Flushing credit momentum failed")
+
+
+# shared buffer for the API process
+momentum_buffer = MomentumBuffer()
+
+
+def decayed_scores(user_ids, age_days, weights, size, half_life_days=HALF_LIFE_DAYS):
+    """
+    Sum weight * decay(age) per user. Inputs are equal-length arrays;
+    returns a float64 array of length `size` indexed by user_id.
+    """
+    decayed = np.asarray(weights, dtype=np.float64) * np.exp(
+        -decay_per_day(half_life_days) * np.asarray(age_days, dtype=np.float64)
+    )
+    return np.bincount(
+        np.asarray(user_ids, dtype=np.int64), weights=decayed, minlength=size
+    )[:size]
+
+
+# each source yields (user_id, age_days, weight) rows summed per user and day
+EVENT_SOURCES = {
+    "credits": """
+        SELECT user_id,
+               DATEDIFF(%(now)s, created_at) AS age_days,
+               CAST(SUM(IF(verified, %(credit_verified)s, %(credit)s)) AS DOUBLE) AS weight
+        FROM ProjectCredits
+        WHERE created_at >= %(since)s AND created_at <= %(now)s
+        GROUP BY user_id, age_days
+    """,
+    "projects": """
+        SELECT pf.user_id,
+               DATEDIFF(%(now)s, p.created_at) AS age_days,
+               CAST(COUNT(*) * %(project)s AS DOUBLE) AS weight
+        FROM Projects p
+        JOIN Portfolios pf ON pf.portfolio_id = p.portfolio_id
+        WHERE p.is_archived = FALSE
+          AND p.created_at >= %(since)s AND p.created_at <= %(now)s
+        GROUP BY pf.user_id, age_days
+    """,
+    "engagement": """
+        SELECT p.user_id,
+               DATEDIFF(%(now)s, i.created_at) AS age_days,
+               CAST(SUM(CASE i.interaction_type
+                            WHEN 'like' THEN %(like)s
+                            WHEN 'comment' THEN %(comment)s
+                            ELSE %(view)s
+                        END) AS DOUBLE) AS weight
+        FROM PostInteractions i
+        JOIN Posts p ON p.post_id = i.post_id
+        WHERE p.is_deleted = FALSE
+          AND i.created_at >= %(since)s AND i.created_at <= %(now)s
+        GROUP BY p.user_id, age_days
+    """,
+}
+
+
+def _load_events(conn, sql, params, fetch_size):
+    """Stream one source into (user_ids, age_days, weights) arrays."""
+    stream = conn.cursor(pymysql.cursors.SSCursor)
+    try:
+        stream.execute(sql, params)
+        parts = []
+        while True:
+            rows = stream.fetchmany(fetch_size)
+            if not rows:
+                break
+            parts.append(np.array(rows, dtype=np.float64).reshape(-1, 3))
+    finally:
+        stream.close()
+
+    if not parts:
+        return np.empty(0, np.int64), np.empty(0), np.empty(0)
+    events = np.concatenate(parts)
+    return events[:, 0].astype(np.int64), events[:, 1], events[:, 2]
+
+
+def _days(later, earlier):
+    return (later - earlier).total_seconds() / 86400
+
+
+def rebased_score(user_id, score, as_of, stored, current, half_life_days=HALF_LIFE_DAYS):
+    """
+    The (user_id, score, as_of) row to write for a recomputed `score`
+    valid at the snapshot time `as_of`. `stored` is the user's
+    CreatorMomentum row as the snapshot saw it and `current` the row now
+    (either may be None). Whatever incremental writers added to the row
+    after the snapshot is kept on top of the recomputed score, both
+    decayed to the row's current as_of.
+    """
+    if current is None or (
+        stored is not None
+        and current["as_of"] == stored["as_of"]
+        and current["score"] == stored["score"]
+    ):
+        return user_id, score, as_of
+
+    k = decay_per_day(half_life_days)
+    added = current["score"]
+    if stored is not None:
+        added -= stored["score"] * math.exp(-k * _days(current["as_of"], stored["as_of"]))
+    return (
+        user_id,
+        score * math.exp(-k * _days(current["as_of"], as_of)) + added,
+        current["as_of"],
+    )
+
+
+def recompute_momentum(
+    conn,
+    progress,
+    half_life_days=HALF_LIFE_DAYS,
+    lookback_days=365,
+    write_batch_size=5000,
+    fetch_size=100000,
+    pause_seconds=0.05,
+):
+    cursor = conn.cursor()
+
+    progress.update(events=0, users_scored=0, rows_written=0, users_updated=0)
+
+    # engagement already committed is about to be read from the source
+    # tables; write its buffered weight first so it is not added twice
+    momentum_buffer.flush()
+
+    # sources and the stored scores are read as of one instant
+    cursor.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT, READ ONLY")
+    cursor.execute(
+        """
+        SELECT NOW() AS now,
+               NOW() - INTERVAL %s DAY AS since,
+               COALESCE((SELECT MAX(user_id) FROM Users), 0) AS max_user_id
+        """,
+        (int(lookback_days),),
+    )
+    snapshot = cursor.fetchone()
+    size = snapshot["max_user_id"] + 1
+    progress["as_of"] = snapshot["now"]
+
+    params = dict(EVENT_WEIGHTS, now=snapshot["now"], since=snapshot["since"])
+    scores = np.zeros(size, dtype=np.float64)
+
+    for source, sql in EVENT_SOURCES.items():
+        user_ids, age_days, weights = _load_events(conn, sql, params, int(fetch_size))
+        in_range = user_ids < size
+        scores += decayed_scores(
+            user_ids[in_range], age_days[in_range], weights[in_range],
+            size, half_life_days,
+        )
+        progress["events"] += len(user_ids)
+        progress[f"{source}_rows"] = len(user_ids)
+
+    cursor.execute("SELECT user_id, score, as_of FROM CreatorMomentum")
+    stored = {row["user_id"]: row for row in cursor.fetchall() if row["user_id"] < size}
+    conn.commit()
+
+    # write scored users plus anyone who had a score before (now maybe 0)
+    targets = np.union1d(
+        np.flatnonzero(scores > 0), np.fromiter(stored, dtype=np.int64, count=len(stored))
+    )
+    progress["users_scored"] = int(np.count_nonzero(scores > 0))
+
+    batch = int(write_batch_size)
+    for start in range(0, len(targets), batch):
+        ids = [int(user_id) for user_id in targets[start:start + batch]]
+        placeholders = ", ".join(["%s"] * len(ids))
+        cursor.execute(
+            f"""
+            SELECT user_id, score, as_of
+            FROM CreatorMomentum
+            WHERE user_id IN ({placeholders})
+            FOR UPDATE
+            """,
+            ids,
+        )
+        current = {row["user_id"]: row for row in cursor.fetchall()}
+        rows = [
+            rebased_score(
+                user_id, float(scores[user_id]), snapshot["now"],
+                stored.get(user_id), current.get(user_id), half_life_days,
+            )
+            for user_id in ids
+        ]
+        placeholders = ", ".join(["(%s, %s, %s)"] * len(rows))
+        cursor.execute(
+            f"""
+            INSERT INTO CreatorMomentum (user_id, score, as_of)
+            VALUES {placeholders} AS new
+            ON DUPLICATE KEY UPDATE
+                score = new.score,
+                as_of = new.as_of
+            """,
+            [value for row in rows for value in row],
+        )
+
+        cursor.execute(
+            """
+            UPDATE Users u
+            JOIN CreatorMomentum m ON m.user_id = u.user_id
+            SET u.credit_momentum = ROUND(m.score)
+            WHERE u.user_id BETWEEN %s AND %s
+              AND NOT (u.credit_momentum <=> ROUND(m.score))
+            """,
+            (ids[0], ids[-1]),
+        )
+        progress["users_updated"] += cursor.rowcount
+        conn.commit()
+
+        progress["rows_written"] += len(rows)
+        throttle(pause_seconds)
+
+    return progress
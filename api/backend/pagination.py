@@ -0,0 +1,46 @@
+#------------------------------------------------------------
+# Keyset (cursor) pagination helpers shared by the blueprints
+#------------------------------------------------------------
+# A cursor is the sort key of the last row on a page, JSON-encoded and
+# base64'd so clients treat it as opaque. The next page then starts with
+# a WHERE on that key instead of an OFFSET, so deep pages cost the same
+# as the first one.
+import base64
+import json
+
+
+def encode_cursor(values):
+    raw = json.dumps(list(values), default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token, size):
+    """Decode a cursor into a list of `size` values; raises ValueError if malformed."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception as exc:
+        raise ValueError("Invalid cursor") from exc
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def parse_limit(raw, default=20, maximum=100):
+    """Page size from a query-string value, clamped to [1, maximum]."""
+    if raw in (None, ""):
+        return default
+    limit = int(raw)
+    return max(1, min(limit, maximum))
+
+
+def page_of(rows, limit, key):
+    """
+    Split a LIMIT limit+1 result into (page, next_cursor).
+    `key` maps a row to the values the cursor must carry.
+    """
+    if len(rows) > limit:
+        page = rows[:limit]
+        return page, encode_cursor(key(page[-1]))
+    return rows, None
@@ -7,6 +7,7 @@ from backend.admin_routes import admin_bp
 from backend.social_routes import social_bp
 from backend.analytics_routes import analytics_bp
 from backend.creator_routes import creator_bp
+from backend.media_routes import media_bp
 
 from backend.db_connection import db
 
@@ -43,6 +44,19 @@ def create_app():
         "DB_NAME"
     ).strip()  # Change this to your DB name
 
+    # Uploaded media (backend/media): where blobs live and the largest
+    # accepted upload. A relative MEDIA_ROOT is resolved against the working
+    # directory (/apicode in docker-compose, i.e. ./api/media on the host).
+    app.config["MEDIA_ROOT"] = os.path.abspath(os.getenv("MEDIA_ROOT", "media"))
+    app.config["MAX_CONTENT_LENGTH"] = int(os.getenv("MEDIA_MAX_UPLOAD_MB", "512")) * 1024 * 1024
+    # resumable uploads (/media/uploads) are chunked, so they get their own cap
+    app.config["MEDIA_MAX_RESUMABLE_BYTES"] = int(os.getenv("MEDIA_MAX_RESUMABLE_MB", "20480")) * 1024 * 1024
+    # threads rendering thumbnails/web copies of uploaded stills
+    app.config["MEDIA_RENDITION_WORKERS"] = int(os.getenv("MEDIA_RENDITION_WORKERS", "2"))
+    # live-event connections (/social/stream, waiting /social/events) held at
+    # once; keep it below the gunicorn thread count (gunicorn.conf.py)
+    app.config["SSE_MAX_STREAMS"] = int(os.getenv("SSE_MAX_STREAMS", "48"))
+
     # Initialize the database object with the settings above.
     app.logger.info("current_app(): starting the database connection")
     db.init_app(app)
@@ -54,6 +68,7 @@ def create_app():
     app.register_blueprint(social_bp, url_prefix="/social")
     app.register_blueprint(analytics_bp, url_prefix="/analytics")
     app.register_blueprint(creator_bp, url_prefix="/creator")
+    app.register_blueprint(media_bp, url_prefix="/media")
 
     # Don't forget to return the app object
     return app
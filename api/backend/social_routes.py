@@ -1,5 +1,17 @@
-from flask import Blueprint, jsonify, request, current_app
+import secrets
+import threading
+import time
+from collections import Counter
+
+from flask import Blueprint, Response, jsonify, request, current_app, stream_with_context
 from backend.db_connection import db
+from backend.cache import TTLCache
+from backend.events import hub
+from backend.media import blob_info, media_url as blob_media_url
+from backend.ml_models.credit_momentum import momentum_buffer
+from backend.pagination import decode_cursor, page_of, parse_limit
+from backend.tag_usage import adjust_tag_usage, count_tag_change
+from backend.unread_counts import adjust_unread, get_unread_count
 
 social_bp = Blueprint("social", __name__)
 
@@ -11,6 +23,68 @@ def get_dict_cursor():
     return conn, cursor
 
 
+def post_audience(post):
+    """Public posts go to every subscriber, private ones only to the owner."""
+    if post.get("visibility", "public") == "public":
+        return None
+    return [post["user_id"]]
+
+
+# HOT-POST CACHE
+# Post rows and their engagement counts, invalidated by the post and
+# interaction handlers below right after they commit.
+post_cache = TTLCache("posts", maxsize=10000, ttl=300)
+engagement_cache = TTLCache("post_engagement", maxsize=10000, ttl=60)
+
+
+def load_post(cursor, post_id):
+    """Live (not deleted) post row, from the cache when possible."""
+    post = post_cache.get(post_id)
+    if post is None:
+        cursor.execute(
+            """
+            SELECT
+                post_id, user_id, media_url, blob_id, caption,
+                tags, visibility, created_at
+            FROM Posts
+            WHERE post_id = %s AND is_deleted = FALSE
+            """,
+            (post_id,),
+        )
+        post = cursor.fetchone()
+        if post:
+            post_cache.set(post_id, post)
+    return post
+
+
+def load_engagement(cursor, post_id):
+    """View/like/comment counts for a post, from the cache when possible."""
+    summary = engagement_cache.get(post_id)
+    if summary is None:
+        cursor.execute(
+            """
+            SELECT interaction_type, COUNT(*) AS total
+            FROM PostInteractions
+            WHERE post_id = %s
+            GROUP BY interaction_type
+            """,
+            (post_id,),
+        )
+        counts = {row["interaction_type"]: row["total"] for row in cursor.fetchall()}
+        summary = {
+            "view_count": counts.get("view", 0),
+            "like_count": counts.get("like", 0),
+            "comment_count": counts.get("comment", 0),
+        }
+        engagement_cache.set(post_id, summary)
+    return summary
+
+
+def invalidate_post(post_id):
+    post_cache.invalidate(post_id)
+    engagement_cache.invalidate(post_id)
+
+
 # POSTS
 
 @social_bp.get("/posts")
@@ -68,12 +142,15 @@ def create_post():
     """
     Create a new post (media optional).
     REST Matrix: POST /posts
+    Media is either an external media_url or the blob_id of a file
+    uploaded with POST /media.
     """
     data = request.get_json(silent=True) or {}
 
     user_id = data.get("user_id")
     caption = data.get("caption")
     media_url = data.get("media_url")       #optional
+    blob_id = data.get("blob_id")           #optional, instead of media_url
     visibility = data.get("visibility", "public")
     tags = data.get("tags", None)
 
@@ -83,30 +160,30 @@ def create_post():
     try:
         conn, cursor = get_dict_cursor()
 
+        if blob_id is not None:
+            if blob_info(cursor, blob_id) is None:
+                return jsonify({"error": "Unknown blob_id"}), 400
+            media_url = blob_media_url(blob_id)
+
         cursor.execute(
             """
             INSERT INTO Posts (
-                user_id, media_url, caption, tags, visibility
+                user_id, media_url, blob_id, caption, tags, visibility
             )
-            VALUES (%s, %s, %s, %s, %s)
+            VALUES (%s, %s, %s, %s, %s, %s)
             """,
-            (user_id, media_url, caption, tags, visibility),
+            (user_id, media_url, blob_id, caption, tags, visibility),
         )
-
         post_id = cursor.lastrowid
+
+        deltas = Counter()
+        count_tag_change(deltas, None, tags)
+        adjust_tag_usage(cursor, post_deltas=deltas)
         conn.commit()
 
-        cursor.execute(
-            """
-            SELECT
-                post_id, user_id, media_url, caption,
-                tags, visibility, created_at
-            FROM Posts
-            WHERE post_id = %s
-            """,
-            (post_id,),
-        )
-        new_post = cursor.fetchone()
+        new_post = load_post(cursor, post_id)
+
+        hub.publish("post.created", new_post, audience=post_audience(new_post))
 
         return jsonify(new_post), 201
 
@@ -116,6 +193,182 @@ def create_post():
 
 
 
+# Bulk imports are capped per request and written in chunks so a single
+# INSERT statement stays well under max_allowed_packet.
+POST_BATCH_MAX = 5000
+POST_BATCH_CHUNK = 500
+POST_VISIBILITIES = ("public", "private")
+
+
+@social_bp.post("/posts/batch")
+def create_posts_batch():
+    """
+    Create many posts in one request (imports/migrations).
+    Every post is validated first, including that each user_id exists;
+    rows are then written with chunked multi-row INSERTs inside a single
+    transaction and their post_ids read back by import_batch.
+    Request body:
+    {
+      "posts": [
+        {"user_id": 1, "caption": "...", "media_url": "...",
+         "tags": "...", "visibility": "public"},
+        ...
+      ]
+    }
+    """
+    data = request.get_json(silent=True) or {}
+    posts = data.get("posts")
+
+    if not isinstance(posts, list) or not posts:
+        return jsonify({"error": "Missing required field: posts (non-empty list)"}), 400
+
+    if len(posts) > POST_BATCH_MAX:
+        return jsonify({"error": f"Too many posts (max {POST_BATCH_MAX} per request)"}), 400
+
+    rows = []
+    errors = []
+
+    for index, post in enumerate(posts):
+        if not isinstance(post, dict):
+            errors.append({"index": index, "error": "Post must be an object"})
+            continue
+
+        user_id = post.get("user_id")
+        visibility = post.get("visibility", "public")
+
+        if not user_id:
+            errors.append({"index": index, "error": "Missing required field: user_id"})
+            continue
+        try:
+            user_id = int(user_id)
+        except (TypeError, ValueError):
+            errors.append({"index": index, "error": "user_id must be an integer"})
+            continue
+
+        if visibility not in POST_VISIBILITIES:
+            errors.append({"index": index, "error": f"Invalid visibility: {visibility}"})
+            continue
+
+        rows.append(
+            (
+                user_id,
+                post.get("media_url"),
+                post.get("caption"),
+                post.get("tags"),
+                visibility,
+            )
+        )
+
+    if errors:
+        return jsonify({"error": "Invalid posts in batch", "details": errors}), 400
+
+    try:
+        conn, cursor = get_dict_cursor()
+
+        user_ids = sorted({row[0] for row in rows})
+        placeholders = ", ".join(["%s"] * len(user_ids))
+        cursor.execute(f"SELECT user_id FROM Users WHERE user_id IN ({placeholders})", user_ids)
+        known = {row["user_id"] for row in cursor.fetchall()}
+        unknown = [user_id for user_id in user_ids if user_id not in known]
+        if unknown:
+            conn.commit()
+            return jsonify({
+                "error": "Unknown user_id in batch",
+                "details": [
+                    {"index": index, "error": f"Unknown user_id: {row[0]}"}
+                    for index, row in enumerate(rows) if row[0] not in known
+                ],
+                "unknown_user_ids": unknown,
+            }), 400
+
+        # auto-increment ids of one INSERT are not guaranteed consecutive
+        # (interleaved lock mode, auto_increment_increment), so each row is
+        # tagged with this request's batch id and its index and read back
+        batch_id = secrets.token_hex(16)
+        post_ids = []
+        try:
+            for start in range(0, len(rows), POST_BATCH_CHUNK):
+                chunk = rows[start:start + POST_BATCH_CHUNK]
+                placeholders = ", ".join(["(%s, %s, %s, %s, %s, %s, %s)"] * len(chunk))
+                params = [
+                    value
+                    for index, row in enumerate(chunk, start)
+                    for value in (*row, batch_id, index)
+                ]
+
+                cursor.execute(
+                    f"""
+                    INSERT INTO Posts (
+                        user_id, media_url, caption, tags, visibility,
+                        import_batch, import_index
+                    )
+                    VALUES {placeholders}
+                    """,
+                    params,
+                )
+
+            cursor.execute(
+                """
+                SELECT post_id
+                FROM Posts
+                WHERE import_batch = %s
+                ORDER BY import_index
+                """,
+                (batch_id,),
+            )
+            post_ids = [row["post_id"] for row in cursor.fetchall()]
+
+            deltas = Counter()
+            for row in rows:
+                count_tag_change(deltas, None, row[3])
+            adjust_tag_usage(cursor, post_deltas=deltas)
+            conn.commit()
+
+        except Exception:
+            conn.rollback()
+            raise
+
+        for post_id, row in zip(post_ids, rows):
+            user_id, media_url, caption, tags, visibility = row
+            new_post = {
+                "post_id": post_id,
+                "user_id": user_id,
+                "media_url": media_url,
+                "caption": caption,
+                "tags": tags,
+                "visibility": visibility,
+            }
+            hub.publish("post.created", new_post, audience=post_audience(new_post))
+
+        return jsonify({"post_ids": post_ids, "count": len(post_ids)}), 201
+
+    except Exception:
+        current_app.logger.exception("Error creating post batch")
+        return jsonify({"error": "Failed to create posts"}), 500
+
+
+
+@social_bp.get("/posts/<int:post_id>")
+def get_post(post_id):
+    """
+    A single post with its engagement counts.
+    Served from the in-process hot-post cache when possible.
+    """
+    try:
+        conn, cursor = get_dict_cursor()
+
+        post = load_post(cursor, post_id)
+        if not post:
+            return jsonify({"error": "Post not found"}), 404
+
+        return jsonify({**post, "engagement": load_engagement(cursor, post_id)}), 200
+
+    except Exception:
+        current_app.logger.exception("Error fetching post")
+        return jsonify({"error": "Failed to fetch post"}), 500
+
+
+
 @social_bp.put("/posts/<int:post_id>")
 def update_post(post_id):
     """
@@ -149,6 +402,20 @@ def update_post(post_id):
         if not updates:
             return jsonify({"error": "Nothing to update"}), 400
 
+        # lock the row so the tag usage delta is taken against its real
+        # previous tags
+        old_tags = None
+        if tags is not None:
+            cursor.execute(
+                "SELECT tags FROM Posts WHERE post_id = %s AND is_deleted = FALSE FOR UPDATE",
+                (post_id,),
+            )
+            row = cursor.fetchone()
+            if row is None:
+                conn.rollback()
+                return jsonify({"error": "Post not found"}), 404
+            old_tags = row["tags"]
+
         params.append(post_id)
 
         cursor.execute(
@@ -161,21 +428,27 @@ def update_post(post_id):
         )
 
         if cursor.rowcount == 0:
+            conn.rollback()
             return jsonify({"error": "Post not found"}), 404
 
+        if tags is not None:
+            deltas = Counter()
+            count_tag_change(deltas, old_tags, tags)
+            adjust_tag_usage(cursor, post_deltas=deltas)
         conn.commit()
 
-        cursor.execute(
-            """
-            SELECT
-                post_id, user_id, media_url, caption,
-                tags, visibility, created_at
-            FROM Posts
-            WHERE post_id = %s
-            """,
-            (post_id,),
-        )
-        updated = cursor.fetchone()
+        # patch the cached row instead of reading the post back
+        cached = post_cache.get(post_id)
+        if cached is not None:
+            updated = dict(cached)
+            for field, value in (("caption", caption), ("tags", tags), ("visibility", visibility)):
+                if value is not None:
+                    updated[field] = value
+            post_cache.set(post_id, updated)
+        else:
+            updated = load_post(cursor, post_id)
+
+        hub.publish("post.updated", updated, audience=post_audience(updated))
 
         return jsonify(updated), 200
 
@@ -194,19 +467,34 @@ def delete_post(post_id):
     try:
         conn, cursor = get_dict_cursor()
 
+        cursor.execute(
+            "SELECT tags FROM Posts WHERE post_id = %s AND is_deleted = FALSE FOR UPDATE",
+            (post_id,),
+        )
+        live = cursor.fetchone()
+
         cursor.execute(
             """
             UPDATE Posts
-            SET is_deleted = TRUE
+            SET is_deleted = TRUE,
+                deleted_at = COALESCE(deleted_at, NOW())
             WHERE post_id = %s
             """,
             (post_id,),
         )
 
         if cursor.rowcount == 0:
+            conn.rollback()
             return jsonify({"error": "Post not found"}), 404
 
+        if live is not None:
+            deltas = Counter()
+            count_tag_change(deltas, live["tags"], None)
+            adjust_tag_usage(cursor, post_deltas=deltas)
         conn.commit()
+        invalidate_post(post_id)
+
+        hub.publish("post.deleted", {"post_id": post_id})
 
         return jsonify({"message": "Post removed", "post_id": post_id}), 200
 
@@ -257,10 +545,158 @@ def list_post_interactions():
 
 
 
+@social_bp.get("/posts/<int:post_id>/comments")
+def list_post_comments(post_id):
+    """
+    Comments on a post, newest first, one page at a time.
+    Query: ?limit=20&cursor=<next_cursor from the previous page>
+    Keyset-paged on (created_at, interaction_id) using
+    idx_postinteractions_post_type_created.
+    """
+    try:
+        limit = parse_limit(request.args.get("limit"), default=20, maximum=100)
+        cursor_token = request.args.get("cursor")
+        after = decode_cursor(cursor_token, 2) if cursor_token else None
+    except ValueError:
+        return jsonify({"error": "Invalid limit or cursor"}), 400
+
+    try:
+        conn, cursor = get_dict_cursor()
+
+        conditions = ["post_id = %s", "interaction_type = 'comment'"]
+        params = [post_id]
+
+        if after:
+            conditions.append(
+                "(created_at < %s OR (created_at = %s AND interaction_id < %s))"
+            )
+            params.extend([after[0], after[0], after[1]])
+
+        params.append(limit + 1)
+
+        cursor.execute(
+            f"""
+            SELECT
+                interaction_id,
+                post_id,
+                user_id,
+                comment_text,
+                created_at
+            FROM PostInteractions
+            WHERE {" AND ".join(conditions)}
+            ORDER BY created_at DESC, interaction_id DESC
+            LIMIT %s
+            """,
+            params,
+        )
+        comments, next_cursor = page_of(
+            cursor.fetchall(), limit,
+            key=lambda row: (row["created_at"], row["interaction_id"]),
+        )
+
+        return jsonify({"comments": comments, "next_cursor": next_cursor}), 200
+
+    except Exception:
+        current_app.logger.exception("Error fetching comments")
+        return jsonify({"error": "Failed to fetch comments"}), 500
+
+
+
+def interaction_audience(cursor, post_id, user_id):
+    """Interactions on private posts only stream to the owner and the actor."""
+    post = load_post(cursor, post_id)
+    audience = post_audience(post) if post else []
+    if audience is not None:
+        audience.append(user_id)
+    return audience
+
+
+def upsert_like(cursor, post_id, user_id):
+    """
+    Record a like at most once per (post_id, user_id).
+    The unique key on (post_id, like_user_id) turns a repeat like into a
+    no-op; LAST_INSERT_ID(expr) hands back the existing row's id.
+    Returns (interaction_id, created).
+    """
+    cursor.execute(
+        """
+        INSERT INTO PostInteractions (
+            post_id, user_id, interaction_type, comment_text
+        )
+        VALUES (%s, %s, 'like', NULL)
+        ON DUPLICATE KEY UPDATE interaction_id = LAST_INSERT_ID(interaction_id)
+        """,
+        (post_id, user_id),
+    )
+    return cursor.lastrowid, cursor.rowcount == 1
+
+
+def delete_like(cursor, post_id, user_id):
+    """
+    Remove a user's like from a post. Returns the like's age in days, or
+    None if there was no like.
+    """
+    cursor.execute(
+        """
+        SELECT interaction_id,
+               TIMESTAMPDIFF(SECOND, created_at, NOW()) / 86400 AS age_days
+        FROM PostInteractions
+        WHERE post_id = %s AND like_user_id = %s
+        FOR UPDATE
+        """,
+        (post_id, user_id),
+    )
+    like = cursor.fetchone()
+    if like is None:
+        return None
+    cursor.execute(
+        "DELETE FROM PostInteractions WHERE interaction_id = %s",
+        (like["interaction_id"],),
+    )
+    return float(like["age_days"])
+
+
+def record_engagement(cursor, post_id, interaction_type):
+    """
+    Credit the post's owner with momentum for a new interaction. Buffered
+    and written in the background, so it adds no writes to the request.
+    """
+    post = load_post(cursor, post_id)
+    if post:
+        momentum_buffer.add(current_app._get_current_object(), post["user_id"], interaction_type)
+
+
+def retract_like(cursor, post_id, age_days):
+    """Take a removed like's momentum back off the post's owner."""
+    post = load_post(cursor, post_id)
+    if post:
+        momentum_buffer.retract(current_app._get_current_object(), post["user_id"], "like", age_days)
+
+
+def fetch_interaction(cursor, interaction_id):
+    cursor.execute(
+        """
+        SELECT
+            interaction_id,
+            post_id,
+            user_id,
+            interaction_type,
+            comment_text,
+            created_at
+        FROM PostInteractions
+        WHERE interaction_id = %s
+        """,
+        (interaction_id,),
+    )
+    return cursor.fetchone()
+
+
 @social_bp.post("/post-interactions")
 def create_post_interaction():
     """
     Record a view/like/comment on a post.
+    Likes are idempotent: liking the same post twice returns the
+    existing like with 200 instead of creating a second row.
     REST Matrix: POST /post-interactions
     """
     data = request.get_json(silent=True) or {}
@@ -273,37 +709,42 @@ def create_post_interaction():
     if not (post_id and user_id and interaction_type):
         return jsonify({"error": "Missing required fields"}), 400
 
+    try:
+        post_id = int(post_id)
+    except (TypeError, ValueError):
+        return jsonify({"error": "post_id must be an integer"}), 400
+
     try:
         conn, cursor = get_dict_cursor()
 
-        cursor.execute(
-            """
-            INSERT INTO PostInteractions (
-                post_id, user_id, interaction_type, comment_text
+        if interaction_type == "like":
+            interaction_id, created = upsert_like(cursor, post_id, user_id)
+        else:
+            cursor.execute(
+                """
+                INSERT INTO PostInteractions (
+                    post_id, user_id, interaction_type, comment_text
+                )
+                VALUES (%s, %s, %s, %s)
+                """,
+                (post_id, user_id, interaction_type, comment_text),
             )
-            VALUES (%s, %s, %s, %s)
-            """,
-            (post_id, user_id, interaction_type, comment_text),
-        )
+            interaction_id, created = cursor.lastrowid, True
 
-        interaction_id = cursor.lastrowid
         conn.commit()
+        if created:
+            engagement_cache.invalidate(post_id)
+            record_engagement(cursor, post_id, interaction_type)
 
-        cursor.execute(
-            """
-            SELECT
-                interaction_id,
-                post_id,
-                user_id,
-                interaction_type,
-                comment_text,
-                created_at
-            FROM PostInteractions
-            WHERE interaction_id = %s
-            """,
-            (interaction_id,),
+        new_row = fetch_interaction(cursor, interaction_id)
+
+        if not created:
+            return jsonify(new_row), 200
+
+        hub.publish(
+            "interaction.created", new_row,
+            audience=interaction_audience(cursor, post_id, user_id),
         )
-        new_row = cursor.fetchone()
 
         return jsonify(new_row), 201
 
@@ -313,6 +754,136 @@ def create_post_interaction():
 
 
 
+# LIKES
+
+@social_bp.post("/posts/<int:post_id>/likes")
+def like_post(post_id):
+    """
+    Like a post (idempotent).
+    Request JSON: {"user_id": 1}
+    """
+    data = request.get_json(silent=True) or {}
+    user_id = data.get("user_id")
+
+    if not user_id:
+        return jsonify({"error": "Missing required field: user_id"}), 400
+
+    try:
+        conn, cursor = get_dict_cursor()
+
+        interaction_id, created = upsert_like(cursor, post_id, user_id)
+        conn.commit()
+        if created:
+            engagement_cache.invalidate(post_id)
+            record_engagement(cursor, post_id, "like")
+
+        like = fetch_interaction(cursor, interaction_id)
+        if created:
+            hub.publish(
+                "interaction.created", like,
+                audience=interaction_audience(cursor, post_id, user_id),
+            )
+
+        return jsonify(
+            {"liked": True, "like": like, "like_count": load_engagement(cursor, post_id)["like_count"]}
+        ), 201 if created else 200
+
+    except Exception:
+        current_app.logger.exception("Error liking post")
+        return jsonify({"error": "Failed to like post"}), 500
+
+
+
+@social_bp.delete("/posts/<int:post_id>/likes")
+def unlike_post(post_id):
+    """
+    Remove a user's like from a post.
+    Query: ?userID=#
+    """
+    user_id = request.args.get("userID")
+
+    if not user_id:
+        return jsonify({"error": "Missing required query parameter: userID"}), 400
+
+    try:
+        conn, cursor = get_dict_cursor()
+
+        age_days = delete_like(cursor, post_id, user_id)
+        if age_days is None:
+            conn.rollback()
+            return jsonify({"error": "Like not found"}), 404
+
+        conn.commit()
+        engagement_cache.invalidate(post_id)
+        retract_like(cursor, post_id, age_days)
+
+        hub.publish(
+            "like.removed", {"post_id": post_id, "user_id": user_id},
+            audience=interaction_audience(cursor, post_id, user_id),
+        )
+
+        return jsonify(
+            {"liked": False, "like_count": load_engagement(cursor, post_id)["like_count"]}
+        ), 200
+
+    except Exception:
+        current_app.logger.exception("Error unliking post")
+        return jsonify({"error": "Failed to unlike post"}), 500
+
+
+
+@social_bp.post("/posts/<int:post_id>/likes/toggle")
+def toggle_like(post_id):
+    """
+    Like the post if the user has not liked it yet, otherwise unlike it.
+    Request JSON: {"user_id": 1}
+    """
+    data = request.get_json(silent=True) or {}
+    user_id = data.get("user_id")
+
+    if not user_id:
+        return jsonify({"error": "Missing required field: user_id"}), 400
+
+    try:
+        conn, cursor = get_dict_cursor()
+
+        # an unlike takes the like's momentum back, so liking again
+        # counts once, not once per toggle
+        age_days = delete_like(cursor, post_id, user_id)
+        liked = age_days is None
+
+        if liked:
+            interaction_id, _ = upsert_like(cursor, post_id, user_id)
+
+        conn.commit()
+        engagement_cache.invalidate(post_id)
+        if liked:
+            record_engagement(cursor, post_id, "like")
+        else:
+            retract_like(cursor, post_id, age_days)
+
+        audience = interaction_audience(cursor, post_id, user_id)
+        if liked:
+            hub.publish(
+                "interaction.created", fetch_interaction(cursor, interaction_id),
+                audience=audience,
+            )
+        else:
+            hub.publish(
+                "like.removed", {"post_id": post_id, "user_id": user_id},
+                audience=audience,
+            )
+
+        return jsonify(
+            {"liked": liked, "like_count": load_engagement(cursor, post_id)["like_count"]}
+        ), 200
+
+    except Exception:
+        current_app.logger.exception("Error toggling like")
+        return jsonify({"error": "Failed to toggle like"}), 500
+
+
+
 @social_bp.delete("/post-interactions/<int:interaction_id>")
 def delete_post_interaction(interaction_id):
     """
@@ -391,6 +962,124 @@ def list_messages():
 
 
 
+def boolean_search_terms(text):
+    """
+    Turn free text into a FULLTEXT boolean-mode query where every word is
+    required and may be a prefix ("mix mast" -> "+mix* +mast*"). Operator
+    characters typed by the user are dropped.
+    """
+    words = "".join(ch if ch.isalnum() else " " for ch in text).split()
+    return " ".join(f"+{word}*" for word in words)
+
+
+@social_bp.get("/messages/search")
+def search_messages():
+    """
+    Full-text search over the messages a user can see, newest first,
+    each with its relevance score.
+    Query: ?userID=#&q=text&limit=20&cursor=<next_cursor>
+    Uses the ft_messages_search index; the user's msgowner word is a
+    required term, so the index only returns that user's conversations,
+    not every user's matches. Keyset-paged on (created_at, message_id):
+    relevance scores shift as the index changes, so they cannot carry a
+    cursor.
+    """
+    user_id = request.args.get("userID")
+    terms = boolean_search_terms(request.args.get("q", ""))
+
+    if not user_id:
+        return jsonify({"error": "Missing required query parameter: userID"}), 400
+    if not terms:
+        return jsonify({"error": "Missing required query parameter: q"}), 400
+    try:
+        user_id = int(user_id)
+    except ValueError:
+        return jsonify({"error": "userID must be an integer"}), 400
+    terms = f"+msgowner{user_id} {terms}"
+
+    try:
+        limit = parse_limit(request.args.get("limit"), default=20, maximum=100)
+        cursor_token = request.args.get("cursor")
+        after = decode_cursor(cursor_token, 2) if cursor_token else None
+    except ValueError:
+        return jsonify({"error": "Invalid limit or cursor"}), 400
+
+    try:
+        conn, cursor = get_dict_cursor()
+
+        conditions = [
+            "MATCH(search_owners, content) AGAINST (%s IN BOOLEAN MODE)",
+            """(
+                (sender_id = %s AND is_deleted_by_sender = FALSE)
+                OR
+                (receiver_id = %s AND is_deleted_by_receiver = FALSE)
+            )""",
+        ]
+        params = [terms, terms, user_id, user_id]
+
+        if after:
+            conditions.append(
+                "(created_at < %s OR (created_at = %s AND message_id < %s))"
+            )
+            params.extend([after[0], after[0], after[1]])
+
+        params.append(limit + 1)
+
+        cursor.execute(
+            f"""
+            SELECT
+                message_id,
+                sender_id,
+                receiver_id,
+                content,
+                is_read,
+                is_starred,
+                is_archived,
+                created_at,
+                MATCH(search_owners, content) AGAINST (%s IN BOOLEAN MODE) AS score
+            FROM Messages
+            WHERE {" AND ".join(conditions)}
+            ORDER BY created_at DESC, message_id DESC
+            LIMIT %s
+            """,
+            params,
+        )
+        messages, next_cursor = page_of(
+            cursor.fetchall(), limit,
+            key=lambda row: (row["created_at"], row["message_id"]),
+        )
+
+        return jsonify({"messages": messages, "next_cursor": next_cursor}), 200
+
+    except Exception:
+        current_app.logger.exception("Error searching messages")
+        return jsonify({"error": "Failed to search messages"}), 500
+
+
+
+@social_bp.get("/messages/unread-count")
+def get_unread_message_count():
+    """
+    Unread-message badge for a user: a single counter-row lookup.
+    Query: ?userID=#
+    """
+    user_id = request.args.get("userID")
+
+    if not user_id:
+        return jsonify({"error": "Missing required query parameter: userID"}), 400
+
+    try:
+        conn, cursor = get_dict_cursor()
+        return jsonify(
+            {"user_id": user_id, "unread_count": get_unread_count(cursor, user_id)}
+        ), 200
+
+    except Exception:
+        current_app.logger.exception("Error fetching unread count")
+        return jsonify({"error": "Failed to fetch unread count"}), 500
+
+
+
 @social_bp.post("/messages")
 def create_message():
     """
@@ -420,6 +1109,7 @@ def create_message():
         )
 
         message_id = cursor.lastrowid
+        adjust_unread(cursor, {receiver_id: 1})
         conn.commit()
 
         cursor.execute(
@@ -440,6 +1130,8 @@ def create_message():
         )
         new_msg = cursor.fetchone()
 
+        hub.publish("message.created", new_msg, audience=[sender_id, receiver_id])
+
         return jsonify(new_msg), 201
 
     except Exception:
@@ -463,6 +1155,21 @@ def update_message(message_id):
     try:
         conn, cursor = get_dict_cursor()
 
+        # lock the row so the unread counter sees a consistent before/after
+        cursor.execute(
+            """
+            SELECT receiver_id, is_read, is_deleted_by_receiver
+            FROM Messages
+            WHERE message_id = %s
+            FOR UPDATE
+            """,
+            (message_id,),
+        )
+        current = cursor.fetchone()
+
+        if not current:
+            return jsonify({"error": "Message not found"}), 404
+
         updates = []
         params = []
 
@@ -492,8 +1199,12 @@ def update_message(message_id):
             params,
         )
 
-        if cursor.rowcount == 0:
-            return jsonify({"error": "Message not found"}), 404
+        if (
+            is_read is not None
+            and bool(is_read) != bool(current["is_read"])
+            and not current["is_deleted_by_receiver"]
+        ):
+            adjust_unread(cursor, {current["receiver_id"]: -1 if is_read else 1})
 
         conn.commit()
 
@@ -523,6 +1234,183 @@ def update_message(message_id):
 
 
 
+# Bulk message updates work through at most this many rows per
+# statement/transaction so one request never holds locks for long.
+MESSAGE_BULK_CHUNK = 500
+MESSAGE_BULK_MAX_IDS = 10000
+# Messages has one copy of each flag and it describes the receiver's
+# inbox (read, starred, archived there), so only the receiver may set it
+MESSAGE_FLAGS = ("is_read", "is_starred", "is_archived")
+
+
+def parse_flag(value, name):
+    """Strict boolean for a JSON flag value; raises ValueError."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str) and value.strip().lower() in ("true", "1", "false", "0"):
+        return value.strip().lower() in ("true", "1")
+    raise ValueError(f"{name} must be true or false")
+
+
+@social_bp.put("/messages")
+def bulk_update_messages():
+    """
+    Set read/starred/archived flags on many of a user's messages at once.
+    The flags belong to the receiver, so only messages the user received
+    (and has not deleted) are touched; ids of sent messages are skipped.
+    Request body:
+    {
+      "user_id": 1,
+      "message_ids": [1, 2, 3],            // either explicit ids ...
+      "conversation_with": 7,              // ... or a selector: the thread with user 7
+      "filter": {"is_read": false},        //     and/or current flag values
+      "set": {"is_read": true}
+    }
+    """
+    data = request.get_json(silent=True) or {}
+
+    user_id = data.get("user_id")
+    message_ids = data.get("message_ids")
+    conversation_with = data.get("conversation_with")
+    flag_filter = data.get("filter") or {}
+    changes = data.get("set") or {}
+
+    if not user_id:
+        return jsonify({"error": "Missing required field: user_id"}), 400
+    if not isinstance(flag_filter, dict) or not isinstance(changes, dict):
+        return jsonify({"error": "filter and set must be objects"}), 400
+
+    try:
+        changes = {
+            flag: parse_flag(value, flag)
+            for flag, value in changes.items() if flag in MESSAGE_FLAGS
+        }
+        flag_filter = {
+            flag: parse_flag(value, flag)
+            for flag, value in flag_filter.items() if flag in MESSAGE_FLAGS
+        }
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    if not changes:
+        return jsonify({"error": "Nothing to update"}), 400
+
+    if message_ids is not None:
+        if not isinstance(message_ids, list) or not message_ids:
+            return jsonify({"error": "message_ids must be a non-empty list"}), 400
+        if len(message_ids) > MESSAGE_BULK_MAX_IDS:
+            return jsonify({"error": f"Too many message_ids (max {MESSAGE_BULK_MAX_IDS})"}), 400
+        try:
+            message_ids = sorted({int(message_id) for message_id in message_ids})
+        except (TypeError, ValueError):
+            return jsonify({"error": "message_ids must be integers"}), 400
+    elif not conversation_with and not flag_filter:
+        return jsonify({"error": "Provide message_ids, conversation_with or filter"}), 400
+
+    # ownership: messages the user received and still has
+    conditions = ["receiver_id = %s", "is_deleted_by_receiver = FALSE"]
+    base_params = [user_id]
+    if conversation_with:
+        conditions.append("sender_id = %s")
+        base_params.append(conversation_with)
+
+    for flag, value in flag_filter.items():
+        conditions.append(f"{flag} = %s")
+        base_params.append(value)
+
+    set_clause = ", ".join(f"{flag} = %s" for flag in changes)
+    set_params = list(changes.values())
+
+    try:
+        conn, cursor = get_dict_cursor()
+
+        matched = 0
+        updated = 0
+        chunks = 0
+        owned_ids = set()
+
+        def apply_chunk(rows):
+            nonlocal updated
+            chunk_ids = [row["message_id"] for row in rows]
+            placeholders = ", ".join(["%s"] * len(chunk_ids))
+
+            cursor.execute(
+                f"""
+                UPDATE Messages
+                SET {set_clause}
+                WHERE message_id IN ({placeholders})
+                """,
+                set_params + chunk_ids,
+            )
+            updated += cursor.rowcount
+
+            if "is_read" in changes:
+                deltas = {}
+                for row in rows:
+                    if bool(row["is_read"]) != changes["is_read"] and not row["is_deleted_by_receiver"]:
+                        receiver = row["receiver_id"]
+                        deltas[receiver] = deltas.get(receiver, 0) + (-1 if changes["is_read"] else 1)
+                adjust_unread(cursor, deltas)
+
+            conn.commit()
+
+        select_sql = f"""
+            SELECT message_id, receiver_id, is_read, is_deleted_by_receiver
+            FROM Messages
+            WHERE {" AND ".join(conditions)}
+              AND {{extra}}
+            ORDER BY message_id
+            {{limit}}
+            FOR UPDATE
+        """
+
+        if message_ids is not None:
+            for start in range(0, len(message_ids), MESSAGE_BULK_CHUNK):
+                chunk = message_ids[start:start + MESSAGE_BULK_CHUNK]
+                placeholders = ", ".join(["%s"] * len(chunk))
+                cursor.execute(
+                    select_sql.format(extra=f"message_id IN ({placeholders})", limit=""),
+                    base_params + chunk,
+                )
+                rows = cursor.fetchall()
+                chunks += 1
+                if not rows:
+                    conn.commit()
+                    continue
+                matched += len(rows)
+                owned_ids.update(row["message_id"] for row in rows)
+                apply_chunk(rows)
+        else:
+            last_id = 0
+            while True:
+                cursor.execute(
+                    select_sql.format(extra="message_id > %s", limit="LIMIT %s"),
+                    base_params + [last_id, MESSAGE_BULK_CHUNK],
+                )
+                rows = cursor.fetchall()
+                if not rows:
+                    conn.commit()
+                    break
+                chunks += 1
+                matched += len(rows)
+                last_id = rows[-1]["message_id"]
+                apply_chunk(rows)
+
+        result = {"matched": matched, "updated": updated, "chunks": chunks}
+        if message_ids is not None:
+            result["skipped_ids"] = [
+                message_id for message_id in message_ids if message_id not in owned_ids
+            ]
+
+        return jsonify(result), 200
+
+    except Exception:
+        current_app.logger.exception("Error bulk updating messages")
+        return jsonify({"error": "Failed to update messages"}), 500
+
+
+
 @social_bp.delete("/messages/<int:message_id>")
 def delete_message(message_id):
     """
@@ -540,9 +1428,10 @@ def delete_message(message_id):
         # Determine whether user is sender or receiver
         cursor.execute(
             """
-            SELECT sender_id, receiver_id
+            SELECT sender_id, receiver_id, is_read, is_deleted_by_receiver
             FROM Messages
             WHERE message_id = %s
+            FOR UPDATE
             """,
             (message_id,),
         )
@@ -564,6 +1453,8 @@ def delete_message(message_id):
                 "UPDATE Messages SET is_deleted_by_receiver = TRUE WHERE message_id = %s",
                 (message_id,),
             )
+            if not msg["is_read"] and not msg["is_deleted_by_receiver"]:
+                adjust_unread(cursor, {receiver_id: -1})
         else:
             return jsonify({"error": "User does not have permission to delete this message"}), 403
 
@@ -573,4 +1464,141 @@ def delete_message(message_id):
 
     except Exception:
         current_app.logger.exception("Error deleting message")
-        return jsonify({"error": "Failed to hide message"}), 500
\ No newline at end of file
+        return jsonify({"error": "Failed to hide message"}), 500
+
+
+# LIVE EVENTS
+
+SSE_HEARTBEAT_SECONDS = 15
+LONG_POLL_MAX_SECONDS = 30
+
+# Each open stream (and each waiting long-poll) occupies a server thread
+# for its whole lifetime; these count them against SSE_MAX_STREAMS.
+_live_lock = threading.Lock()
+_live_connections = 0
+
+
+def acquire_live_slot():
+    """Reserve a live-event connection slot; False when all are taken."""
+    global _live_connections
+    with _live_lock:
+        if _live_connections >= current_app.config.get("SSE_MAX_STREAMS", 48):
+            return False
+        _live_connections += 1
+        return True
+
+
+def release_live_slot():
+    global _live_connections
+    with _live_lock:
+        _live_connections -= 1
+
+
+def public_event(event):
+    return {"id": event["id"], "type": event["type"], "data": event["data"]}
+
+
+@social_bp.get("/stream")
+def stream_events():
+    """
+    Server-sent event stream of new posts, interactions and messages.
+    Clients resume with the standard Last-Event-ID header (or ?lastEventID=).
+    An event of type "resync" means the client fell behind and should
+    reload once instead of relying on deltas.
+    """
+    user_id = request.args.get("userID")
+
+    if not user_id:
+        return jsonify({"error": "Missing required query parameter: userID"}), 400
+
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get("lastEventID")
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        return jsonify({"error": "Invalid Last-Event-ID"}), 400
+
+    if not acquire_live_slot():
+        return jsonify(
+            {"error": "Too many live connections, retry later or long-poll /social/events"}
+        ), 503, {"Retry-After": str(SSE_HEARTBEAT_SECONDS)}
+
+    subscription = hub.subscribe(user_id, last_event_id)
+
+    def sse_frame(event):
+        payload = current_app.json.dumps(event["data"])
+        return f"id: {event['id']}\nevent: {event['type']}\ndata: {payload}\n\n"
+
+    def generate():
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                if subscription.lagged:
+                    subscription.lagged = False
+                    yield "event: resync\ndata: {}\n\n"
+
+                event = subscription.get(timeout=SSE_HEARTBEAT_SECONDS)
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                yield sse_frame(event)
+        finally:
+            hub.unsubscribe(subscription)
+
+    response = Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+    # runs even if the client goes away before the first frame, when the
+    # generator's finally never does
+    @response.call_on_close
+    def close_stream():
+        hub.unsubscribe(subscription)
+        release_live_slot()
+
+    return response
+
+
+@social_bp.get("/events")
+def poll_events():
+    """
+    Long-poll alternative to /stream for clients that cannot hold an
+    SSE connection open. Returns as soon as there is anything after
+    ?since=<event id>, or an empty list once ?timeout= seconds pass
+    (at once when every live-connection slot is taken).
+    """
+    user_id = request.args.get("userID")
+
+    if not user_id:
+        return jsonify({"error": "Missing required query parameter: userID"}), 400
+
+    try:
+        since = int(request.args.get("since", hub.latest_id()))
+        timeout = min(float(request.args.get("timeout", 25)), LONG_POLL_MAX_SECONDS)
+    except ValueError:
+        return jsonify({"error": "Invalid since/timeout"}), 400
+
+    events, complete = hub.events_since(user_id, since)
+
+    if not events and complete and acquire_live_slot():
+        subscription = hub.subscribe(user_id, since)
+        try:
+            deadline = time.monotonic() + timeout
+            first = subscription.get(timeout=max(deadline - time.monotonic(), 0))
+            if first is not None:
+                events = [first] + subscription.get_nowait_all()
+            complete = not subscription.lagged
+        finally:
+            hub.unsubscribe(subscription)
+            release_live_slot()
+
+    last_event_id = events[-1]["id"] if events else since
+
+    return jsonify(
+        {
+            "events": [public_event(event) for event in events],
+            "last_event_id": last_event_id,
+            "resync": not complete,
+        }
+    ), 200
@@ -0,0 +1,167 @@
+#------------------------------------------------------------
+# Tag usage counters for TrendTags
+#------------------------------------------------------------
+# Posts.tags and Projects.tags are free-text, comma-separated lists. A
+# tag's usage is the number of live posts (is_deleted = FALSE) plus live
+# projects (is_archived = FALSE) carrying it, matched case-insensitively
+# on the trimmed name (tag_key).
+#
+# The counts live in TagUsage, not TrendTags: every post/project write
+# that changes which tags are live calls adjust_tag_usage() inside its
+# own transaction, which adds +1/-1 deltas to TagUsage rows only, so
+# TrendTags is never locked by content writes. Each tag's count is split
+# over TAG_SLOTS rows and a writer picks one slot at random, so a popular
+# tag does not serialise every writer on one row; a reader sums at most
+# TAG_SLOTS rows through the primary key.
+#
+# recount_tag_usage() rebuilds the counts from the source tables: it
+# streams tags and reads TagUsage in one consistent snapshot, then adds
+# (true count - stored count) as a correction. Deltas committed while it
+# runs are never overwritten, so the result is exact without locks.
+import random
+from collections import Counter
+
+import pymysql.cursors
+
+from backend.jobs import throttle
+
+TAG_SLOTS = 8
+TAG_KEY_MAX = 100
+
+# SUM over one tag's slots; TrendTags.tag_key is LOWER(TRIM(tag_name))
+USAGE_COUNT_SQL = """
+    COALESCE((SELECT SUM(u.post_count + u.project_count)
+              FROM TagUsage u
+              WHERE u.tag_key = t.tag_key), 0)
+"""
+
+
+def tag_keys(tags):
+    """Set of normalised tag keys in a comma-separated tags value."""
+    if not tags:
+        return set()
+    keys = set()
+    for tag in str(tags).split(","):
+        key = tag.strip().lower()[:TAG_KEY_MAX]
+        if key:
+            keys.add(key)
+    return keys
+
+
+def count_tag_change(deltas, old_tags, new_tags):
+    """
+    Add the effect of a row going from old_tags to new_tags to `deltas`
+    (a Counter). Pass None for the side on which the row is not live
+    (not yet created, deleted, archived).
+    """
+    old, new = tag_keys(old_tags), tag_keys(new_tags)
+    for key in new - old:
+        deltas[key] += 1
+    for key in old - new:
+        deltas[key] -= 1
+
+
+def adjust_tag_usage(cursor, post_deltas=None, project_deltas=None):
+    """
+    Apply {tag_key: delta} counters for posts and projects. Must run
+    inside the caller's transaction (the caller commits).
+    """
+    post_deltas = post_deltas or {}
+    project_deltas = project_deltas or {}
+    keys = sorted(
+        key for key in set(post_deltas) | set(project_deltas)
+        if post_deltas.get(key) or project_deltas.get(key)
+    )
+    if not keys:
+        return
+
+    # one slot per transaction; keys in a fixed order so two writers
+    # touching the same tags cannot deadlock
+    slot = random.randrange(TAG_SLOTS)
+    placeholders = ", ".join(["(%s, %s, %s, %s)"] * len(keys))
+    cursor.execute(
+        f"""
+        INSERT INTO TagUsage (tag_key, slot, post_count, project_count)
+        VALUES {placeholders} AS new
+        ON DUPLICATE KEY UPDATE
+            post_count = TagUsage.post_count + new.post_count,
+            project_count = TagUsage.project_count + new.project_count
+        """,
+        [
+            value
+            for key in keys
+            for value in (key, slot, post_deltas.get(key, 0), project_deltas.get(key, 0))
+        ],
+    )
+
+
+def _stream_tag_counts(conn, sql, fetch_size, progress, name):
+    counts = Counter()
+    stream = conn.cursor(pymysql.cursors.SSCursor)
+    try:
+        stream.execute(sql)
+        while True:
+            rows = stream.fetchmany(fetch_size)
+            if not rows:
+                break
+            for (tags,) in rows:
+                counts.update(tag_keys(tags))
+            progress[name] += len(rows)
+    finally:
+        stream.close()
+    return counts
+
+
+def recount_tag_usage(conn, progress, fetch_size=10000, write_batch_size=1000, pause_seconds=0.05):
+    """
+    Maintenance job: recount tag usage over every post and project and
+    correct TagUsage to match.
+    """
+    cursor = conn.cursor()
+    progress.update(posts_scanned=0, projects_scanned=0, tags_seen=0, tags_corrected=0)
+
+    # everything below is read as of one instant
+    cursor.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT, READ ONLY")
+    posts = _stream_tag_counts(
+        conn,
+        "SELECT tags FROM Posts WHERE is_deleted = FALSE AND tags IS NOT NULL AND tags <> ''",
+        int(fetch_size), progress, "posts_scanned",
+    )
+    projects = _stream_tag_counts(
+        conn,
+        "SELECT tags FROM Projects WHERE is_archived = FALSE AND tags IS NOT NULL AND tags <> ''",
+        int(fetch_size), progress, "projects_scanned",
+    )
+    cursor.execute(
+        """
+        SELECT tag_key, SUM(post_count) AS post_count, SUM(project_count) AS project_count
+        FROM TagUsage
+        GROUP BY tag_key
+        """
+    )
+    stored = {row["tag_key"]: row for row in cursor.fetchall()}
+    conn.commit()
+
+    keys = set(posts) | set(projects) | set(stored)
+    progress["tags_seen"] = len(keys)
+    corrections = []
+    for key in sorted(keys):
+        row = stored.get(key) or {"post_count": 0, "project_count": 0}
+        post_delta = posts.get(key, 0) - int(row["post_count"])
+        project_delta = projects.get(key, 0) - int(row["project_count"])
+        if post_delta or project_delta:
+            corrections.append((key, post_delta, project_delta))
+
+    batch = int(write_batch_size)
+    for start in range(0, len(corrections), batch):
+        chunk = corrections[start:start + batch]
+        adjust_tag_usage(
+            cursor,
+            post_deltas={key: delta for key, delta, _ in chunk},
+            project_deltas={key: delta for key, _, delta in chunk},
+        )
+        conn.commit()
+        progress["tags_corrected"] += len(chunk)
+        throttle(pause_seconds)
+
+    return progress
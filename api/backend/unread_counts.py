@@ -0,0 +1,123 @@
+#------------------------------------------------------------
+# Per-user unread message counters
+#------------------------------------------------------------
+# MessageCounters.unread_count is the number of messages a user has
+# received, not read and not deleted on their side. The message handlers
+# in social_routes call adjust_unread() inside the same transaction as
+# the message write, so the badge is a primary-key lookup instead of a
+# scan of Messages. repair_unread_counts() recomputes the counters from
+# Messages in case they ever drift (e.g. rows edited by hand).
+from backend.jobs import throttle
+
+
+def adjust_unread(cursor, deltas):
+    """
+    Apply {user_id: delta} to the unread counters. Must run inside the
+    caller's transaction (the caller commits).
+    """
+    for user_id, delta in deltas.items():
+        if delta > 0:
+            cursor.execute(
+                """
+                INSERT INTO MessageCounters (user_id, unread_count)
+                VALUES (%s, %s) AS new
+                ON DUPLICATE KEY UPDATE
+                    unread_count = MessageCounters.unread_count + new.unread_count
+                """,
+                (user_id, delta),
+            )
+        elif delta < 0:
+            cursor.execute(
+                """
+                UPDATE MessageCounters
+                SET unread_count = GREATEST(unread_count + %s, 0)
+                WHERE user_id = %s
+                """,
+                (delta, user_id),
+            )
+
+
+def get_unread_count(cursor, user_id):
+    cursor.execute(
+        "SELECT unread_count FROM MessageCounters WHERE user_id = %s",
+        (user_id,),
+    )
+    row = cursor.fetchone()
+    return row["unread_count"] if row else 0
+
+
+def repair_unread_counts(conn, progress, window_size=1000, pause_seconds=0.05):
+    """
+    Recompute counters window by window over user ids. Each window locks
+    its counter rows first, so concurrent message writes for those users
+    wait and then apply their delta on top of the repaired value.
+    """
+    cursor = conn.cursor()
+
+    progress.update(windows=0, users_checked=0, counters_fixed=0)
+
+    cursor.execute(
+        """
+        SELECT GREATEST(
+            COALESCE((SELECT MAX(receiver_id) FROM Messages), 0),
+            COALESCE((SELECT MAX(user_id) FROM MessageCounters), 0)
+        ) AS max_id
+        """
+    )
+    max_id = cursor.fetchone()["max_id"]
+    conn.commit()
+
+    low = 0
+    while low <= max_id:
+        high = low + int(window_size)
+
+        cursor.execute(
+            """
+            SELECT user_id, unread_count
+            FROM MessageCounters
+            WHERE user_id >= %s AND user_id < %s
+            FOR UPDATE
+            """,
+            (low, high),
+        )
+        stored = {row["user_id"]: row["unread_count"] for row in cursor.fetchall()}
+
+        cursor.execute(
+            """
+            SELECT receiver_id, COUNT(*) AS unread_count
+            FROM Messages
+            WHERE receiver_id >= %s AND receiver_id < %s
+              AND is_read = FALSE
+              AND is_deleted_by_receiver = FALSE
+            GROUP BY receiver_id
+            """,
+            (low, high),
+        )
+        actual = {row["receiver_id"]: row["unread_count"] for row in cursor.fetchall()}
+
+        fixes = [
+            (user_id, actual.get(user_id, 0))
+            for user_id in set(stored) | set(actual)
+            if stored.get(user_id, 0) != actual.get(user_id, 0)
+        ]
+
+        if fixes:
+            cursor.executemany(
+                """
+                INSERT INTO MessageCounters (user_id, unread_count)
+                VALUES (%s, %s) AS new
+                ON DUPLICATE KEY UPDATE unread_count = new.unread_count
+                """,
+                fixes,
+            )
+
+        conn.commit()
+
+        progress["windows"] += 1
+        progress["users_checked"] += len(set(stored) | set(actual))
+        progress["counters_fixed"] += len(fixes)
+
+        low = high
+        throttle(pause_seconds)
+
+    return progress
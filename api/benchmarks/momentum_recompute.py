@@ -0,0 +1,44 @@
+###
+# Timing for the NumPy part of the recompute-momentum job
+#
+# Generates synthetic per-(user, day) event sums like the ones the job
+# streams from MySQL and times decayed_scores() on them, e.g.
+#   python -m benchmarks.momentum_recompute
+#   python -m benchmarks.momentum_recompute --users 1000000 --rows-per-user 20
+#
+# No database or running API needed; run from the api/ directory.
+###
+import argparse
+import time
+
+import numpy as np
+
+from backend.ml_models.credit_momentum import decayed_scores
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time the vectorized momentum recompute on synthetic events."
+    )
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--rows-per-user", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    rows = args.users * args.rows_per_user
+    user_ids = rng.integers(1, args.users + 1, size=rows)
+    age_days = rng.integers(0, 365, size=rows)
+    weights = rng.choice([0.1, 1.0, 2.0, 3.0, 4.0, 10.0], size=rows)
+
+    started = time.perf_counter()
+    scores = decayed_scores(user_ids, age_days, weights, args.users + 1)
+    elapsed = time.perf_counter() - started
+
+    print(f"{rows:,} (user, day) rows for {args.users:,} users")
+    print(f"decay + aggregate: {elapsed:.3f}s")
+    print(f"users with a score: {np.count_nonzero(scores):,}, max score {scores.max():.1f}")
+
+
+if __name__ == "__main__":
+    main()
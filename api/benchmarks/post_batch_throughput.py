@@ -0,0 +1,78 @@
+###
+# Throughput comparison: POST /social/posts vs POST /social/posts/batch
+#
+# Run against a running API (see docker-compose.yaml), e.g.
+#   python benchmarks/post_batch_throughput.py --count 2000
+#   python benchmarks/post_batch_throughput.py --api http://localhost:4000 --batch-size 1000
+#
+# Note: this really writes rows to the Posts table, so point it at a
+# sandbox database (sandbox.yaml maps the API to port 4001).
+###
+import argparse
+import json
+import time
+import urllib.request
+
+DEFAULT_API = "http://localhost:4000"
+
+
+def post_json(url, payload):
+    """POST a JSON payload and return (status, decoded body)."""
+    req = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(req) as resp:
+        return resp.status, json.loads(resp.read().decode("utf-8"))
+
+
+def make_post(user_id, i):
+    return {
+        "user_id": user_id,
+        "caption": f"benchmark post {i}",
+        "media_url": f"https://posts.example.com/bench_{i}.mp4",
+        "tags": "Benchmark",
+        "visibility": "public",
+    }
+
+
+def run_single(api, user_id, count):
+    start = time.perf_counter()
+    for i in range(count):
+        status, _ = post_json(f"{api}/social/posts", make_post(user_id, i))
+        if status != 201:
+            raise RuntimeError(f"single insert failed with HTTP {status}")
+    return time.perf_counter() - start
+
+
+def run_batch(api, user_id, count, batch_size):
+    start = time.perf_counter()
+    for offset in range(0, count, batch_size):
+        posts = [make_post(user_id, i) for i in range(offset, min(offset + batch_size, count))]
+        status, body = post_json(f"{api}/social/posts/batch", {"posts": posts})
+        if status != 201 or body.get("count") != len(posts):
+            raise RuntimeError(f"batch insert failed with HTTP {status}: {body}")
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare single vs batch post creation throughput.")
+    parser.add_argument("--api", default=DEFAULT_API)
+    parser.add_argument("--user-id", type=int, default=1)
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    single = run_single(args.api, args.user_id, args.count)
+    batch = run_batch(args.api, args.user_id, args.count, args.batch_size)
+
+    print(f"posts inserted per mode: {args.count}")
+    print(f"single endpoint: {single:8.2f}s  {args.count / single:10.1f} posts/s")
+    print(f"batch endpoint:  {batch:8.2f}s  {args.count / batch:10.1f} posts/s")
+    print(f"speedup:         {single / batch:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
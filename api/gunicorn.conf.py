@@ -0,0 +1,21 @@
+# Gunicorn settings for the API container (see Dockerfile).
+#
+# One process only: the caches, the live-event hub, the rendition pool and
+# the momentum buffer all live in memory and assume a single API process.
+# Threads serve requests concurrently instead; an SSE stream or a waiting
+# long-poll holds one, so they are capped below this count (SSE_MAX_STREAMS,
+# see backend/rest_entry.py) to leave threads for ordinary requests.
+#
+# Unlike the Werkzeug dev server, gunicorn provides wsgi.file_wrapper and
+# sends whole-file responses (GET /media/{blobID}) with sendfile().
+import os
+
+bind = "0.0.0.0:4000"
+workers = 1
+worker_class = "gthread"
+threads = 64
+
+# Restart on code edits only when asked to (GUNICORN_RELOAD=1, set for the
+# api service in docker-compose.yaml, which mounts ./api into the container)
+reload = os.getenv("GUNICORN_RELOAD") == "1"
+accesslog = "-"
@@ -0,0 +1,33 @@
+import pytest
+
+from backend.creator_routes import LIST_ENTRY_MAX, normalize_list_field
+
+
+def test_normalizes_spacing_and_repeats():
+    assert normalize_list_field("Comedy,Drama ,  Noir,,Comedy", "tools") == "Comedy, Drama, Noir"
+    assert normalize_list_field(["Premiere Pro", "After\tEffects, Resolve"], "tools") == (
+        "Premiere Pro, After Effects, Resolve"
+    )
+    assert normalize_list_field(None, "tools") is None
+    assert normalize_list_field("", "tools") == ""
+
+
+def test_quotes_and_backslashes_kept_as_typed():
+    # escaping for JSON happens in the style_list/tool_list columns
+    # (see database-files/01_reel_db.sql), not here
+    value = normalize_list_field('Cinéma "vérité", C:\\Edits\\, 16" film', "primary_styles")
+    assert value == 'Cinéma "vérité", C:\\Edits\\, 16" film'
+
+
+def test_long_entries_rejected():
+    assert normalize_list_field("x" * LIST_ENTRY_MAX, "tools") == "x" * LIST_ENTRY_MAX
+    with pytest.raises(ValueError):
+        normalize_list_field("Drama, " + "x" * (LIST_ENTRY_MAX + 1), "tools")
+    with pytest.raises(ValueError):
+        normalize_list_field(", ".join(f"{i:03d}" + "x" * 60 for i in range(5)), "tools")
+
+
+def test_rejects_other_types():
+    for value in (3, {"a": 1}, ["ok", 4]):
+        with pytest.raises(ValueError):
+            normalize_list_field(value, "tools")
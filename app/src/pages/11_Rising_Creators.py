@@ -14,80 +14,93 @@ st.title('Rising Creators Dashboard')
 st.write(f"### Welcome, {st.session_state.get('first_name', 'Chris')}.")
 
 API_URL = "http://web-api:4000/creator/creators"
+PAGE_SIZE = 20
+
+SORT_OPTIONS = {
+    "Credit Momentum (High to Low)": "momentum_desc",
+    "Credit Momentum (Low to High)": "momentum_asc",
+    "Name": "name",
+    "Most Credits": "credits_desc",
+    "Most Verified Credits": "verified_desc",
+    "Most Collaborators": "collaborators_desc",
+}
+
+@st.cache_data(ttl=300)
+def fetch_facets():
+    """Fetch creator totals and filter options from the API"""
+    try:
+        response = requests.get(f"{API_URL}/facets", timeout=5)
+        if response.status_code == 200:
+            return response.json()
+        return {}
+    except:
+        return {}
 
 @st.cache_data(ttl=300)
-def fetch_creators():
-    """Fetch creators from the API"""
+def fetch_creators(market=None, style=None, sort="momentum_desc", cursor=None):
+    """Fetch one page of creators; filtering and sorting happen in the API"""
     try:
-        response = requests.get(API_URL, timeout=5)
+        params = {"sort": sort, "limit": PAGE_SIZE}
+        if market:
+            params['market'] = market
+        if style:
+            params['style'] = style
+        if cursor:
+            params['cursor'] = cursor
+        response = requests.get(API_URL, params=params, timeout=5)
         if response.status_code == 200:
             data = response.json()
-            return data.get('creators', [])
-        return []
+            return data.get('creators', []), data.get('next_cursor')
+        return [], None
     except:
-        return []
+        return [], None
 
-creators = fetch_creators()
+facets = fetch_facets()
 
-if creators:
-    df = pd.DataFrame(creators)
-    
+if facets.get('total_creators'):
     st.write("---")
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        total_creators = len(df)
-        st.metric("Total Creators", total_creators)
+        st.metric("Total Creators", facets['total_creators'])
     
     with col2:
-        if 'credit_momentum' in df.columns:
-            avg_momentum = df['credit_momentum'].mean()
-            st.metric("Avg Credit Momentum", f"{avg_momentum:.1f}")
+        if facets.get('avg_momentum') is not None:
+            st.metric("Avg Credit Momentum", f"{facets['avg_momentum']:.1f}")
     
     with col3:
-        if 'market' in df.columns:
-            top_market = df['market'].mode()[0] if not df['market'].empty else 'N/A'
-            st.metric("Top Market", top_market)
+        markets = facets.get('markets', [])
+        st.metric("Top Market", markets[0]['market'] if markets else 'N/A')
     
     st.write("---")
     
     # Filter options
     col1, col2, col3 = st.columns(3)
     with col1:
-        if 'market' in df.columns:
-            markets = ['All'] + sorted(df['market'].dropna().unique().tolist())
-            selected_market = st.selectbox("Filter by Market", markets)
-        else:
-            selected_market = 'All'
+        market_options = ['All'] + sorted(m['market'] for m in facets.get('markets', []))
+        selected_market = st.selectbox("Filter by Market", market_options)
     
     with col2:
-        if 'primary_styles' in df.columns:
-            all_styles = set()
-            for styles in df['primary_styles'].dropna():
-                if styles:
-                    all_styles.update([s.strip() for s in str(styles).split(',')])
-            styles_list = ['All'] + sorted(list(all_styles))
-            selected_style = st.selectbox("Filter by Style", styles_list)
-        else:
-            selected_style = 'All'
+        styles_list = ['All'] + [s['value'] for s in facets.get('styles', [])]
+        selected_style = st.selectbox("Filter by Style", styles_list)
     
     with col3:
-        sort_by = st.selectbox("Sort by", ["Credit Momentum (High to Low)", "Credit Momentum (Low to High)", "Name"])
+        sort_by = st.selectbox("Sort by", list(SORT_OPTIONS))
     
-    # Apply filters
-    filtered_df = df.copy()
-    if selected_market != 'All':
-        filtered_df = filtered_df[filtered_df['market'] == selected_market]
-    if selected_style != 'All':
-        filtered_df = filtered_df[filtered_df['primary_styles'].str.contains(selected_style, na=False)]
+    # Page through results with a stack of cursors; reset when filters change
+    query = (selected_market, selected_style, sort_by)
+    if st.session_state.get('creators_query') != query:
+        st.session_state['creators_query'] = query
+        st.session_state['creators_cursors'] = [None]
+    cursors = st.session_state['creators_cursors']
     
-    # Sort
-    if sort_by == "Credit Momentum (High to Low)":
-        filtered_df = filtered_df.sort_values('credit_momentum', ascending=False)
-    elif sort_by == "Credit Momentum (Low to High)":
-        filtered_df = filtered_df.sort_values('credit_momentum', ascending=True)
-    else:
-        filtered_df = filtered_df.sort_values('name', ascending=True)
+    creators, next_cursor = fetch_creators(
+        market=None if selected_market == 'All' else selected_market,
+        style=None if selected_style == 'All' else selected_style,
+        sort=SORT_OPTIONS[sort_by],
+        cursor=cursors[-1],
+    )
+    filtered_df = pd.DataFrame(creators)
     
     # Visualizations
     col1, col2 = st.columns(2)
@@ -106,16 +119,16 @@ if creators:
     
     with col2:
         st.subheader("Creators by Market")
-        if 'market' in filtered_df.columns:
-            market_counts = filtered_df['market'].value_counts()
-            fig = px.pie(values=market_counts.values, names=market_counts.index,
+        market_counts = pd.DataFrame(facets.get('markets', []))
+        if not market_counts.empty:
+            fig = px.pie(values=market_counts['creators'], names=market_counts['market'],
                         title="Distribution by Market")
             st.plotly_chart(fig, use_container_width=True)
     
     st.write("---")
     st.subheader("Rising Creators List")
     
-    for idx, creator in filtered_df.head(20).iterrows():
+    for idx, creator in filtered_df.iterrows():
         with st.expander(f"{creator.get('name', 'N/A')} - Momentum: {creator.get('credit_momentum', 0)}"):
             col1, col2 = st.columns(2)
             with col1:
@@ -126,7 +139,21 @@ if creators:
                 st.write(f"**Styles:** {creator.get('primary_styles', 'N/A')}")
                 st.write(f"**Tools:** {creator.get('tools', 'N/A')}")
                 st.write(f"**Headline:** {creator.get('headline', 'N/A')}")
+                st.write(
+                    f"**Credits:** {creator.get('total_credits', 0)} "
+                    f"({creator.get('verified_credits', 0)} verified) · "
+                    f"**Collaborators:** {creator.get('collaborators', 0)}"
+                )
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if len(cursors) > 1 and st.button("Previous page"):
+            cursors.pop()
+            st.rerun()
+    with col2:
+        if next_cursor and st.button("Next page"):
+            cursors.append(next_cursor)
+            st.rerun()
 
 else:
     st.info("No creators found. Please check the API connection.")
-
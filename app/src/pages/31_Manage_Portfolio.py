@@ -30,6 +30,17 @@ def fetch_portfolios(user_id=None):
     except:
         return []
 
+@st.cache_data(ttl=60)
+def fetch_portfolio_full(portfolio_id):
+    """Fetch a portfolio with its projects, credits and media in one call"""
+    try:
+        response = requests.get(f"{PORTFOLIOS_URL}/{portfolio_id}/full", timeout=5)
+        if response.status_code == 200:
+            return response.json()
+        return None
+    except:
+        return None
+
 def create_portfolio(user_id, headline, bio):
     """Create a new portfolio"""
     try:
@@ -99,6 +110,11 @@ if portfolios:
             with col1:
                 st.write(f"**Headline:** {headline}")
                 st.write(f"**Bio:** {bio}")
+                full = fetch_portfolio_full(portfolio_id)
+                if full:
+                    for project in full.get('projects', []):
+                        names = ", ".join(c.get('name') or f"User {c.get('user_id')}" for c in project.get('credits', []))
+                        st.write(f"- **{project.get('title')}** · {len(project.get('media', []))} media" + (f" · with {names}" if names else ""))
             with col2:
                 if st.button("Edit", key=f"edit_{portfolio_id}"):
                     st.session_state[f"editing_{portfolio_id}"] = True
@@ -1,5 +1,6 @@
 import logging
 logger = logging.getLogger(__name__)
+import hashlib
 import streamlit as st
 import requests
 import pandas as pd
@@ -14,6 +15,7 @@ st.write(f"### Welcome, {st.session_state.get('first_name', 'Mike')}.")
 
 PROJECTS_URL = "http://web-api:4000/creator/projects"
 CREDITS_URL = "http://web-api:4000/creator/projects"
+UPLOADS_URL = "http://web-api:4000/media/uploads"
 
 @st.cache_data(ttl=60)
 def fetch_projects():
@@ -100,6 +102,101 @@ def add_project_credit(project_id, user_id, role, verified=False):
     except:
         return False
 
+def import_crew(project_id, csv_file):
+    """Add every row of a crew CSV (user_id, role, verified) in one request"""
+    try:
+        crew = pd.read_csv(csv_file)
+        credits = [
+            {
+                "user_id": int(row["user_id"]),
+                "role": None if pd.isna(row.get("role")) else str(row.get("role")),
+                "verified": str(row.get("verified", "")).strip().lower() in ("1", "true", "yes"),
+            }
+            for _, row in crew.iterrows()
+        ]
+        response = requests.post(
+            f"{PROJECTS_URL}/{project_id}/credits/batch",
+            json={"credits": credits},
+            timeout=30,
+        )
+        if response.status_code in (200, 201):
+            result = response.json()
+            st.success(
+                f"Added {len(result['created'])} credits "
+                f"({len(result['skipped'])} duplicates skipped, {len(result['invalid'])} invalid)"
+            )
+            st.cache_data.clear()
+            return True
+        st.error(response.json().get("error", "Failed to import crew"))
+        return False
+    except Exception as e:
+        st.error(f"Could not read crew list: {e}")
+        return False
+
+def upload_reel(project_id, reel_file, caption=None):
+    """Upload a reel in resumable chunks, then attach it to the project"""
+    try:
+        size = reel_file.size
+        response = requests.post(
+            UPLOADS_URL,
+            json={"filename": reel_file.name, "content_type": reel_file.type, "size_bytes": size},
+            timeout=10,
+        )
+        if response.status_code != 201:
+            st.error(response.json().get("error", "Could not start upload"))
+            return False
+        upload = response.json()
+        upload_id, chunk_size = upload["upload_id"], upload["chunk_size"]
+
+        progress = st.progress(0.0, text="Uploading reel...")
+        reel_file.seek(0)
+        index, sent = 0, 0
+        while True:
+            chunk = reel_file.read(chunk_size)
+            if not chunk:
+                break
+            # a chunk that fails or times out is simply sent again
+            error = f"Chunk {index} failed"
+            for attempt in range(3):
+                try:
+                    response = requests.put(
+                        f"{UPLOADS_URL}/{upload_id}/chunks/{index}",
+                        data=chunk,
+                        headers={"X-Chunk-SHA256": hashlib.sha256(chunk).hexdigest()},
+                        timeout=120,
+                    )
+                except requests.RequestException as e:
+                    error = f"Chunk {index} failed: {e}"
+                    continue
+                if response.status_code == 200:
+                    break
+                error = response.json().get("error", error)
+            else:
+                st.error(error)
+                return False
+            index += 1
+            sent += len(chunk)
+            progress.progress(sent / size, text=f"Uploading reel... {sent // (1 << 20)} MB")
+
+        response = requests.post(f"{UPLOADS_URL}/{upload_id}/complete", json={}, timeout=600)
+        if response.status_code not in (200, 201):
+            st.error(response.json().get("error", "Could not finish upload"))
+            return False
+
+        response = requests.post(
+            f"{PROJECTS_URL}/{project_id}/media",
+            json={"blob_id": response.json()["blob_id"], "media_type": "reel", "caption": caption},
+            timeout=10,
+        )
+        if response.status_code == 201:
+            st.success("Reel uploaded!")
+            st.cache_data.clear()
+            return True
+        return False
+    except Exception as e:
+        st.error(f"Upload failed: {e}")
+        return False
+
 projects = fetch_projects()
 
 st.write("---")
@@ -147,6 +244,19 @@ if projects:
                 if st.form_submit_button("Add Credit"):
                     add_project_credit(project_id, credit_user_id, credit_role, credit_verified)
                     st.rerun()
+
+            st.write("**Import Crew List (CSV: user_id, role, verified):**")
+            with st.form(f"import_crew_{project_id}"):
+                crew_file = st.file_uploader("Crew CSV", type="csv", key=f"crew_{project_id}")
+                if st.form_submit_button("Import Crew") and crew_file is not None:
+                    import_crew(project_id, crew_file)
+
+            st.write("**Upload Reel:**")
+            with st.form(f"upload_reel_{project_id}"):
+                reel_file = st.file_uploader("Reel", type=["mp4", "mov", "webm"], key=f"reel_{project_id}")
+                reel_caption = st.text_input("Caption", key=f"reel_caption_{project_id}")
+                if st.form_submit_button("Upload Reel") and reel_file is not None:
+                    upload_reel(project_id, reel_file, reel_caption or None)
 else:
     st.info("You don't have any projects yet. Create one below!")
 
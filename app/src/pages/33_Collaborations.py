@@ -13,6 +13,7 @@ st.title('My Collaborations')
 st.write(f"### Welcome, {st.session_state.get('first_name', 'Mike')}.")
 
 COLLABORATIONS_URL = "http://web-api:4000/creator/collaborations"
+USERS_URL = "http://web-api:4000/creator/users"
 
 @st.cache_data(ttl=60)
 def fetch_collaborations(user_id=None):
@@ -29,6 +30,17 @@ def fetch_collaborations(user_id=None):
     except:
         return []
 
+@st.cache_data(ttl=60)
+def fetch_credit_stats(user_id):
+    """Credit totals for a user, maintained by the API"""
+    try:
+        response = requests.get(f"{USERS_URL}/{user_id}", timeout=5)
+        if response.status_code == 200:
+            return response.json().get('credit_stats', {})
+        return {}
+    except:
+        return {}
+
 def create_collaboration(project_id, user_id, role, verified=False):
     """Create a new collaboration"""
     try:
@@ -88,16 +100,16 @@ if collaborations:
     st.subheader("My Collaborations")
     df = pd.DataFrame(collaborations)
     
-    col1, col2, col3 = st.columns(3)
+    stats = fetch_credit_stats(user_id)
+    col1, col2, col3, col4 = st.columns(4)
     with col1:
-        total = len(collaborations)
-        st.metric("Total Collaborations", total)
+        st.metric("Total Collaborations", stats.get('total_credits', 0))
     with col2:
-        verified = len([c for c in collaborations if c.get('verified')])
-        st.metric("Verified", verified)
+        st.metric("Verified", stats.get('verified_credits', 0))
     with col3:
-        projects = len(set([c.get('project_id') for c in collaborations]))
-        st.metric("Projects", projects)
+        st.metric("Projects", stats.get('projects', 0))
+    with col4:
+        st.metric("Collaborators", stats.get('collaborators', 0))
     
     st.write("---")
     
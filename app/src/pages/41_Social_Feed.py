@@ -14,6 +14,18 @@ st.write(f"### Welcome, {st.session_state.get('first_name', 'Veronica')}.")
 
 POSTS_URL = "http://web-api:4000/social/posts"
 INTERACTIONS_URL = "http://web-api:4000/social/post-interactions"
+API_BASE = "http://web-api:4000"
+
+@st.cache_data(ttl=3600)
+def fetch_media(url):
+    """Fetch an uploaded blob (/media/...) from the API; blobs never change"""
+    try:
+        response = requests.get(f"{API_BASE}{url}", timeout=10)
+        if response.status_code == 200:
+            return response.content
+        return None
+    except:
+        return None
 
 @st.cache_data(ttl=60)
 def fetch_posts(user_id=None, visibility=None):
@@ -32,16 +44,29 @@ def fetch_posts(user_id=None, visibility=None):
     except:
         return []
 
-def fetch_interactions(post_id):
-    """Fetch interactions for a post"""
+def fetch_engagement(post_id):
+    """Fetch view/like/comment counts for a post"""
+    try:
+        response = requests.get(f"{POSTS_URL}/{post_id}", timeout=5)
+        if response.status_code == 200:
+            return response.json().get('engagement', {})
+        return {}
+    except:
+        return {}
+
+def fetch_comments(post_id, limit=10, cursor=None):
+    """Fetch one page of comments for a post"""
     try:
-        response = requests.get(INTERACTIONS_URL, params={"postID": post_id}, timeout=5)
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = requests.get(f"{POSTS_URL}/{post_id}/comments", params=params, timeout=5)
         if response.status_code == 200:
             data = response.json()
-            return data.get('interactions', [])
-        return []
+            return data.get('comments', []), data.get('next_cursor')
+        return [], None
     except:
-        return []
+        return [], None
 
 def create_interaction(post_id, user_id, interaction_type, comment_text=None):
     """Create a post interaction"""
@@ -63,6 +88,18 @@ def create_interaction(post_id, user_id, interaction_type, comment_text=None):
     except:
         return False
 
+def toggle_like(post_id, user_id):
+    """Like or unlike a post (one like per user per post)"""
+    try:
+        toggle_url = f"{POSTS_URL}/{post_id}/likes/toggle"
+        response = requests.post(toggle_url, json={"user_id": user_id}, timeout=5)
+        if response.status_code == 200:
+            st.cache_data.clear()
+            return response.json().get('liked')
+        return None
+    except:
+        return None
+
 def update_post(post_id, caption=None, tags=None, visibility=None):
     """Update a post"""
     try:
@@ -108,13 +145,17 @@ if posts:
         post_id = post.get('post_id', 'N/A')
         user_id = post.get('user_id', 'N/A')
         caption = post.get('caption', 'No caption')
-        media_url = post.get('media_url', '')
+        media_url = post.get('media_url') or ''
         tags = post.get('tags', '')
         created_at = post.get('created_at', 'N/A')
         
         with st.container():
             st.write(f"**Post #{post_id}** by User #{user_id}")
-            if media_url:
+            if media_url.startswith('/media/'):
+                media = fetch_media(media_url)
+                if media:
+                    st.image(media, width=400)
+            elif media_url:
                 st.image(media_url, width=400)
             st.write(caption)
             if tags:
@@ -122,14 +163,14 @@ if posts:
             st.write(f"Posted: {created_at}")
             
             # Interactions
-            interactions = fetch_interactions(post_id)
-            likes = len([i for i in interactions if i.get('interaction_type') == 'like'])
-            comments = len([i for i in interactions if i.get('interaction_type') == 'comment'])
+            engagement = fetch_engagement(post_id)
+            likes = engagement.get('like_count', 0)
+            comments = engagement.get('comment_count', 0)
             
             col1, col2, col3, col4 = st.columns(4)
             with col1:
                 if st.button(f"❤️ Like ({likes})", key=f"like_{post_id}"):
-                    create_interaction(post_id, 1, 'like')  # Demo user_id = 1
+                    toggle_like(post_id, 1)  # Demo user_id = 1
                     st.rerun()
             with col2:
                 if st.button(f"💬 Comment ({comments})", key=f"comment_{post_id}"):
@@ -146,9 +187,13 @@ if posts:
             # Show comments
             if comments > 0:
                 with st.expander(f"View Comments ({comments})"):
-                    for interaction in interactions:
-                        if interaction.get('interaction_type') == 'comment':
-                            st.write(f"**User {interaction.get('user_id', 'N/A')}:** {interaction.get('comment_text', '')}")
+                    page_cursor = st.session_state.get(f"comments_cursor_{post_id}")
+                    page, next_cursor = fetch_comments(post_id, cursor=page_cursor)
+                    for comment in page:
+                        st.write(f"**User {comment.get('user_id', 'N/A')}:** {comment.get('comment_text', '')}")
+                    if next_cursor and st.button("Older comments", key=f"older_comments_{post_id}"):
+                        st.session_state[f"comments_cursor_{post_id}"] = next_cursor
+                        st.rerun()
             
             st.write("---")
 else:
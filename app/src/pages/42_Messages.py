@@ -26,6 +26,26 @@ def fetch_messages(user_id):
     except:
         return []
 
+def fetch_unread_count(user_id):
+    """Fetch the unread-message badge count for a user"""
+    try:
+        response = requests.get(f"{MESSAGES_URL}/unread-count", params={"userID": user_id}, timeout=5)
+        if response.status_code == 200:
+            return response.json().get('unread_count', 0)
+        return 0
+    except:
+        return 0
+
+def search_messages(user_id, query):
+    """Full-text search over the user's messages, best match first"""
+    try:
+        response = requests.get(f"{MESSAGES_URL}/search", params={"userID": user_id, "q": query}, timeout=5)
+        if response.status_code == 200:
+            return response.json().get('messages', [])
+        return []
+    except:
+        return []
+
 def create_message(sender_id, receiver_id, content):
     """Send a new message"""
     try:
@@ -64,6 +84,19 @@ def update_message(message_id, is_read=None, is_starred=None, is_archived=None):
     except:
         return False
 
+def mark_all_read(user_id):
+    """Mark every unread message of the user as read in one request"""
+    try:
+        payload = {"user_id": user_id, "filter": {"is_read": False}, "set": {"is_read": True}}
+        response = requests.put(MESSAGES_URL, json=payload, timeout=10)
+        if response.status_code == 200:
+            st.success(f"Marked {response.json().get('updated', 0)} messages as read!")
+            st.cache_data.clear()
+            return True
+        return False
+    except:
+        return False
+
 def delete_message(message_id, user_id):
     """Delete a message"""
     try:
@@ -80,6 +113,11 @@ def delete_message(message_id, user_id):
 user_id = 1  # Demo user ID
 messages = fetch_messages(user_id)
 
+st.metric("Unread", fetch_unread_count(user_id))
+if st.button("Mark all as read"):
+    if mark_all_read(user_id):
+        st.rerun()
+
 st.write("---")
 
 col1, col2 = st.columns([2, 1])
@@ -88,16 +126,18 @@ with col1:
     if messages:
         st.subheader("My Messages")
         
+        search_query = st.text_input("Search messages")
+
         # Filter options
         filter_option = st.selectbox("Filter", ["All", "Unread", "Starred", "Archived"])
         
-        filtered_messages = messages.copy()
+        filtered_messages = search_messages(user_id, search_query) if search_query.strip() else messages.copy()
         if filter_option == "Unread":
-            filtered_messages = [m for m in messages if not m.get('is_read', False)]
+            filtered_messages = [m for m in filtered_messages if not m.get('is_read', False)]
         elif filter_option == "Starred":
-            filtered_messages = [m for m in messages if m.get('is_starred', False)]
+            filtered_messages = [m for m in filtered_messages if m.get('is_starred', False)]
         elif filter_option == "Archived":
-            filtered_messages = [m for m in messages if m.get('is_archived', False)]
+            filtered_messages = [m for m in filtered_messages if m.get('is_archived', False)]
         
         for msg in filtered_messages:
             message_id = msg.get('message_id', 'N/A')
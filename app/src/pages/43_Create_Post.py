@@ -12,8 +12,21 @@ st.title('Create New Post')
 st.write(f"### Welcome, {st.session_state.get('first_name', 'Veronica')}.")
 
 POSTS_URL = "http://web-api:4000/social/posts"
+MEDIA_URL = "http://web-api:4000/media"
 
-def create_post(user_id, caption, media_url=None, tags=None, visibility="public"):
+def upload_media(upload):
+    """Upload a file to the media store; returns its blob_id"""
+    try:
+        files = {'file': (upload.name, upload.getvalue(), upload.type)}
+        response = requests.post(MEDIA_URL, files=files, timeout=60)
+        if response.status_code in (200, 201):
+            return response.json().get('blob_id')
+        st.error(response.json().get('error', 'Upload failed'))
+        return None
+    except:
+        return None
+
+def create_post(user_id, caption, media_url=None, tags=None, visibility="public", blob_id=None):
     """Create a new post"""
     try:
         payload = {
@@ -21,7 +34,9 @@ def create_post(user_id, caption, media_url=None, tags=None, visibility="public"
             "caption": caption,
             "visibility": visibility
         }
-        if media_url:
+        if blob_id:
+            payload['blob_id'] = blob_id
+        elif media_url:
             payload['media_url'] = media_url
         if tags:
             payload['tags'] = tags
@@ -64,13 +79,16 @@ st.subheader("Create a New Post")
 with st.form("create_post_form"):
     post_caption = st.text_area("Caption *", height=200, placeholder="What's on your mind?")
     post_media_url = st.text_input("Media URL (optional)", placeholder="https://example.com/image.jpg")
+    post_upload = st.file_uploader("Or upload a still or clip (optional)", type=["jpg", "jpeg", "png", "gif", "webp", "mp4", "mov", "webm"])
     post_tags = st.text_input("Tags (comma-separated, optional)", placeholder="cinematic, drama, indie")
     post_visibility = st.selectbox("Visibility", ["public", "private"])
     
     if st.form_submit_button("Create Post", type="primary"):
         if post_caption:
-            create_post(user_id, post_caption, post_media_url, post_tags, post_visibility)
-            st.rerun()
+            blob_id = upload_media(post_upload) if post_upload else None
+            if not post_upload or blob_id:
+                create_post(user_id, post_caption, post_media_url, post_tags, post_visibility, blob_id)
+                st.rerun()
         else:
             st.error("Please provide a caption")
 
@@ -56,15 +56,95 @@ CREATE TABLE IF NOT EXISTS Alerts (
 );
 
 -- POSTS TABLE
+-- MEDIA BLOBS (uploaded files, stored on disk under their SHA-256)
+-- see api/backend/media/__init__.py
+CREATE TABLE IF NOT EXISTS MediaBlobs (
+    blob_id      CHAR(64) PRIMARY KEY,
+    content_type VARCHAR(100) NOT NULL,
+    size_bytes   BIGINT NOT NULL,
+    -- stills: pixel size and whether the thumbnail/web renditions exist
+    width        INT NULL,
+    height       INT NULL,
+    rendition_status ENUM('pending', 'ready', 'skipped', 'failed') NOT NULL DEFAULT 'pending',
+    created_at   TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_mediablobs_rendition (rendition_status, blob_id)
+);
+
+-- Downsized JPEG copies of a still blob, stored next to it on disk
+-- (backend/media/renditions.py)
+CREATE TABLE IF NOT EXISTS MediaRenditions (
+    blob_id    CHAR(64) NOT NULL,
+    rendition  VARCHAR(16) NOT NULL,   -- 'thumb', 'web'
+    width      INT NOT NULL,
+    height     INT NOT NULL,
+    size_bytes BIGINT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (blob_id, rendition),
+    FOREIGN KEY (blob_id) REFERENCES MediaBlobs(blob_id) ON DELETE CASCADE
+);
+
+-- Resumable uploads (backend/media/uploads.py): chunk bytes live on disk
+-- under MEDIA_ROOT/uploads/<upload_id>/ until the session is completed
+CREATE TABLE IF NOT EXISTS UploadSessions (
+    upload_id    CHAR(32) PRIMARY KEY,
+    filename     VARCHAR(255) NOT NULL,
+    content_type VARCHAR(100) NOT NULL,
+    size_bytes   BIGINT NULL,       -- declared by the client, else set on completion
+    sha256       CHAR(64) NULL,     -- whole-file checksum to verify, if declared
+    status       ENUM('open', 'assembling', 'complete', 'aborted') NOT NULL DEFAULT 'open',
+    blob_id      CHAR(64) NULL,
+    created_at   TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at   TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX idx_uploadsessions_stale (status, updated_at)
+);
+
+CREATE TABLE IF NOT EXISTS UploadChunks (
+    upload_id   CHAR(32) NOT NULL,
+    chunk_index INT NOT NULL,
+    size_bytes  BIGINT NOT NULL,
+    sha256      CHAR(64) NOT NULL,
+    received_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (upload_id, chunk_index),
+    FOREIGN KEY (upload_id) REFERENCES UploadSessions(upload_id) ON DELETE CASCADE
+);
+
 CREATE TABLE IF NOT EXISTS Posts (
     post_id INT AUTO_INCREMENT PRIMARY KEY,
     user_id INT NOT NULL,
     media_url VARCHAR(255),
+    blob_id CHAR(64) NULL,          -- set when the media was uploaded to /media
     caption TEXT,
     tags VARCHAR(255),
     visibility ENUM('public', 'private') DEFAULT 'public',
     is_deleted BOOLEAN DEFAULT FALSE,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    deleted_at TIMESTAMP NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- set by POST /social/posts/batch: which request and which item in it
+    -- the row came from, so the new post_ids can be read back
+    import_batch CHAR(32) NULL,
+    import_index INT NULL,
+
+    -- compaction job looks up expired soft-deletes
+    INDEX idx_posts_deleted (is_deleted, deleted_at),
+    INDEX idx_posts_blob (blob_id),
+    INDEX idx_posts_import (import_batch, import_index)
+);
+
+-- ARCHIVED POSTS (soft-deleted posts moved out by the compaction job)
+CREATE TABLE IF NOT EXISTS PostsArchive (
+    post_id INT PRIMARY KEY,
+    user_id INT NOT NULL,
+    media_url VARCHAR(255),
+    blob_id CHAR(64) NULL,
+    caption TEXT,
+    tags VARCHAR(255),
+    visibility ENUM('public', 'private') DEFAULT 'public',
+    view_count INT DEFAULT 0,
+    like_count INT DEFAULT 0,
+    comment_count INT DEFAULT 0,
+    created_at TIMESTAMP NULL,
+    deleted_at TIMESTAMP NULL,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 -- POST INTERACTIONS TABLE
@@ -74,7 +154,15 @@ CREATE TABLE IF NOT EXISTS PostInteractions (
     user_id INT,
     interaction_type ENUM('view', 'like', 'comment') NOT NULL,
     comment_text TEXT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    -- user_id for likes, NULL otherwise: makes "one like per user per post"
+    -- a plain unique key (NULLs never collide, so views/comments are unaffected)
+    like_user_id INT AS (IF(interaction_type = 'like', user_id, NULL)) VIRTUAL,
+
+    UNIQUE KEY uq_postinteractions_like (post_id, like_user_id),
+    -- per-post, per-type reads in time order (comment paging, counts)
+    INDEX idx_postinteractions_post_type_created (post_id, interaction_type, created_at)
 );
 
 -- MESSAGES TABLE
@@ -88,7 +176,28 @@ CREATE TABLE IF NOT EXISTS Messages (
     is_archived BOOLEAN DEFAULT FALSE,
     is_deleted_by_sender BOOLEAN DEFAULT FALSE,
     is_deleted_by_receiver BOOLEAN DEFAULT FALSE,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- a "msgowner<id>" word for each participant, indexed together with
+    -- content so a search can require the searching user's word and only
+    -- ever match their own conversations (see search_messages). STORED
+    -- because InnoDB cannot FULLTEXT-index a virtual column; it is only
+    -- the two words, not a copy of content.
+    search_owners VARCHAR(40) AS (CONCAT('msgowner', sender_id, ' msgowner', receiver_id)) STORED,
+
+    -- per-user inbox/outbox reads and the unread-counter repair job
+    INDEX idx_messages_receiver (receiver_id, is_read, is_deleted_by_receiver),
+    INDEX idx_messages_sender (sender_id, is_deleted_by_sender),
+    -- purge-deleted-messages job: rows deleted by both sides, in id order
+    INDEX idx_messages_purge (is_deleted_by_sender, is_deleted_by_receiver),
+    -- GET /social/messages/search
+    FULLTEXT INDEX ft_messages_search (search_owners, content)
+);
+
+-- MESSAGE COUNTERS (unread badge, maintained by the message routes)
+CREATE TABLE IF NOT EXISTS MessageCounters (
+    user_id INT PRIMARY KEY,
+    unread_count INT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
 );
 
 -- USERS TABLE
@@ -107,7 +216,44 @@ CREATE TABLE IF NOT EXISTS Users (
     market          VARCHAR(100),        -- e.g. "NYC", "LA", "London"
     credit_momentum INT DEFAULT 0,       -- simple int for “heat”
     is_active       BOOLEAN DEFAULT TRUE,
-    created_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    -- primary_styles / tools as JSON arrays ("Action, Comedy" -> ["Action","Comedy"])
+    -- so GET /creator/creators can filter them with MEMBER OF on a
+    -- multi-valued index instead of LIKE '%...%'. Control characters are
+    -- blanked and \ and " escaped before splitting on commas (any spacing),
+    -- so no value can produce invalid JSON; update_user stores the
+    -- canonical "A, B" form with entries of at most 64 characters to fit
+    -- the CHAR(64) indexes below. Step by step, innermost first:
+    --   TRIM + [[:cntrl:]] -> ' '   ' Action ,\tComedy'  -> 'Action , Comedy'
+    --   \ -> \\ then " -> \"       '16" film, C:\Cut'    -> '16\" film, C:\\Cut'
+    --   [[:space:]]*,[[:space:]]*   'Action , Comedy'     -> 'Action","Comedy'
+    --   wrapped in [" "]            -> ["Action","Comedy"], ["16\" film","C:\\Cut"]
+    -- so 'Action ,Comedy' reads as ["Action","Comedy"] and '16" film' as
+    -- ["16\" film"]; normalize_list_field only cleans up the stored text.
+    style_list JSON AS (IF(primary_styles IS NULL OR TRIM(primary_styles) = '', JSON_ARRAY(),
+        CAST(CONCAT('["', REGEXP_REPLACE(
+            REPLACE(REPLACE(REGEXP_REPLACE(TRIM(primary_styles), '[[:cntrl:]]', ' '), '\\', '\\\\'), '"', '\\"'),
+            '[[:space:]]*,[[:space:]]*', '","'), '"]') AS JSON))) VIRTUAL,
+    tool_list JSON AS (IF(tools IS NULL OR TRIM(tools) = '', JSON_ARRAY(),
+        CAST(CONCAT('["', REGEXP_REPLACE(
+            REPLACE(REPLACE(REGEXP_REPLACE(TRIM(tools), '[[:cntrl:]]', ' '), '\\', '\\\\'), '"', '\\"'),
+            '[[:space:]]*,[[:space:]]*', '","'), '"]') AS JSON))) VIRTUAL,
+
+    -- creator directory: momentum / name ordering, optionally within a market
+    INDEX idx_users_creator_momentum (is_creator, is_active, credit_momentum, user_id),
+    INDEX idx_users_creator_market_momentum (is_creator, is_active, market, credit_momentum, user_id),
+    INDEX idx_users_creator_name (is_creator, is_active, name, user_id),
+    INDEX idx_users_styles ((CAST(style_list AS CHAR(64) ARRAY))),
+    INDEX idx_users_tools ((CAST(tool_list AS CHAR(64) ARRAY)))
+);
+
+-- CREATOR MOMENTUM (time-decayed score behind Users.credit_momentum)
+-- score is valid as of as_of; see api/backend/ml_models/credit_momentum.py
+CREATE TABLE IF NOT EXISTS CreatorMomentum (
+    user_id INT PRIMARY KEY,
+    score DOUBLE NOT NULL DEFAULT 0,
+    as_of TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
 -- CREATOR ROUTES
@@ -138,18 +284,36 @@ CREATE TABLE IF NOT EXISTS ProjectCredits (
     user_id     INT NOT NULL,
     role        VARCHAR(255),
     verified    BOOLEAN DEFAULT FALSE,
-    created_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_projectcredits_project_user (project_id, user_id),
+    INDEX idx_projectcredits_user_project (user_id, project_id)
+);
+
+-- CREDIT STATS (per-user credit counts, maintained by the credit routes)
+-- see api/backend/credit_stats.py
+CREATE TABLE IF NOT EXISTS CreditStats (
+    user_id          INT PRIMARY KEY,
+    total_credits    INT NOT NULL DEFAULT 0,
+    verified_credits INT NOT NULL DEFAULT 0,
+    projects         INT NOT NULL DEFAULT 0,
+    collaborators    INT NOT NULL DEFAULT 0,
+    updated_at       TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
 );
 
 CREATE TABLE IF NOT EXISTS ProjectMedia (
     media_id    INT AUTO_INCREMENT PRIMARY KEY,
     project_id  INT NOT NULL,
     media_url   VARCHAR(500) NOT NULL,
+    blob_id     CHAR(64) NULL,      -- set when the media was uploaded to /media
     media_type  VARCHAR(50),     -- e.g. 'reel', 'self-tape', 'still'
     caption     TEXT,
     alt_text    VARCHAR(255),
-    sort_order  INT DEFAULT 0,
-    created_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    -- gallery order; sparse so a move writes one row (see creator_routes).
+    -- The 1-based position (sort_order in responses) is derived from it.
+    sort_key    BIGINT NOT NULL DEFAULT 0,
+    created_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_projectmedia_order (project_id, sort_key, media_id),
+    INDEX idx_projectmedia_blob (blob_id)
 );
 
 -- ANALYTICS TABLES 
@@ -158,9 +322,23 @@ CREATE TABLE IF NOT EXISTS TrendTags (
     tag_id INT AUTO_INCREMENT PRIMARY KEY,
     tag_name VARCHAR(100) NOT NULL,
     description TEXT,
-    usage_count INT DEFAULT 0,
+    usage_count INT DEFAULT 0,      -- seed value only; live counts are in TagUsage
     status ENUM('active','archived') DEFAULT 'active',
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- how post/project tags are matched to this row (backend/tag_usage.py)
+    tag_key VARCHAR(100) COLLATE utf8mb4_bin
+        GENERATED ALWAYS AS (LOWER(TRIM(tag_name))) STORED,
+    INDEX idx_trendtags_key (tag_key)
+);
+
+-- Live posts + live projects per tag, split over a few slots per tag so
+-- concurrent writers rarely meet on one row; usage = SUM over the slots
+CREATE TABLE IF NOT EXISTS TagUsage (
+    tag_key       VARCHAR(100) COLLATE utf8mb4_bin NOT NULL,
+    slot          TINYINT NOT NULL,
+    post_count    INT NOT NULL DEFAULT 0,
+    project_count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (tag_key, slot)
 );
 
 -- KPIS TABLE
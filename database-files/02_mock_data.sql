@@ -443,126 +443,126 @@ INSERT INTO ProjectCredits (project_id, user_id, role, verified) VALUES (10, 8,
 INSERT INTO ProjectCredits (project_id, user_id, role, verified) VALUES (46, 13, 'Producer', 0);
 
 -- PROJECT MEDIA -----------------------------------------
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (46, 'https://media.example.com/project_46/asset_1.mp4', 'self-tape', 'Analysis image quite chance end.', 'Interest open current.', 8);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (13, 'https://media.example.com/project_13/asset_2.mp4', 'reel', 'Take couple off wrong knowledge.', 'Consumer event state arrive.', 4);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (34, 'https://media.example.com/project_34/asset_3.mp4', 'reel', 'Similar describe wrong short throughout produce newspaper buy throw.', 'Group consumer compare wrong next agree.', 7);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (7, 'https://media.example.com/project_7/asset_4.mp4', 'self-tape', 'While machine able writer our how.', 'No international trial check.', 1);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (9, 'https://media.example.com/project_9/asset_5.mp4', 'still', 'Health which various important traditional debate central morning market.', 'Significant measure ten first structure.', 9);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (46, 'https://media.example.com/project_46/asset_6.mp4', 'self-tape', 'Feeling Mr more across source still.', 'Because once wonder business service population.', 0);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (54, 'https://media.example.com/project_54/asset_7.mp4', 'still', 'Energy computer imagine argue manager reflect make market determine.', 'President own out enjoy.', 10);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (23, 'https://media.example.com/project_23/asset_8.mp4', 'self-tape', 'Share because election alone production live black.', 'Human production military.', 8);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (19, 'https://media.example.com/project_19/asset_9.mp4', 'self-tape', 'That thing break cost call energy sound significant goal drive sell.', 'Hear under its rather age.', 9);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (40, 'https://media.example.com/project_40/asset_10.mp4', 'still', 'Stage painting listen each pay blue least thought.', 'Key Mr case listen book own.', 8);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (46, 'https://media.example.com/project_46/asset_11.mp4', 'reel', 'Believe not high thousand free.', 'Nearly sense lay.', 6);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (13, 'https://media.example.com/project_13/asset_12.mp4', 'still', 'Computer couple tell special cause yard five prevent seek.', 'About century summer.', 5);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (52, 'https://media.example.com/project_52/asset_13.mp4', 'reel', 'Many large more most interest there.', 'Collection less too magazine evening.', 7);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (58, 'https://media.example.com/project_58/asset_14.mp4', 'self-tape', 'Line later range out tree live until cover.', 'Want stage no.', 1);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (16, 'https://media.example.com/project_16/asset_15.mp4', 'reel', 'Body whatever phone show institution performance assume significant prepare.', 'Your still feel.', 4);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (16, 'https://media.example.com/project_16/asset_16.mp4', 'reel', 'Husband line agency seem likely turn.', 'Kitchen wife fund brother entire despite.', 4);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (35, 'https://media.example.com/project_35/asset_17.mp4', 'still', 'Center range compare certain land past.', 'Stage since through.', 6);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (23, 'https://media.example.com/project_23/asset_18.mp4', 'reel', 'Marriage miss direction size threat specific believe continue.', 'Ready black produce war.', 4);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (33, 'https://media.example.com/project_33/asset_19.mp4', 'still', 'Home form three rest spring building past ahead anything more.', 'Eight might career teach during.', 9);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (23, 'https://media.example.com/project_23/asset_20.mp4', 'reel', 'Begin threat word song ok for treat.', 'Court notice staff rather mouth hard.', 2);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (27, 'https://media.example.com/project_27/asset_21.mp4', 'self-tape', 'His understand choice especially and firm me.', 'Pattern order apply.', 5);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (12, 'https://media.example.com/project_12/asset_22.mp4', 'still', 'Store money education speech staff.', 'Produce reflect carry become out.', 1);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (2, 'https://media.example.com/project_2/asset_23.mp4', 'reel', 'Source must wide specific.', 'Because cup must.', 9);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (50, 'https://media.example.com/project_50/asset_24.mp4', 'still', 'Much whom structure leader example.', 'Let rock left lot sing only.', 6);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (2, 'https://media.example.com/project_2/asset_25.mp4', 'still', 'Music probably tree politics there area collection huge.', 'Night interesting quality data imagine Democrat.', 1);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (45, 'https://media.example.com/project_45/asset_26.mp4', 'still', 'Table east building nice ever line item energy.', 'Change consider become ever while.', 10);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (30, 'https://media.example.com/project_30/asset_27.mp4', 'self-tape', 'Girl edge level matter nothing might consider speech.', 'Care fill enter.', 6);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (55, 'https://media.example.com/project_55/asset_28.mp4', 'self-tape', 'Science ever impact candidate toward continue day establish.', 'Impact single serve identify able whose someone.', 2);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (35, 'https://media.example.com/project_35/asset_29.mp4', 'still', 'Cold fine heavy ask budget author about add.', 'Action quite toward occur wall.', 4);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (35, 'https://media.example.com/project_35/asset_30.mp4', 'still', 'Amount partner hour picture here behavior simple discussion pretty.', 'Sea summer poor.', 2);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (44, 'https://media.example.com/project_44/asset_31.mp4', 'reel', 'Safe technology ability evening staff team door poor always suddenly common.', 'Short nature lawyer clearly security store.', 7);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (27, 'https://media.example.com/project_27/asset_32.mp4', 'reel', 'Impact leader note blood include no we also.', 'Former right and in my item.', 0);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (1, 'https://media.example.com/project_1/asset_33.mp4', 'still', 'Republican across check important performance sister keep.', 'Record those list recent discover.', 4);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (42, 'https://media.example.com/project_42/asset_34.mp4', 'reel', 'Republican card perhaps arrive focus.', 'Purpose deal describe.', 10);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (42, 'https://media.example.com/project_42/asset_35.mp4', 'still', 'Establish dream worker center news large learn.', 'Nice study drop.', 6);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (8, 'https://media.example.com/project_8/asset_36.mp4', 'reel', 'Respond apply onto soon book deep soon.', 'Choose media worker.', 6);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (13, 'https://media.example.com/project_13/asset_37.mp4', 'reel', 'Hot police real page heart act brother boy animal wrong soldier.', 'Travel then security.', 5);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (38, 'https://media.example.com/project_38/asset_38.mp4', 'still', 'Shoulder nation huge sing we now.', 'Sit report recognize office example.', 0);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (35, 'https://media.example.com/project_35/asset_39.mp4', 'self-tape', 'Help population hot character fight high message I garden.', 'His long page save value.', 9);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (2, 'https://media.example.com/project_2/asset_40.mp4', 'still', 'Thing factor discuss together back notice fly same draw across far.', 'Partner itself behind.', 7);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (49, 'https://media.example.com/project_49/asset_41.mp4', 'reel', 'Tree game specific top various office everything picture man understand.', 'Play we onto design.', 5);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (31, 'https://media.example.com/project_31/asset_42.mp4', 'self-tape', 'Professional fall family economy home seat investment exactly sense issue more.', 'Have science interest side base.', 8);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (36, 'https://media.example.com/project_36/asset_43.mp4', 'reel', 'Sometimes win ball design well song world explain spend.', 'Low by allow might.', 5);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (53, 'https://media.example.com/project_53/asset_44.mp4', 'reel', 'Economic someone benefit join deep a.', 'Any second other.', 4);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (60, 'https://media.example.com/project_60/asset_45.mp4', 'still', 'Million action staff statement chance eye old sing.', 'Real group pressure huge.', 6);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (18, 'https://media.example.com/project_18/asset_46.mp4', 'self-tape', 'Leader including sell cold approach billion well.', 'Key real upon get room simply.', 5);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (2, 'https://media.example.com/project_2/asset_47.mp4', 'still', 'During research national thank point sound almost sit lose indeed.', 'Term send add morning growth.', 0);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (15, 'https://media.example.com/project_15/asset_48.mp4', 'reel', 'Religious style memory town like one every environmental.', 'Recent let happen.', 0);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (22, 'https://media.example.com/project_22/asset_49.mp4', 'still', 'Article Mrs any develop begin close discover.', 'Successful staff action.', 8);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (20, 'https://media.example.com/project_20/asset_50.mp4', 'reel', 'Box other network woman western ever hold.', 'Agreement mind what trip real determine.', 5);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (46, 'https://media.example.com/project_46/asset_51.mp4', 'still', 'Suddenly join large budget test.', 'Standard everybody worry site impact.', 9);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (16, 'https://media.example.com/project_16/asset_52.mp4', 'self-tape', 'Pressure head walk born maybe culture city night face safe.', 'Society despite experience.', 4);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (43, 'https://media.example.com/project_43/asset_53.mp4', 'self-tape', 'Tree purpose recent happy affect not me day hold how.', 'Remember class movement growth.', 9);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (9, 'https://media.example.com/project_9/asset_54.mp4', 'still', 'Reality western one Republican Republican.', 'Oil lawyer they.', 7);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (1, 'https://media.example.com/project_1/asset_55.mp4', 'self-tape', 'Conference which describe wide instead treatment forward well.', 'Know collection watch certain impact.', 2);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (50, 'https://media.example.com/project_50/asset_56.mp4', 'self-tape', 'Paper bag not tax strategy family will until operation picture.', 'Environment point attack.', 7);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (48, 'https://media.example.com/project_48/asset_57.mp4', 'reel', 'Into go season play situation pick issue foreign space.', 'Your reflect official book wide animal.', 4);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (59, 'https://media.example.com/project_59/asset_58.mp4', 'reel', 'Two home night understand child season respond lawyer.', 'My condition none.', 5);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (32, 'https://media.example.com/project_32/asset_59.mp4', 'still', 'Power wrong current institution game dream because the smile cell.', 'Available girl everyone practice set.', 3);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (1, 'https://media.example.com/project_1/asset_60.mp4', 'self-tape', 'Hundred let build stage throw east.', 'Environment keep upon mother wind force.', 4);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (24, 'https://media.example.com/project_24/asset_61.mp4', 'reel', 'Why because cover board community worker behavior away condition.', 'Somebody she research near minute some.', 1);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (53, 'https://media.example.com/project_53/asset_62.mp4', 'reel', 'Military little training kind that national catch much happy.', 'Stock activity call region civil same.', 10);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (18, 'https://media.example.com/project_18/asset_63.mp4', 'still', 'Do art approach threat appear could.', 'Property eye shoulder benefit assume.', 0);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (13, 'https://media.example.com/project_13/asset_64.mp4', 'self-tape', 'Among then positive to thing energy direction international behind sense boy.', 'Let address factor center attorney.', 8);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (18, 'https://media.example.com/project_18/asset_65.mp4', 'self-tape', 'Doctor method argue appear million defense country around decade.', 'Already well side nearly.', 0);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (21, 'https://media.example.com/project_21/asset_66.mp4', 'reel', 'Sing himself large father various growth budget wait age.', 'Break study continue.', 6);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (47, 'https://media.example.com/project_47/asset_67.mp4', 'reel', 'Fill customer statement new this take anything color example.', 'Wish age more green.', 5);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (2, 'https://media.example.com/project_2/asset_68.mp4', 'reel', 'Church create subject father would perhaps represent care plant.', 'Education environmental miss practice.', 0);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (30, 'https://media.example.com/project_30/asset_69.mp4', 'still', 'Republican inside newspaper career success race worry operation.', 'Five explain civil exist.', 3);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (31, 'https://media.example.com/project_31/asset_70.mp4', 'self-tape', 'Will moment former little crime wish resource administration realize.', 'It pressure capital happen rest clear.', 4);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (53, 'https://media.example.com/project_53/asset_71.mp4', 'still', 'Against effect relate exactly safe trouble bill majority far.', 'Maybe operation once democratic.', 0);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (29, 'https://media.example.com/project_29/asset_72.mp4', 'reel', 'Capital speak near front manage knowledge expert.', 'Test along college person institution wish.', 8);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (6, 'https://media.example.com/project_6/asset_73.mp4', 'still', 'A government election eye husband ask form want wish behavior.', 'Protect science recently prevent consider.', 9);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (6, 'https://media.example.com/project_6/asset_74.mp4', 'self-tape', 'Hope line kitchen get their now reveal style significant.', 'Treat boy professional knowledge situation.', 2);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (31, 'https://media.example.com/project_31/asset_75.mp4', 'self-tape', 'Nothing available mother all wear region which.', 'Hot pull despite.', 4);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (9, 'https://media.example.com/project_9/asset_76.mp4', 'still', 'The past popular right quickly hard other region.', 'Plant though what.', 10);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (16, 'https://media.example.com/project_16/asset_77.mp4', 'self-tape', 'Method score another physical skin yourself century must usually more.', 'Only when him front people star.', 3);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (2, 'https://media.example.com/project_2/asset_78.mp4', 'self-tape', 'Police personal economy authority teacher.', 'Former whose respond billion expert back.', 7);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (23, 'https://media.example.com/project_23/asset_79.mp4', 'still', 'Until maintain suddenly painting husband response yard class water eight around.', 'Left matter newspaper night letter together.', 4);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (36, 'https://media.example.com/project_36/asset_80.mp4', 'still', 'Consider upon blue ground soon.', 'Truth its first.', 1);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (26, 'https://media.example.com/project_26/asset_81.mp4', 'reel', 'Brother dog market city interview last.', 'At world crime along.', 6);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (3, 'https://media.example.com/project_3/asset_82.mp4', 'still', 'Mean almost season hundred source behind writer family one from.', 'Draw our place nearly.', 10);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (24, 'https://media.example.com/project_24/asset_83.mp4', 'still', 'Lay wonder have spend family factor.', 'Catch company technology.', 7);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (56, 'https://media.example.com/project_56/asset_84.mp4', 'still', 'Around value building popular financial around weight candidate data every.', 'Per political Congress.', 6);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (35, 'https://media.example.com/project_35/asset_85.mp4', 'still', 'Others cultural day course her.', 'College conference young year act.', 10);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (8, 'https://media.example.com/project_8/asset_86.mp4', 'self-tape', 'Pick audience action including feel about.', 'Hotel whose painting.', 6);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (53, 'https://media.example.com/project_53/asset_87.mp4', 'self-tape', 'Mr wind everything heavy man machine.', 'Song on someone not evening.', 9);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (14, 'https://media.example.com/project_14/asset_88.mp4', 'reel', 'Sister than add party action someone expert step process again.', 'Thousand professional off people expect where.', 0);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (44, 'https://media.example.com/project_44/asset_89.mp4', 'reel', 'Subject particular very recently executive head two from.', 'Office leader serve security.', 0);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (25, 'https://media.example.com/project_25/asset_90.mp4', 'reel', 'Certain remember game always man human kitchen general tree.', 'War human another about article.', 7);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (33, 'https://media.example.com/project_33/asset_91.mp4', 'reel', 'Receive trade allow success program direction pretty along success avoid.', 'International impact institution century morning support.', 7);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (49, 'https://media.example.com/project_49/asset_92.mp4', 'reel', 'Page ok why me study newspaper.', 'Pretty parent arm.', 3);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (23, 'https://media.example.com/project_23/asset_93.mp4', 'reel', 'Coach child operation approach as guess.', 'Suddenly marriage shake half only.', 10);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (51, 'https://media.example.com/project_51/asset_94.mp4', 'self-tape', 'Personal account stand work TV fact direction agency picture.', 'Actually pay reduce trip heavy red.', 7);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (32, 'https://media.example.com/project_32/asset_95.mp4', 'reel', 'Front theory at mother break successful manage defense.', 'Issue agent number.', 1);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (11, 'https://media.example.com/project_11/asset_96.mp4', 'self-tape', 'Either news standard must near half through suddenly.', 'Step serious miss but sit station.', 5);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (50, 'https://media.example.com/project_50/asset_97.mp4', 'still', 'Human report set central country head through.', 'Provide sing last.', 2);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (1, 'https://media.example.com/project_1/asset_98.mp4', 'self-tape', 'Create become include guy scientist.', 'Future teacher example its.', 9);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (60, 'https://media.example.com/project_60/asset_99.mp4', 'self-tape', 'Scientist less finally most argue trip.', 'Senior open tax action.', 10);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (48, 'https://media.example.com/project_48/asset_100.mp4', 'still', 'Production price support home although no how card rather.', 'Wear serve door will available.', 6);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (9, 'https://media.example.com/project_9/asset_101.mp4', 'reel', 'Any born accept food tend coach sing.', 'Dog note particular nor off.', 8);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (21, 'https://media.example.com/project_21/asset_102.mp4', 'still', 'Laugh able garden many project.', 'Technology court science head outside goal.', 6);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (41, 'https://media.example.com/project_41/asset_103.mp4', 'reel', 'If source far language close.', 'Me successful beat kind member art.', 5);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (29, 'https://media.example.com/project_29/asset_104.mp4', 'reel', 'Receive discover start sing provide with camera.', 'Wife shake Congress might heavy person.', 3);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (9, 'https://media.example.com/project_9/asset_105.mp4', 'self-tape', 'Great never green live environmental behind.', 'Mention couple education.', 4);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (19, 'https://media.example.com/project_19/asset_106.mp4', 'reel', 'Media trial to subject especially though common.', 'Political so adult nation order.', 4);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (59, 'https://media.example.com/project_59/asset_107.mp4', 'self-tape', 'Help figure keep anything evidence among once number everybody.', 'So analysis speak window.', 5);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (43, 'https://media.example.com/project_43/asset_108.mp4', 'reel', 'Her expect lead fact even like they.', 'Purpose charge discuss.', 0);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (29, 'https://media.example.com/project_29/asset_109.mp4', 'still', 'Area dinner general avoid sign former yourself job.', 'Book weight treat best since table.', 5);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (52, 'https://media.example.com/project_52/asset_110.mp4', 'reel', 'Decade recognize without fight either themselves respond.', 'Catch over by.', 5);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (54, 'https://media.example.com/project_54/asset_111.mp4', 'still', 'There soldier film dog join heart.', 'General admit increase place place.', 9);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (35, 'https://media.example.com/project_35/asset_112.mp4', 'reel', 'Take outside step offer view right final bit its.', 'Market what attorney both suffer any.', 7);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (40, 'https://media.example.com/project_40/asset_113.mp4', 'reel', 'One window board provide machine quality benefit campaign.', 'Long model least cover really.', 1);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (52, 'https://media.example.com/project_52/asset_114.mp4', 'self-tape', 'Development entire society foot prepare nothing.', 'So how hour people top.', 10);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (10, 'https://media.example.com/project_10/asset_115.mp4', 'self-tape', 'Result exactly choice side guy.', 'Happen charge attack toward suffer.', 10);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (21, 'https://media.example.com/project_21/asset_116.mp4', 'still', 'Must third around president mission firm attack.', 'Let between during security.', 10);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (30, 'https://media.example.com/project_30/asset_117.mp4', 'reel', 'Against agent central note question strong certain dark involve fight.', 'Tell scene clearly field during.', 10);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (10, 'https://media.example.com/project_10/asset_118.mp4', 'self-tape', 'Score find or civil measure instead group with professor.', 'Write camera matter.', 2);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (11, 'https://media.example.com/project_11/asset_119.mp4', 'reel', 'Image side behavior which company none mean.', 'Particular indicate focus toward green west.', 6);
-INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_order) VALUES (43, 'https://media.example.com/project_43/asset_120.mp4', 'still', 'Positive well outside research race business.', 'Ask interest rich.', 0);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (46, 'https://media.example.com/project_46/asset_1.mp4', 'self-tape', 'Analysis image quite chance end.', 'Interest open current.', 524288);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (13, 'https://media.example.com/project_13/asset_2.mp4', 'reel', 'Take couple off wrong knowledge.', 'Consumer event state arrive.', 262144);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (34, 'https://media.example.com/project_34/asset_3.mp4', 'reel', 'Similar describe wrong short throughout produce newspaper buy throw.', 'Group consumer compare wrong next agree.', 458752);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (7, 'https://media.example.com/project_7/asset_4.mp4', 'self-tape', 'While machine able writer our how.', 'No international trial check.', 65536);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (9, 'https://media.example.com/project_9/asset_5.mp4', 'still', 'Health which various important traditional debate central morning market.', 'Significant measure ten first structure.', 589824);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (46, 'https://media.example.com/project_46/asset_6.mp4', 'self-tape', 'Feeling Mr more across source still.', 'Because once wonder business service population.', 0);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (54, 'https://media.example.com/project_54/asset_7.mp4', 'still', 'Energy computer imagine argue manager reflect make market determine.', 'President own out enjoy.', 655360);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (23, 'https://media.example.com/project_23/asset_8.mp4', 'self-tape', 'Share because election alone production live black.', 'Human production military.', 524288);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (19, 'https://media.example.com/project_19/asset_9.mp4', 'self-tape', 'That thing break cost call energy sound significant goal drive sell.', 'Hear under its rather age.', 589824);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (40, 'https://media.example.com/project_40/asset_10.mp4', 'still', 'Stage painting listen each pay blue least thought.', 'Key Mr case listen book own.', 524288);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (46, 'https://media.example.com/project_46/asset_11.mp4', 'reel', 'Believe not high thousand free.', 'Nearly sense lay.', 393216);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (13, 'https://media.example.com/project_13/asset_12.mp4', 'still', 'Computer couple tell special cause yard five prevent seek.', 'About century summer.', 327680);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (52, 'https://media.example.com/project_52/asset_13.mp4', 'reel', 'Many large more most interest there.', 'Collection less too magazine evening.', 458752);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (58, 'https://media.example.com/project_58/asset_14.mp4', 'self-tape', 'Line later range out tree live until cover.', 'Want stage no.', 65536);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (16, 'https://media.example.com/project_16/asset_15.mp4', 'reel', 'Body whatever phone show institution performance assume significant prepare.', 'Your still feel.', 262144);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (16, 'https://media.example.com/project_16/asset_16.mp4', 'reel', 'Husband line agency seem likely turn.', 'Kitchen wife fund brother entire despite.', 262144);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (35, 'https://media.example.com/project_35/asset_17.mp4', 'still', 'Center range compare certain land past.', 'Stage since through.', 393216);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (23, 'https://media.example.com/project_23/asset_18.mp4', 'reel', 'Marriage miss direction size threat specific believe continue.', 'Ready black produce war.', 262144);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (33, 'https://media.example.com/project_33/asset_19.mp4', 'still', 'Home form three rest spring building past ahead anything more.', 'Eight might career teach during.', 589824);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (23, 'https://media.example.com/project_23/asset_20.mp4', 'reel', 'Begin threat word song ok for treat.', 'Court notice staff rather mouth hard.', 131072);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (27, 'https://media.example.com/project_27/asset_21.mp4', 'self-tape', 'His understand choice especially and firm me.', 'Pattern order apply.', 327680);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (12, 'https://media.example.com/project_12/asset_22.mp4', 'still', 'Store money education speech staff.', 'Produce reflect carry become out.', 65536);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (2, 'https://media.example.com/project_2/asset_23.mp4', 'reel', 'Source must wide specific.', 'Because cup must.', 589824);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (50, 'https://media.example.com/project_50/asset_24.mp4', 'still', 'Much whom structure leader example.', 'Let rock left lot sing only.', 393216);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (2, 'https://media.example.com/project_2/asset_25.mp4', 'still', 'Music probably tree politics there area collection huge.', 'Night interesting quality data imagine Democrat.', 65536);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (45, 'https://media.example.com/project_45/asset_26.mp4', 'still', 'Table east building nice ever line item energy.', 'Change consider become ever while.', 655360);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (30, 'https://media.example.com/project_30/asset_27.mp4', 'self-tape', 'Girl edge level matter nothing might consider speech.', 'Care fill enter.', 393216);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (55, 'https://media.example.com/project_55/asset_28.mp4', 'self-tape', 'Science ever impact candidate toward continue day establish.', 'Impact single serve identify able whose someone.', 131072);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (35, 'https://media.example.com/project_35/asset_29.mp4', 'still', 'Cold fine heavy ask budget author about add.', 'Action quite toward occur wall.', 262144);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (35, 'https://media.example.com/project_35/asset_30.mp4', 'still', 'Amount partner hour picture here behavior simple discussion pretty.', 'Sea summer poor.', 131072);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (44, 'https://media.example.com/project_44/asset_31.mp4', 'reel', 'Safe technology ability evening staff team door poor always suddenly common.', 'Short nature lawyer clearly security store.', 458752);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (27, 'https://media.example.com/project_27/asset_32.mp4', 'reel', 'Impact leader note blood include no we also.', 'Former right and in my item.', 0);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (1, 'https://media.example.com/project_1/asset_33.mp4', 'still', 'Republican across check important performance sister keep.', 'Record those list recent discover.', 262144);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (42, 'https://media.example.com/project_42/asset_34.mp4', 'reel', 'Republican card perhaps arrive focus.', 'Purpose deal describe.', 655360);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (42, 'https://media.example.com/project_42/asset_35.mp4', 'still', 'Establish dream worker center news large learn.', 'Nice study drop.', 393216);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (8, 'https://media.example.com/project_8/asset_36.mp4', 'reel', 'Respond apply onto soon book deep soon.', 'Choose media worker.', 393216);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (13, 'https://media.example.com/project_13/asset_37.mp4', 'reel', 'Hot police real page heart act brother boy animal wrong soldier.', 'Travel then security.', 327680);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (38, 'https://media.example.com/project_38/asset_38.mp4', 'still', 'Shoulder nation huge sing we now.', 'Sit report recognize office example.', 0);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (35, 'https://media.example.com/project_35/asset_39.mp4', 'self-tape', 'Help population hot character fight high message I garden.', 'His long page save value.', 589824);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (2, 'https://media.example.com/project_2/asset_40.mp4', 'still', 'Thing factor discuss together back notice fly same draw across far.', 'Partner itself behind.', 458752);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (49, 'https://media.example.com/project_49/asset_41.mp4', 'reel', 'Tree game specific top various office everything picture man understand.', 'Play we onto design.', 327680);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (31, 'https://media.example.com/project_31/asset_42.mp4', 'self-tape', 'Professional fall family economy home seat investment exactly sense issue more.', 'Have science interest side base.', 524288);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (36, 'https://media.example.com/project_36/asset_43.mp4', 'reel', 'Sometimes win ball design well song world explain spend.', 'Low by allow might.', 327680);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (53, 'https://media.example.com/project_53/asset_44.mp4', 'reel', 'Economic someone benefit join deep a.', 'Any second other.', 262144);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (60, 'https://media.example.com/project_60/asset_45.mp4', 'still', 'Million action staff statement chance eye old sing.', 'Real group pressure huge.', 393216);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (18, 'https://media.example.com/project_18/asset_46.mp4', 'self-tape', 'Leader including sell cold approach billion well.', 'Key real upon get room simply.', 327680);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (2, 'https://media.example.com/project_2/asset_47.mp4', 'still', 'During research national thank point sound almost sit lose indeed.', 'Term send add morning growth.', 0);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (15, 'https://media.example.com/project_15/asset_48.mp4', 'reel', 'Religious style memory town like one every environmental.', 'Recent let happen.', 0);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (22, 'https://media.example.com/project_22/asset_49.mp4', 'still', 'Article Mrs any develop begin close discover.', 'Successful staff action.', 524288);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (20, 'https://media.example.com/project_20/asset_50.mp4', 'reel', 'Box other network woman western ever hold.', 'Agreement mind what trip real determine.', 327680);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (46, 'https://media.example.com/project_46/asset_51.mp4', 'still', 'Suddenly join large budget test.', 'Standard everybody worry site impact.', 589824);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (16, 'https://media.example.com/project_16/asset_52.mp4', 'self-tape', 'Pressure head walk born maybe culture city night face safe.', 'Society despite experience.', 262144);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (43, 'https://media.example.com/project_43/asset_53.mp4', 'self-tape', 'Tree purpose recent happy affect not me day hold how.', 'Remember class movement growth.', 589824);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (9, 'https://media.example.com/project_9/asset_54.mp4', 'still', 'Reality western one Republican Republican.', 'Oil lawyer they.', 458752);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (1, 'https://media.example.com/project_1/asset_55.mp4', 'self-tape', 'Conference which describe wide instead treatment forward well.', 'Know collection watch certain impact.', 131072);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (50, 'https://media.example.com/project_50/asset_56.mp4', 'self-tape', 'Paper bag not tax strategy family will until operation picture.', 'Environment point attack.', 458752);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (48, 'https://media.example.com/project_48/asset_57.mp4', 'reel', 'Into go season play situation pick issue foreign space.', 'Your reflect official book wide animal.', 262144);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (59, 'https://media.example.com/project_59/asset_58.mp4', 'reel', 'Two home night understand child season respond lawyer.', 'My condition none.', 327680);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (32, 'https://media.example.com/project_32/asset_59.mp4', 'still', 'Power wrong current institution game dream because the smile cell.', 'Available girl everyone practice set.', 196608);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (1, 'https://media.example.com/project_1/asset_60.mp4', 'self-tape', 'Hundred let build stage throw east.', 'Environment keep upon mother wind force.', 262144);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (24, 'https://media.example.com/project_24/asset_61.mp4', 'reel', 'Why because cover board community worker behavior away condition.', 'Somebody she research near minute some.', 65536);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (53, 'https://media.example.com/project_53/asset_62.mp4', 'reel', 'Military little training kind that national catch much happy.', 'Stock activity call region civil same.', 655360);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (18, 'https://media.example.com/project_18/asset_63.mp4', 'still', 'Do art approach threat appear could.', 'Property eye shoulder benefit assume.', 0);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (13, 'https://media.example.com/project_13/asset_64.mp4', 'self-tape', 'Among then positive to thing energy direction international behind sense boy.', 'Let address factor center attorney.', 524288);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (18, 'https://media.example.com/project_18/asset_65.mp4', 'self-tape', 'Doctor method argue appear million defense country around decade.', 'Already well side nearly.', 0);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (21, 'https://media.example.com/project_21/asset_66.mp4', 'reel', 'Sing himself large father various growth budget wait age.', 'Break study continue.', 393216);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (47, 'https://media.example.com/project_47/asset_67.mp4', 'reel', 'Fill customer statement new this take anything color example.', 'Wish age more green.', 327680);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (2, 'https://media.example.com/project_2/asset_68.mp4', 'reel', 'Church create subject father would perhaps represent care plant.', 'Education environmental miss practice.', 0);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (30, 'https://media.example.com/project_30/asset_69.mp4', 'still', 'Republican inside newspaper career success race worry operation.', 'Five explain civil exist.', 196608);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (31, 'https://media.example.com/project_31/asset_70.mp4', 'self-tape', 'Will moment former little crime wish resource administration realize.', 'It pressure capital happen rest clear.', 262144);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (53, 'https://media.example.com/project_53/asset_71.mp4', 'still', 'Against effect relate exactly safe trouble bill majority far.', 'Maybe operation once democratic.', 0);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (29, 'https://media.example.com/project_29/asset_72.mp4', 'reel', 'Capital speak near front manage knowledge expert.', 'Test along college person institution wish.', 524288);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (6, 'https://media.example.com/project_6/asset_73.mp4', 'still', 'A government election eye husband ask form want wish behavior.', 'Protect science recently prevent consider.', 589824);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (6, 'https://media.example.com/project_6/asset_74.mp4', 'self-tape', 'Hope line kitchen get their now reveal style significant.', 'Treat boy professional knowledge situation.', 131072);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (31, 'https://media.example.com/project_31/asset_75.mp4', 'self-tape', 'Nothing available mother all wear region which.', 'Hot pull despite.', 262144);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (9, 'https://media.example.com/project_9/asset_76.mp4', 'still', 'The past popular right quickly hard other region.', 'Plant though what.', 655360);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (16, 'https://media.example.com/project_16/asset_77.mp4', 'self-tape', 'Method score another physical skin yourself century must usually more.', 'Only when him front people star.', 196608);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (2, 'https://media.example.com/project_2/asset_78.mp4', 'self-tape', 'Police personal economy authority teacher.', 'Former whose respond billion expert back.', 458752);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (23, 'https://media.example.com/project_23/asset_79.mp4', 'still', 'Until maintain suddenly painting husband response yard class water eight around.', 'Left matter newspaper night letter together.', 262144);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (36, 'https://media.example.com/project_36/asset_80.mp4', 'still', 'Consider upon blue ground soon.', 'Truth its first.', 65536);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (26, 'https://media.example.com/project_26/asset_81.mp4', 'reel', 'Brother dog market city interview last.', 'At world crime along.', 393216);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (3, 'https://media.example.com/project_3/asset_82.mp4', 'still', 'Mean almost season hundred source behind writer family one from.', 'Draw our place nearly.', 655360);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (24, 'https://media.example.com/project_24/asset_83.mp4', 'still', 'Lay wonder have spend family factor.', 'Catch company technology.', 458752);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (56, 'https://media.example.com/project_56/asset_84.mp4', 'still', 'Around value building popular financial around weight candidate data every.', 'Per political Congress.', 393216);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (35, 'https://media.example.com/project_35/asset_85.mp4', 'still', 'Others cultural day course her.', 'College conference young year act.', 655360);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (8, 'https://media.example.com/project_8/asset_86.mp4', 'self-tape', 'Pick audience action including feel about.', 'Hotel whose painting.', 393216);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (53, 'https://media.example.com/project_53/asset_87.mp4', 'self-tape', 'Mr wind everything heavy man machine.', 'Song on someone not evening.', 589824);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (14, 'https://media.example.com/project_14/asset_88.mp4', 'reel', 'Sister than add party action someone expert step process again.', 'Thousand professional off people expect where.', 0);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (44, 'https://media.example.com/project_44/asset_89.mp4', 'reel', 'Subject particular very recently executive head two from.', 'Office leader serve security.', 0);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (25, 'https://media.example.com/project_25/asset_90.mp4', 'reel', 'Certain remember game always man human kitchen general tree.', 'War human another about article.', 458752);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (33, 'https://media.example.com/project_33/asset_91.mp4', 'reel', 'Receive trade allow success program direction pretty along success avoid.', 'International impact institution century morning support.', 458752);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (49, 'https://media.example.com/project_49/asset_92.mp4', 'reel', 'Page ok why me study newspaper.', 'Pretty parent arm.', 196608);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (23, 'https://media.example.com/project_23/asset_93.mp4', 'reel', 'Coach child operation approach as guess.', 'Suddenly marriage shake half only.', 655360);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (51, 'https://media.example.com/project_51/asset_94.mp4', 'self-tape', 'Personal account stand work TV fact direction agency picture.', 'Actually pay reduce trip heavy red.', 458752);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (32, 'https://media.example.com/project_32/asset_95.mp4', 'reel', 'Front theory at mother break successful manage defense.', 'Issue agent number.', 65536);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (11, 'https://media.example.com/project_11/asset_96.mp4', 'self-tape', 'Either news standard must near half through suddenly.', 'Step serious miss but sit station.', 327680);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (50, 'https://media.example.com/project_50/asset_97.mp4', 'still', 'Human report set central country head through.', 'Provide sing last.', 131072);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (1, 'https://media.example.com/project_1/asset_98.mp4', 'self-tape', 'Create become include guy scientist.', 'Future teacher example its.', 589824);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (60, 'https://media.example.com/project_60/asset_99.mp4', 'self-tape', 'Scientist less finally most argue trip.', 'Senior open tax action.', 655360);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (48, 'https://media.example.com/project_48/asset_100.mp4', 'still', 'Production price support home although no how card rather.', 'Wear serve door will available.', 393216);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (9, 'https://media.example.com/project_9/asset_101.mp4', 'reel', 'Any born accept food tend coach sing.', 'Dog note particular nor off.', 524288);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (21, 'https://media.example.com/project_21/asset_102.mp4', 'still', 'Laugh able garden many project.', 'Technology court science head outside goal.', 393216);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (41, 'https://media.example.com/project_41/asset_103.mp4', 'reel', 'If source far language close.', 'Me successful beat kind member art.', 327680);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (29, 'https://media.example.com/project_29/asset_104.mp4', 'reel', 'Receive discover start sing provide with camera.', 'Wife shake Congress might heavy person.', 196608);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (9, 'https://media.example.com/project_9/asset_105.mp4', 'self-tape', 'Great never green live environmental behind.', 'Mention couple education.', 262144);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (19, 'https://media.example.com/project_19/asset_106.mp4', 'reel', 'Media trial to subject especially though common.', 'Political so adult nation order.', 262144);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (59, 'https://media.example.com/project_59/asset_107.mp4', 'self-tape', 'Help figure keep anything evidence among once number everybody.', 'So analysis speak window.', 327680);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (43, 'https://media.example.com/project_43/asset_108.mp4', 'reel', 'Her expect lead fact even like they.', 'Purpose charge discuss.', 0);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (29, 'https://media.example.com/project_29/asset_109.mp4', 'still', 'Area dinner general avoid sign former yourself job.', 'Book weight treat best since table.', 327680);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (52, 'https://media.example.com/project_52/asset_110.mp4', 'reel', 'Decade recognize without fight either themselves respond.', 'Catch over by.', 327680);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (54, 'https://media.example.com/project_54/asset_111.mp4', 'still', 'There soldier film dog join heart.', 'General admit increase place place.', 589824);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (35, 'https://media.example.com/project_35/asset_112.mp4', 'reel', 'Take outside step offer view right final bit its.', 'Market what attorney both suffer any.', 458752);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (40, 'https://media.example.com/project_40/asset_113.mp4', 'reel', 'One window board provide machine quality benefit campaign.', 'Long model least cover really.', 65536);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (52, 'https://media.example.com/project_52/asset_114.mp4', 'self-tape', 'Development entire society foot prepare nothing.', 'So how hour people top.', 655360);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (10, 'https://media.example.com/project_10/asset_115.mp4', 'self-tape', 'Result exactly choice side guy.', 'Happen charge attack toward suffer.', 655360);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (21, 'https://media.example.com/project_21/asset_116.mp4', 'still', 'Must third around president mission firm attack.', 'Let between during security.', 655360);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (30, 'https://media.example.com/project_30/asset_117.mp4', 'reel', 'Against agent central note question strong certain dark involve fight.', 'Tell scene clearly field during.', 655360);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (10, 'https://media.example.com/project_10/asset_118.mp4', 'self-tape', 'Score find or civil measure instead group with professor.', 'Write camera matter.', 131072);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (11, 'https://media.example.com/project_11/asset_119.mp4', 'reel', 'Image side behavior which company none mean.', 'Particular indicate focus toward green west.', 393216);
+INSERT INTO ProjectMedia (project_id, media_url, media_type, caption, alt_text, sort_key) VALUES (43, 'https://media.example.com/project_43/asset_120.mp4', 'still', 'Positive well outside research race business.', 'Ask interest rich.', 0);
 
 -- TREND TAGS --------------------------------------------
 INSERT INTO TrendTags (tag_name, description, usage_count, status) VALUES ('Moody Cinematic', 'Positive morning middle similar trial goal enter perform partner manager.', 330, 'active');
@@ -1022,11 +1022,9 @@ INSERT INTO PostInteractions (post_id, user_id, interaction_type, comment_text)
 INSERT INTO PostInteractions (post_id, user_id, interaction_type, comment_text) VALUES (45, 19, 'like', NULL);
 INSERT INTO PostInteractions (post_id, user_id, interaction_type, comment_text) VALUES (14, 32, 'like', NULL);
 INSERT INTO PostInteractions (post_id, user_id, interaction_type, comment_text) VALUES (40, 12, 'comment', 'Almost a church against great those their trip method.');
-INSERT INTO PostInteractions (post_id, user_id, interaction_type, comment_text) VALUES (78, 30, 'like', NULL);
 INSERT INTO PostInteractions (post_id, user_id, interaction_type, comment_text) VALUES (23, 4, 'like', NULL);
 INSERT INTO PostInteractions (post_id, user_id, interaction_type, comment_text) VALUES (77, 5, 'comment', 'Young teacher situation night onto speak recognize.');
 INSERT INTO PostInteractions (post_id, user_id, interaction_type, comment_text) VALUES (63, 15, 'like', NULL);
-INSERT INTO PostInteractions (post_id, user_id, interaction_type, comment_text) VALUES (43, 23, 'like', NULL);
 INSERT INTO PostInteractions (post_id, user_id, interaction_type, comment_text) VALUES (72, 21, 'like', NULL);
 INSERT INTO PostInteractions (post_id, user_id, interaction_type, comment_text) VALUES (29, 15, 'comment', 'Night cultural eat per position remain economy kitchen success worker.');
 INSERT INTO PostInteractions (post_id, user_id, interaction_type, comment_text) VALUES (69, 10, 'comment', 'Well over leg student fire play stock cultural mother because summer.');
@@ -1230,3 +1228,61 @@ INSERT INTO Alerts (alert_type, message, related_type, related_id, status, admin
 INSERT INTO Alerts (alert_type, message, related_type, related_id, status, admin_notes) VALUES ('moderation', 'Hair skin interview this true wife dark usually will seat.', 'message', 68, 'resolved', 'Much board outside often born huge baby everything piece.');
 
 -- END MOCK DATA ----------------------------------------
+
+-- DERIVED DATA (computed from the mock rows above) -----
+
+-- Unread-message counters for the seeded messages
+INSERT INTO MessageCounters (user_id, unread_count)
+SELECT receiver_id, COUNT(*)
+FROM Messages
+WHERE is_read = FALSE AND is_deleted_by_receiver = FALSE
+GROUP BY receiver_id;
+
+-- Momentum scores start from the seeded credit_momentum values; the
+-- recompute-momentum job replaces them with scores derived from activity
+INSERT INTO CreatorMomentum (user_id, score)
+SELECT user_id, credit_momentum
+FROM Users
+WHERE credit_momentum > 0;
+
+-- Credit stats for every credited user; the credit routes keep them
+-- current and the rebuild-credit-stats job recomputes them
+INSERT INTO CreditStats (user_id, total_credits, verified_credits, projects, collaborators)
+SELECT c.user_id,
+       COUNT(*),
+       SUM(c.verified),
+       COUNT(DISTINCT c.project_id),
+       (SELECT COUNT(DISTINCT other.user_id)
+        FROM ProjectCredits mine
+        JOIN ProjectCredits other
+          ON other.project_id = mine.project_id
+         AND other.user_id <> mine.user_id
+        WHERE mine.user_id = c.user_id)
+FROM ProjectCredits c
+GROUP BY c.user_id;
+
+-- Tag usage for the seeded posts and projects; the post/project routes
+-- keep it current and the recount-tag-usage job recomputes it
+INSERT INTO TagUsage (tag_key, slot, post_count, project_count)
+SELECT tag_key, 0, SUM(source = 'post'), SUM(source = 'project')
+FROM (
+    SELECT DISTINCT 'post' AS source, p.post_id AS row_id,
+           LEFT(LOWER(TRIM(j.tag)), 100) AS tag_key
+    FROM Posts p
+    JOIN JSON_TABLE(
+        CONCAT('["', REPLACE(p.tags, ',', '","'), '"]'),
+        '$[*]' COLUMNS (tag VARCHAR(255) PATH '$')
+    ) j
+    WHERE p.is_deleted = FALSE AND p.tags IS NOT NULL
+    UNION ALL
+    SELECT DISTINCT 'project', pr.project_id,
+           LEFT(LOWER(TRIM(j.tag)), 100)
+    FROM Projects pr
+    JOIN JSON_TABLE(
+        CONCAT('["', REPLACE(pr.tags, ',', '","'), '"]'),
+        '$[*]' COLUMNS (tag VARCHAR(255) PATH '$')
+    ) j
+    WHERE pr.is_archived = FALSE AND pr.tags IS NOT NULL
+) AS seeded
+WHERE tag_key <> ''
+GROUP BY tag_key;